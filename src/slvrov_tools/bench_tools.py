@@ -0,0 +1,245 @@
+# SLVROV Oct 2026
+
+import itertools
+import json
+import platform
+import socket
+import struct
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter_ns, time
+from .network_tools import UDP_Communicator
+
+bench_timestamp = struct.Struct("!Q")  # perf_counter_ns() at send, at the start of every benchmark packet
+
+
+@dataclass
+class Loopback_Bench_Config:
+    """One point in the loopback benchmark matrix.
+
+    Attributes:
+        buffer_size (int): ``buffer_size`` passed to ``recieve_all``.
+        packet_size (int): Size of each benchmark packet in bytes (at least 8, for the timestamp).
+        threaded (bool): ``threaded`` passed to ``recieve_all``.
+        max_threads (int): ``max_threads`` of the receiving communicator.
+    """
+
+    buffer_size: int
+    packet_size: int
+    threaded: bool
+    max_threads: int
+
+    def key(self) -> str:
+        """Return a stable name used to match results between runs."""
+
+        return f"buffer={self.buffer_size} packet={self.packet_size} threaded={self.threaded} threads={self.max_threads}"
+
+
+def _percentile_us(ordered_ns: list[int], percent: float) -> float:
+    """Return a nearest-rank percentile of sorted nanosecond samples, in microseconds.
+
+    Args:
+        ordered_ns (list[int]): Sorted samples in nanoseconds.
+        percent (float): Percentile, 0 - 100.
+
+    Returns:
+        float: The percentile in microseconds, or 0.0 with no samples.
+    """
+
+    if not ordered_ns: return 0.0
+    return ordered_ns[min(len(ordered_ns) - 1, int(round(percent / 100 * (len(ordered_ns) - 1))))] / 1000
+
+
+def run_loopback_bench(config: Loopback_Bench_Config, packets: int=20_000, IP: str="127.0.0.1", timeout: float=1.0) -> dict:
+    """Measure one configuration by sending packets to a UDP_Communicator over loopback.
+
+    A sender thread sends ``packets`` datagrams as fast as it can, each stamped with ``perf_counter_ns``. The
+    receiving communicator runs ``recieve_all`` with the configured options, and its handler records the time from
+    send to handler start. Packets the kernel drops are reported (sent vs recieved) rather than waited for, and
+    throughput is timed up to the last handled packet.
+
+    Args:
+        config (Loopback_Bench_Config): The configuration to measure.
+        packets (int): Number of packets to send.
+        IP (str): Loopback address to use.
+        timeout (float): Seconds of silence after which the receiver gives up on dropped packets.
+
+    Returns:
+        dict: The config fields plus sent, recieved, handled, seconds, packets_per_second and
+        latency_p50_us/latency_p99_us/latency_max_us.
+    """
+
+    if config.packet_size < bench_timestamp.size: raise Exception(f"packet_size must be at least {bench_timestamp.size}")
+
+    latencies = []
+    last_arrival = [0]
+    handled_lock = threading.Lock()
+
+    def handler(data, address):
+        arrival = perf_counter_ns()
+        (sent_at,) = bench_timestamp.unpack_from(data)
+
+        with handled_lock:
+            latencies.append(arrival - sent_at)
+            if arrival > last_arrival[0]: last_arrival[0] = arrival
+
+    receiver = UDP_Communicator(IP, 0, packet_handler=handler, max_threads=config.max_threads)
+    port = receiver.socket.getsockname()[1]
+    receiver.socket.settimeout(timeout)
+
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    padding = bytes(config.packet_size - bench_timestamp.size)
+
+    def send_all():
+        for _ in range(packets): sender.sendto(bench_timestamp.pack(perf_counter_ns()) + padding, (IP, port))
+
+    sending = threading.Thread(target=send_all, daemon=True)
+
+    start = perf_counter_ns()
+    sending.start()
+
+    try: receiver.recieve_all(count=packets, buffer_size=config.buffer_size, threaded=config.threaded)
+    except socket.timeout: pass  # the rest were dropped by the kernel
+
+    sending.join()
+
+    # Lets threaded handlers finish (a handler that raised just counts as unhandled) before reading the results
+    receiver.executor.shutdown(wait=True)
+
+    # Timed up to the last handled packet, so waiting out dropped packets doesn't count against throughput
+    seconds = max(0, last_arrival[0] - start) / 1e9
+
+    receiver.close()
+    sender.close()
+
+    ordered = sorted(latencies)
+
+    return {
+        **asdict(config),
+        "key": config.key(),
+        "sent": packets,
+        "recieved": receiver.recieved_count,
+        "handled": len(ordered),
+        "seconds": seconds,
+        "packets_per_second": len(ordered) / seconds if seconds else 0.0,
+        "latency_p50_us": _percentile_us(ordered, 50),
+        "latency_p99_us": _percentile_us(ordered, 99),
+        "latency_max_us": ordered[-1] / 1000 if ordered else 0.0,
+    }
+
+
+def loopback_bench_matrix(buffer_sizes: list[int], packet_sizes: list[int], max_threads: list[int],
+                          threaded: tuple[bool, ...]=(False, True)) -> list[Loopback_Bench_Config]:
+    """Build the benchmark matrix. Unthreaded runs ignore ``max_threads`` and appear once per size pair.
+
+    Args:
+        buffer_sizes (list[int]): Receive buffer sizes to try.
+        packet_sizes (list[int]): Packet sizes to try. Sizes larger than the buffer size are skipped.
+        max_threads (list[int]): Handler thread counts to try for threaded runs.
+        threaded (tuple[bool, ...]): Threaded modes to try.
+
+    Returns:
+        list[Loopback_Bench_Config]: The configurations to run.
+    """
+
+    configs = []
+
+    for buffer_size, packet_size, is_threaded in itertools.product(buffer_sizes, packet_sizes, threaded):
+        if packet_size > buffer_size: continue
+
+        if is_threaded: configs.extend(Loopback_Bench_Config(buffer_size, packet_size, True, threads) for threads in max_threads)
+        else: configs.append(Loopback_Bench_Config(buffer_size, packet_size, False, 1))
+
+    return configs
+
+
+def run_loopback_suite(configs: list[Loopback_Bench_Config], packets: int=20_000, repeats: int=3) -> dict:
+    """Run every configuration, keeping the best of ``repeats`` runs to reduce scheduler noise.
+
+    Args:
+        configs (list[Loopback_Bench_Config]): Configurations to run.
+        packets (int): Packets per run.
+        repeats (int): Runs per configuration.
+
+    Returns:
+        dict: ``{"meta": {...}, "results": [...]}``, ready to be written with `write_bench_results`.
+    """
+
+    results = []
+
+    for config in configs:
+        runs = [run_loopback_bench(config, packets) for _ in range(repeats)]
+        results.append(max(runs, key=lambda run: run["packets_per_second"]))
+
+    return {
+        "meta": {
+            "time": time(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "node": platform.node(),
+            "packets": packets,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def write_bench_results(results: dict, path: str | Path) -> None:
+    """Write benchmark results as JSON.
+
+    Args:
+        results (dict): Output of `run_loopback_suite`.
+        path (str | Path): Destination file.
+    """
+
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def read_bench_results(path: str | Path) -> dict:
+    """Read benchmark results written by `write_bench_results`.
+
+    Args:
+        path (str | Path): Results file.
+
+    Returns:
+        dict: The results.
+    """
+
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def find_regressions(baseline: dict, current: dict, threshold: float=0.1) -> list[dict]:
+    """Compare two result sets and list configurations whose throughput dropped by more than ``threshold``.
+
+    Configurations present in only one of the result sets are ignored.
+
+    Args:
+        baseline (dict): Earlier results.
+        current (dict): New results.
+        threshold (float): Allowed fractional throughput drop, e.g. 0.1 for 10%.
+
+    Returns:
+        list[dict]: One entry per regression with the key, both throughputs and the fractional change.
+    """
+
+    baseline_by_key = {result["key"]: result for result in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        before = baseline_by_key.get(result["key"])
+        if before is None or not before["packets_per_second"]: continue
+
+        change = result["packets_per_second"] / before["packets_per_second"] - 1
+        if change < -threshold:
+            regressions.append({
+                "key": result["key"],
+                "baseline_packets_per_second": before["packets_per_second"],
+                "packets_per_second": result["packets_per_second"],
+                "change": change,
+            })
+
+    return regressions
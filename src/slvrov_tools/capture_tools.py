@@ -0,0 +1,260 @@
+# SLVROV Oct 2026
+
+import mmap
+import socket
+import struct
+import threading
+from pathlib import Path
+from time import perf_counter, sleep, time_ns
+from typing import Callable, Iterator
+from .misc_tools import at_exit
+from .network_tools import Network_Communicator
+
+CAPTURE_MAGIC = b"SLVCAP1\0"
+capture_record_header = struct.Struct("<Q4sHI")  # wall clock ns, IPv4 address, port, payload length
+
+
+class Packet_Capture:
+    """
+    Append-only capture file of recieved packets. Each record is an 18 byte header (wall clock time in ns, source
+    IPv4 address and port, payload length) followed by the payload.
+
+    Attributes:
+        path (Path): Capture file path.
+        file (BufferedWriter | None): Open capture file, None once closed.
+        record_count (int): Records written since opening.
+
+    Key Methods:
+        record(data, address=None, timestamp_ns=None) -> None: Appends one packet.
+        flush() -> None: Pushes buffered records to the file.
+        close() -> None: Flushes and closes the file.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Opens a capture file for appending, writing the file header if the file is new or empty.
+
+        Args:
+            path (str | Path): Capture file path.
+
+        Raises:
+            Exception: If the file exists but is not a capture file.
+        """
+
+        self.path = Path(path)
+
+        if self.path.exists() and self.path.stat().st_size:
+            with open(self.path, "rb") as existing:
+                if existing.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC: raise Exception(f"{self.path} is not a packet capture file")
+
+        self.file = open(self.path, "ab")
+        if self.file.tell() == 0: self.file.write(CAPTURE_MAGIC)
+
+        self.record_count = 0
+        self._lock = threading.Lock()
+
+        at_exit(self.close)
+
+    def record(self, data: bytes | bytearray | memoryview, address: tuple | None=None, timestamp_ns: int | None=None) -> None:
+        """
+        Appends one packet. Safe to call from several handler threads. Does nothing once the capture is closed.
+
+        Args:
+            data (bytes | bytearray | memoryview): The packet payload.
+            address (tuple | None, optional): Source (IP, port). Recorded as 0.0.0.0:0 if None.
+            timestamp_ns (int | None, optional): Arrival time in ns since the epoch. Defaults to now.
+        """
+
+        if timestamp_ns is None: timestamp_ns = time_ns()
+
+        if address is None: packed_ip, port = bytes(4), 0
+        else: packed_ip, port = socket.inet_aton(address[0]), address[1]
+
+        header = capture_record_header.pack(timestamp_ns, packed_ip, port, len(data))
+
+        with self._lock:
+            if self.file is None: return
+
+            self.file.write(header)
+            self.file.write(data)
+            self.record_count += 1
+
+    def flush(self) -> None:
+        """Pushes buffered records to the file."""
+
+        with self._lock:
+            if self.file is not None: self.file.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the capture file."""
+
+        with self._lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+def capture_communicator(communicator: Network_Communicator, path: str | Path) -> Packet_Capture:
+    """
+    Records everything a communicator recieves, as its `recieve_observer`. Packets are recorded on the recieving
+    thread as they arrive, so records stay in arrival order and carry arrival times even when handlers run on
+    threads. Works with every recieve style, including the batched (one list argument) and timestamped (kernel
+    arrival time recorded) ones; other records are stamped when the recieve loop took the packet off the socket.
+    Under recieve_from the connected peer is recorded as the source.
+
+    Args:
+        communicator (Network_Communicator): Communicator to capture.
+        path (str | Path): Capture file path. Appended to if it exists.
+
+    Returns:
+        Packet_Capture: The open capture. It is closed at exit, or close it sooner (the communicator keeps calling
+        the observer until its recieve_observer is replaced).
+    """
+
+    capture = Packet_Capture(path)
+
+    def record_packet(data, *extra):
+        peer = (communicator.to_IP, communicator.to_port) if communicator.to_IP is not None else None
+
+        if isinstance(data, list):  # batched: (data, address) pairs from recieve_all, bare payloads from recieve_from
+            for packet in data:
+                if isinstance(packet, tuple): capture.record(*packet)
+                else: capture.record(packet, peer)
+
+        else:
+            address = extra[0] if extra and isinstance(extra[0], tuple) else peer
+            timestamp_ns = extra[-1] if extra and not isinstance(extra[-1], tuple) else None  # timestamped recieves
+
+            capture.record(data, address, timestamp_ns)
+
+    communicator.recieve_observer = record_packet
+    return capture
+
+
+class Capture_Reader:
+    """
+    Memory-mapped reader for Packet_Capture files. Payloads are handed out as memoryviews into the mapping, so
+    reading a capture does not copy packet data.
+
+    Attributes:
+        path (Path): Capture file path.
+        mapping (mmap.mmap | None): Read-only map of the file, None once closed or if the capture is empty.
+
+    Key Methods:
+        __iter__() -> Iterator[tuple[int, tuple, memoryview]]: Yields (timestamp_ns, address, payload) per record.
+        close() -> None: Unmaps the file.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Maps a capture file.
+
+        Args:
+            path (str | Path): Capture file path.
+
+        Raises:
+            Exception: If the file is not a capture file.
+        """
+
+        self.path = Path(path)
+
+        with open(self.path, "rb") as file:
+            if file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC: raise Exception(f"{self.path} is not a packet capture file")
+
+            size = self.path.stat().st_size
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size > len(CAPTURE_MAGIC) else None
+
+    def __iter__(self) -> Iterator[tuple[int, tuple, memoryview]]:
+        """
+        Yields every complete record. A record truncated by a crash while capturing ends iteration.
+
+        Returns:
+            Iterator[tuple[int, tuple, memoryview]]: (timestamp_ns, (IP, port), payload). Each payload is released
+            when the iterator advances, so copy it (bytes(payload)) to keep it.
+        """
+
+        if self.mapping is None: return
+
+        view = memoryview(self.mapping)
+        offset = len(CAPTURE_MAGIC)
+        end = len(self.mapping)
+        header_size = capture_record_header.size
+
+        try:
+            while offset + header_size <= end:
+                timestamp_ns, packed_ip, port, length = capture_record_header.unpack_from(self.mapping, offset)
+                offset += header_size
+                if offset + length > end: break
+
+                payload = view[offset:offset + length]
+                offset += length
+
+                try: yield timestamp_ns, (socket.inet_ntoa(packed_ip), port), payload
+                finally: payload.release()
+        finally:
+            view.release()
+
+    def close(self) -> None:
+        """Unmaps the capture file."""
+
+        if self.mapping is not None:
+            self.mapping.close()
+            self.mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def replay_capture(path: str | Path, packet_handler: Callable, speed: float | None=None, with_address: bool=True) -> dict:
+    """
+    Feeds a capture file to a packet handler, either as fast as possible or at (a multiple of) the original timing.\n
+    NOTE: The handler gets memoryview payloads that are only valid until it returns, like recieve_all_into
+
+    Args:
+        path (str | Path): Capture file path.
+        packet_handler (Callable): Handler to call with (data, address), or (data) if with_address is False.
+        speed (float | None, optional): None (default) replays as fast as possible. 1.0 keeps the original gaps
+            between packets, 2.0 halves them, and so on.
+        with_address (bool, optional): Pass the recorded source address to the handler. Defaults to True.
+
+    Returns:
+        dict: "packets", "bytes", "seconds" (wall time spent) and "packets_per_second".
+    """
+
+    packets = 0
+    nbytes = 0
+
+    with Capture_Reader(path) as reader:
+        start = perf_counter()
+        first_timestamp = None
+
+        records = iter(reader)
+
+        try:
+            for timestamp_ns, address, payload in records:
+                if speed is not None:
+                    if first_timestamp is None: first_timestamp = timestamp_ns
+
+                    due = start + (timestamp_ns - first_timestamp) / 1e9 / speed
+                    wait = due - perf_counter()
+                    if wait > 0: sleep(wait)
+
+                packets += 1
+                nbytes += len(payload)
+
+                if with_address: packet_handler(payload, address)
+                else: packet_handler(payload)
+        finally:
+            records.close()  # releases the last payload view so the mapping can be closed
+
+        seconds = perf_counter() - start
+
+    return {
+        "packets": packets,
+        "bytes": nbytes,
+        "seconds": seconds,
+        "packets_per_second": packets / seconds if seconds else 0.0,
+    }
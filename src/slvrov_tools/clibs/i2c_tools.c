@@ -1,5 +1,7 @@
+#include <errno.h>
 #include <stdio.h>
 #include <stdint.h>
+#include <string.h>
 #include <unistd.h>
 #include <fcntl.h>
 #include <sys/ioctl.h>
@@ -83,3 +85,90 @@ int i2c_write_byte(int bus, uint8_t slave_addr, uint8_t register_addr, uint8_t v
 
     return 0;
 }
+
+
+int i2c_write_block(int bus, uint8_t slave_addr, uint8_t register_addr, const uint8_t *values, uint16_t length) {
+    uint8_t buffer[I2C_BLOCK_MAX_LEN];
+
+    /*
+    Devices that auto-increment their register pointer (like the PCA9685 with MODE1 AI set) take the first register
+    followed by any number of values in one message, so a whole block costs a single bus transaction.
+    */
+
+    // The register address takes the first byte of the message
+    if (length > I2C_BLOCK_MAX_LEN - 1) return -1;
+
+    buffer[0] = register_addr;
+    memcpy(buffer + 1, values, length);
+
+    struct i2c_msg msg;
+    msg.addr = slave_addr;
+    msg.flags = 0;
+    msg.len = length + 1;
+    msg.buf = buffer;
+
+    struct i2c_rdwr_ioctl_data write_msg = {
+        .msgs  = &msg,
+        .nmsgs = 1
+    };
+
+    if (ioctl(bus, I2C_RDWR, &write_msg) < 0) {
+        int error = errno;  // perror may clobber errno the first time it touches stderr
+        perror("Failed to write block to I2C device");
+        errno = error;
+        return -1;
+    }
+
+    return 0;
+}
+
+
+int i2c_read_block(int bus, uint8_t slave_addr, uint8_t register_addr, uint8_t *values, uint16_t length) {
+    uint8_t local_register_addr = register_addr;
+
+    // Same two messages as i2c_read_byte, but the read continues through the following registers
+    struct i2c_msg msgs[2];
+
+    msgs[0].addr  = slave_addr;
+    msgs[0].flags = 0;
+    msgs[0].len   = 1;
+    msgs[0].buf   = &local_register_addr;
+
+    msgs[1].addr  = slave_addr;
+    msgs[1].flags = I2C_M_RD;
+    msgs[1].len   = length;
+    msgs[1].buf   = values;
+
+    struct i2c_rdwr_ioctl_data read_msgs = {
+        .msgs  = msgs,
+        .nmsgs = 2
+    };
+
+    if (ioctl(bus, I2C_RDWR, &read_msgs) < 0) {
+        int error = errno;  // perror may clobber errno the first time it touches stderr
+        perror("Failed to read block from I2C device");
+        errno = error;
+        return -1;
+    }
+
+    return 0;
+}
+
+
+int i2c_transfer(int bus, struct i2c_msg *msgs, unsigned int count) {
+    struct i2c_rdwr_ioctl_data transfer = {
+        .msgs  = msgs,
+        .nmsgs = count
+    };
+
+    // The kernel runs the messages back to back with repeated starts, and returns how many it completed
+    int completed = ioctl(bus, I2C_RDWR, &transfer);
+    if (completed < 0) {
+        int error = errno;  // perror may clobber errno the first time it touches stderr
+        perror("Failed to transfer I2C messages");
+        errno = error;
+        return -1;
+    }
+
+    return completed;
+}
@@ -2,9 +2,17 @@
 #define I2C_TOOLS_H
 
 #include <stdint.h>
+#include <linux/i2c.h>
+
+// The kernel's limits for one I2C_RDWR ioctl
+#define I2C_BLOCK_MAX_LEN 8192
+#define I2C_TRANSFER_MAX_MSGS 42
 
 int i2c_open_bus(const char *bus_path);
 int i2c_read_byte(int bus, uint8_t slave_addr, uint8_t register_addr);
 int i2c_write_byte(int bus, uint8_t slave_addr, uint8_t register_addr, uint8_t value);
+int i2c_write_block(int bus, uint8_t slave_addr, uint8_t register_addr, const uint8_t *values, uint16_t length);
+int i2c_read_block(int bus, uint8_t slave_addr, uint8_t register_addr, uint8_t *values, uint16_t length);
+int i2c_transfer(int bus, struct i2c_msg *msgs, unsigned int count);
 
 #endif // I2C_TOOLS_H
\ No newline at end of file
@@ -4,6 +4,7 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <unistd.h>
+#include <linux/i2c.h>
 #include "i2c_tools.h"
 
 
@@ -67,6 +68,130 @@ static PyObject* py_i2c_write_byte(PyObject* self, PyObject* args) {
 }
 
 
+static PyObject* py_i2c_write_block(PyObject* self, PyObject* args) {
+    int bus;
+    uint8_t slave_addr, register_addr;
+    Py_buffer values;
+
+    if (!PyArg_ParseTuple(args, "iBBy*", &bus, &slave_addr, &register_addr, &values)) {
+        return NULL;
+    }
+
+    if (values.len > I2C_BLOCK_MAX_LEN - 1) {
+        PyBuffer_Release(&values);
+        PyErr_Format(PyExc_ValueError, "Block too long. At most %d bytes per write", I2C_BLOCK_MAX_LEN - 1);
+        return NULL;
+    }
+
+    int rtn;
+    Py_BEGIN_ALLOW_THREADS
+    rtn = i2c_write_block(bus, slave_addr, register_addr, values.buf, (uint16_t) values.len);
+    Py_END_ALLOW_THREADS
+
+    if (rtn < 0) PyErr_SetFromErrno(PyExc_OSError);  // Error already printed by i2c_write_block; read errno before releasing
+
+    PyBuffer_Release(&values);
+
+    if (rtn < 0) return NULL;
+    Py_RETURN_NONE;
+}
+
+
+static PyObject* py_i2c_read_block(PyObject* self, PyObject* args) {
+    int bus;
+    uint8_t slave_addr, register_addr;
+    Py_ssize_t length;
+
+    if (!PyArg_ParseTuple(args, "iBBn", &bus, &slave_addr, &register_addr, &length)) {
+        return NULL;
+    }
+
+    if (length <= 0 || length > I2C_BLOCK_MAX_LEN) {
+        PyErr_Format(PyExc_ValueError, "Block length must be between 1 and %d bytes", I2C_BLOCK_MAX_LEN);
+        return NULL;
+    }
+
+    PyObject* values = PyBytes_FromStringAndSize(NULL, length);
+    if (values == NULL) return NULL;
+
+    int rtn;
+    uint8_t* buffer = (uint8_t*) PyBytes_AS_STRING(values);
+    Py_BEGIN_ALLOW_THREADS
+    rtn = i2c_read_block(bus, slave_addr, register_addr, buffer, (uint16_t) length);
+    Py_END_ALLOW_THREADS
+
+    if (rtn < 0) {
+        Py_DECREF(values);
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL; // Error already printed by i2c_read_block
+    }
+
+    return values;
+}
+
+
+static PyObject* py_i2c_transfer(PyObject* self, PyObject* args) {
+    int bus;
+    PyObject* messages;
+
+    if (!PyArg_ParseTuple(args, "iO", &bus, &messages)) {
+        return NULL;
+    }
+
+    PyObject* sequence = PySequence_Fast(messages, "messages must be a sequence of (address, flags, buffer) tuples");
+    if (sequence == NULL) return NULL;
+
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(sequence);
+    if (count == 0 || count > I2C_TRANSFER_MAX_MSGS) {
+        Py_DECREF(sequence);
+        PyErr_Format(PyExc_ValueError, "Between 1 and %d messages can be transferred at once", I2C_TRANSFER_MAX_MSGS);
+        return NULL;
+    }
+
+    struct i2c_msg msgs[I2C_TRANSFER_MAX_MSGS];
+    Py_buffer views[I2C_TRANSFER_MAX_MSGS];
+
+    // Borrow every message's buffer: writes are sent straight from it and reads land straight in it
+    Py_ssize_t acquired = 0;
+    for (; acquired < count; acquired++) {
+        PyObject* item = PySequence_Fast_GET_ITEM(sequence, acquired);
+        PyObject* buffer;
+        unsigned short address, flags;
+
+        if (!PyArg_ParseTuple(item, "HHO;each message must be an (address, flags, buffer) tuple", &address, &flags, &buffer)) break;
+
+        int buffer_flags = (flags & I2C_M_RD) ? PyBUF_WRITABLE : PyBUF_SIMPLE;
+        if (PyObject_GetBuffer(buffer, &views[acquired], buffer_flags) < 0) break;
+
+        if (views[acquired].len > I2C_BLOCK_MAX_LEN) {
+            PyBuffer_Release(&views[acquired]);
+            PyErr_Format(PyExc_ValueError, "Message %zd too long. At most %d bytes per message", acquired, I2C_BLOCK_MAX_LEN);
+            break;
+        }
+
+        msgs[acquired].addr  = address;
+        msgs[acquired].flags = flags;
+        msgs[acquired].len   = (uint16_t) views[acquired].len;
+        msgs[acquired].buf   = views[acquired].buf;
+    }
+
+    int completed = -1;
+    if (acquired == count) {
+        Py_BEGIN_ALLOW_THREADS
+        completed = i2c_transfer(bus, msgs, (unsigned int) count);
+        Py_END_ALLOW_THREADS
+
+        if (completed < 0) PyErr_SetFromErrno(PyExc_OSError);  // Error already printed by i2c_transfer
+    }
+
+    for (Py_ssize_t i = 0; i < acquired; i++) PyBuffer_Release(&views[i]);
+    Py_DECREF(sequence);
+
+    if (completed < 0) return NULL;
+    return PyLong_FromLong(completed);
+}
+
+
 static PyObject* py_close_bus(PyObject* self, PyObject* args) {
     int bus;
     if (!PyArg_ParseTuple(args, "i", &bus)) {
@@ -86,6 +211,9 @@ static PyMethodDef pi2c_tools_methods[] = {
     {"i2c_open_bus", py_i2c_open_bus, METH_VARARGS, "Open an I2C bus and return its file descriptor."},
     {"i2c_read_byte", py_i2c_read_byte, METH_VARARGS, "Read a byte from a specified register of an I2C device."},
     {"i2c_write_byte", py_i2c_write_byte, METH_VARARGS, "Write a byte to a specified register of an I2C device."},
+    {"i2c_write_block", py_i2c_write_block, METH_VARARGS, "Write consecutive registers of an I2C device in one transaction."},
+    {"i2c_read_block", py_i2c_read_block, METH_VARARGS, "Read consecutive registers of an I2C device in one transaction."},
+    {"i2c_transfer", py_i2c_transfer, METH_VARARGS, "Run a sequence of (address, flags, buffer) I2C messages in one ioctl."},
     {"i2c_close_bus", py_close_bus, METH_VARARGS, "Close an I2C bus."},
     {NULL, NULL, 0, NULL} // Sentinel
 };
@@ -101,5 +229,15 @@ static struct PyModuleDef moduledef = {
 
 
 PyMODINIT_FUNC PyInit_pi2c_tools(void) {
-    return PyModule_Create(&moduledef);
+    PyObject* module = PyModule_Create(&moduledef);
+    if (module == NULL) return NULL;
+
+    if (PyModule_AddIntConstant(module, "I2C_M_RD", I2C_M_RD) < 0 ||
+        PyModule_AddIntConstant(module, "I2C_TRANSFER_MAX_MSGS", I2C_TRANSFER_MAX_MSGS) < 0 ||
+        PyModule_AddIntConstant(module, "I2C_BLOCK_MAX_LEN", I2C_BLOCK_MAX_LEN) < 0) {
+        Py_DECREF(module);
+        return NULL;
+    }
+
+    return module;
 }
\ No newline at end of file
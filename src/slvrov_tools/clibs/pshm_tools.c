@@ -0,0 +1,85 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include "shm_tools.h"
+
+
+// Borrows the buffer and returns a pointer to the aligned 64-bit word at offset, or NULL with an error set
+static uint64_t* borrow_word(PyObject* buffer, Py_ssize_t offset, Py_buffer* view) {
+    if (PyObject_GetBuffer(buffer, view, PyBUF_WRITABLE) < 0) return NULL;
+
+    if (offset < 0 || offset + (Py_ssize_t) sizeof(uint64_t) > view->len || ((uintptr_t) view->buf + offset) % sizeof(uint64_t)) {
+        PyBuffer_Release(view);
+        PyErr_Format(PyExc_ValueError, "Offset %zd is not an aligned 64-bit word inside the buffer", offset);
+        return NULL;
+    }
+
+    return (uint64_t*) ((char*) view->buf + offset);
+}
+
+
+static PyObject* py_shm_load_acquire(PyObject* self, PyObject* args) {
+    PyObject* buffer;
+    Py_ssize_t offset;
+
+    if (!PyArg_ParseTuple(args, "On", &buffer, &offset)) {
+        return NULL;
+    }
+
+    Py_buffer view;
+    uint64_t* word = borrow_word(buffer, offset, &view);
+    if (word == NULL) return NULL;
+
+    uint64_t value = shm_load_acquire(word);
+    PyBuffer_Release(&view);
+
+    return PyLong_FromUnsignedLongLong(value);
+}
+
+
+static PyObject* py_shm_store_release(PyObject* self, PyObject* args) {
+    PyObject* buffer;
+    Py_ssize_t offset;
+    unsigned long long value;
+
+    if (!PyArg_ParseTuple(args, "OnK", &buffer, &offset, &value)) {
+        return NULL;
+    }
+
+    Py_buffer view;
+    uint64_t* word = borrow_word(buffer, offset, &view);
+    if (word == NULL) return NULL;
+
+    shm_store_release(word, (uint64_t) value);
+    PyBuffer_Release(&view);
+
+    Py_RETURN_NONE;
+}
+
+
+static PyObject* py_shm_fence(PyObject* self, PyObject* args) {
+    shm_fence();
+    Py_RETURN_NONE;
+}
+
+
+static PyMethodDef pshm_tools_methods[] = {
+    {"shm_load_acquire", py_shm_load_acquire, METH_VARARGS, "Load the 64-bit word at an offset of a buffer with acquire ordering."},
+    {"shm_store_release", py_shm_store_release, METH_VARARGS, "Store the 64-bit word at an offset of a buffer with release ordering."},
+    {"shm_fence", py_shm_fence, METH_NOARGS, "Full memory barrier."},
+    {NULL, NULL, 0, NULL} // Sentinel
+};
+
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "pshm_tools",
+    "Python bindings for the atomic counters of shared memory rings.",
+    -1,
+    pshm_tools_methods
+};
+
+
+PyMODINIT_FUNC PyInit_pshm_tools(void) {
+    return PyModule_Create(&moduledef);
+}
@@ -0,0 +1,189 @@
+#define PY_SSIZE_T_CLEAN
+#include <errno.h>
+#include <Python.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <arpa/inet.h>
+#include "udp_tools.h"
+
+
+static PyObject* py_udp_send_batch(PyObject* self, PyObject* args) {
+    int fd;
+    PyObject* packets;
+    const char* ip = NULL;
+    int port = 0;
+
+    if (!PyArg_ParseTuple(args, "iO|zi", &fd, &packets, &ip, &port)) {
+        return NULL;
+    }
+
+    PyObject* sequence = PySequence_Fast(packets, "packets must be a sequence of bytes-like objects");
+    if (sequence == NULL) return NULL;
+
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(sequence);
+    if (count == 0) {
+        Py_DECREF(sequence);
+        return PyLong_FromLong(0);
+    }
+
+    struct sockaddr_in dest;
+    struct sockaddr_in* dest_ptr = NULL;
+    if (ip != NULL) {
+        memset(&dest, 0, sizeof(dest));
+        dest.sin_family = AF_INET;
+        dest.sin_port = htons((uint16_t) port);
+        if (inet_pton(AF_INET, ip, &dest.sin_addr) != 1) {
+            Py_DECREF(sequence);
+            PyErr_Format(PyExc_ValueError, "Invalid IPv4 address: %s", ip);
+            return NULL;
+        }
+        dest_ptr = &dest;
+    }
+
+    Py_buffer* views = PyMem_Calloc(count, sizeof(Py_buffer));
+    const uint8_t** buffers = PyMem_Calloc(count, sizeof(uint8_t*));
+    size_t* lengths = PyMem_Calloc(count, sizeof(size_t));
+    if (views == NULL || buffers == NULL || lengths == NULL) {
+        PyMem_Free(views);
+        PyMem_Free(buffers);
+        PyMem_Free(lengths);
+        Py_DECREF(sequence);
+        return PyErr_NoMemory();
+    }
+
+    // Borrow every packet's buffer so nothing is copied before it reaches the kernel
+    Py_ssize_t acquired = 0;
+    for (; acquired < count; acquired++) {
+        PyObject* item = PySequence_Fast_GET_ITEM(sequence, acquired);
+        if (PyObject_GetBuffer(item, &views[acquired], PyBUF_SIMPLE) < 0) break;
+
+        buffers[acquired] = views[acquired].buf;
+        lengths[acquired] = views[acquired].len;
+    }
+
+    int sent = -1;
+    if (acquired == count) {
+        Py_BEGIN_ALLOW_THREADS
+        sent = udp_send_batch(fd, buffers, lengths, (unsigned int) count, dest_ptr);
+        Py_END_ALLOW_THREADS
+
+        if (sent < 0) PyErr_SetFromErrno(PyExc_OSError);  // Error already printed by udp_send_batch
+    }
+
+    for (Py_ssize_t i = 0; i < acquired; i++) PyBuffer_Release(&views[i]);
+    PyMem_Free(views);
+    PyMem_Free(buffers);
+    PyMem_Free(lengths);
+    Py_DECREF(sequence);
+
+    if (sent < 0) return NULL;
+    return PyLong_FromLong(sent);
+}
+
+
+static PyObject* py_udp_recv_batch(PyObject* self, PyObject* args) {
+    int fd;
+    unsigned int count;
+    Py_ssize_t buffer_size;
+    int with_addresses = 1;
+    double timeout = -1.0;
+
+    if (!PyArg_ParseTuple(args, "iIn|pd", &fd, &count, &buffer_size, &with_addresses, &timeout)) {
+        return NULL;
+    }
+
+    // Negative waits forever, as socket.gettimeout() None
+    int timeout_ms = timeout < 0 ? -1 : (int) (timeout * 1000 + 0.999);  // rounded up, so a short timeout still waits
+
+    if (count == 0 || buffer_size <= 0) {
+        PyErr_SetString(PyExc_ValueError, "count and buffer_size must be positive");
+        return NULL;
+    }
+
+    uint8_t* buffer = PyMem_Malloc(count * buffer_size);
+    size_t* lengths = PyMem_Calloc(count, sizeof(size_t));
+    struct sockaddr_in* sources = with_addresses ? PyMem_Calloc(count, sizeof(struct sockaddr_in)) : NULL;
+    if (buffer == NULL || lengths == NULL || (with_addresses && sources == NULL)) {
+        PyMem_Free(buffer);
+        PyMem_Free(lengths);
+        PyMem_Free(sources);
+        return PyErr_NoMemory();
+    }
+
+    int received;
+    Py_BEGIN_ALLOW_THREADS
+    received = udp_recv_batch(fd, buffer, (size_t) buffer_size, count, lengths, sources, timeout_ms);
+    Py_END_ALLOW_THREADS
+
+    if (received < 0) {
+        int saved_errno = errno;
+        PyMem_Free(buffer);
+        PyMem_Free(lengths);
+        PyMem_Free(sources);
+
+        // Match socket.recv: a timeout raises TimeoutError, a non-blocking socket with nothing queued BlockingIOError
+        if ((saved_errno == EAGAIN || saved_errno == EWOULDBLOCK) && timeout_ms > 0) {
+            PyErr_SetString(PyExc_TimeoutError, "timed out");
+            return NULL;
+        }
+
+        errno = saved_errno;
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL; // Any other error was already printed by udp_recv_batch
+    }
+
+    PyObject* batch = PyList_New(received);
+    if (batch == NULL) goto fail;
+
+    for (int i = 0; i < received; i++) {
+        PyObject* data = PyBytes_FromStringAndSize((const char*) buffer + (i * buffer_size), (Py_ssize_t) lengths[i]);
+        if (data == NULL) goto fail;
+
+        if (!with_addresses) {
+            PyList_SET_ITEM(batch, i, data);
+            continue;
+        }
+
+        char ip[INET_ADDRSTRLEN];
+        inet_ntop(AF_INET, &sources[i].sin_addr, ip, sizeof(ip));
+
+        PyObject* packet = Py_BuildValue("(N(si))", data, ip, (int) ntohs(sources[i].sin_port));
+        if (packet == NULL) goto fail;
+
+        PyList_SET_ITEM(batch, i, packet);
+    }
+
+    PyMem_Free(buffer);
+    PyMem_Free(lengths);
+    PyMem_Free(sources);
+    return batch;
+
+fail:
+    Py_XDECREF(batch);
+    PyMem_Free(buffer);
+    PyMem_Free(lengths);
+    PyMem_Free(sources);
+    return NULL;
+}
+
+
+static PyMethodDef pudp_tools_methods[] = {
+    {"udp_send_batch", py_udp_send_batch, METH_VARARGS, "Send a sequence of datagrams with sendmmsg. Returns the number of datagrams sent, which may be short of the count if the kernel stopped taking them."},
+    {"udp_recv_batch", py_udp_recv_batch, METH_VARARGS, "Receive up to count datagrams with a single recvmmsg call, waiting at most timeout seconds (negative waits forever) for the first."},
+    {NULL, NULL, 0, NULL} // Sentinel
+};
+
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "pudp_tools",
+    "Python bindings for batched C-based UDP communication on Linux.",
+    -1,
+    pudp_tools_methods
+};
+
+
+PyMODINIT_FUNC PyInit_pudp_tools(void) {
+    return PyModule_Create(&moduledef);
+}
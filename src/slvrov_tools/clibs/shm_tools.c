@@ -0,0 +1,21 @@
+#include "shm_tools.h"
+
+
+// Reads a counter published by the other side of a ring. Nothing after this load (such as reading the record
+// bytes it covers) can be reordered before it, and a 64-bit counter is never torn, even on 32-bit ARM.
+uint64_t shm_load_acquire(const uint64_t *word) {
+    return __atomic_load_n(word, __ATOMIC_ACQUIRE);
+}
+
+
+// Publishes a counter. Every store before this one (such as the record bytes it covers) is visible to a reader
+// that sees the new value.
+void shm_store_release(uint64_t *word, uint64_t value) {
+    __atomic_store_n(word, value, __ATOMIC_RELEASE);
+}
+
+
+// Full barrier, for the futex handshake: a store of one flag followed by a load of the other side's flag.
+void shm_fence(void) {
+    __atomic_thread_fence(__ATOMIC_SEQ_CST);
+}
@@ -0,0 +1,10 @@
+#ifndef SHM_TOOLS_H
+#define SHM_TOOLS_H
+
+#include <stdint.h>
+
+uint64_t shm_load_acquire(const uint64_t *word);
+void shm_store_release(uint64_t *word, uint64_t value);
+void shm_fence(void);
+
+#endif // SHM_TOOLS_H
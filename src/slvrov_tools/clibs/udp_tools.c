@@ -0,0 +1,133 @@
+#define _GNU_SOURCE
+#include <errno.h>
+#include <poll.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/socket.h>
+#include <sys/uio.h>
+#include "udp_tools.h"
+
+
+int udp_send_batch(int fd, const uint8_t **buffers, const size_t *lengths, unsigned int count, const struct sockaddr_in *dest) {
+    if (count == 0) return 0;
+
+    struct mmsghdr *msgs = calloc(count, sizeof(struct mmsghdr));
+    struct iovec *iovecs = calloc(count, sizeof(struct iovec));
+    if (msgs == NULL || iovecs == NULL) {
+        free(msgs);
+        free(iovecs);
+        errno = ENOMEM;
+        return -1;
+    }
+
+    for (unsigned int i = 0; i < count; i++) {
+        iovecs[i].iov_base = (void *) buffers[i];
+        iovecs[i].iov_len  = lengths[i];
+
+        msgs[i].msg_hdr.msg_iov    = &iovecs[i];
+        msgs[i].msg_hdr.msg_iovlen = 1;
+
+        // A NULL destination means the socket is connected and the kernel fills in the peer
+        if (dest != NULL) {
+            msgs[i].msg_hdr.msg_name    = (void *) dest;
+            msgs[i].msg_hdr.msg_namelen = sizeof(struct sockaddr_in);
+        }
+    }
+
+    /*
+    sendmmsg may stop early (e.g. the socket send buffer filled up), so keep submitting the
+    remaining messages until everything has been handed to the kernel.
+    */
+
+    unsigned int sent = 0;
+    while (sent < count) {
+        int rtn = sendmmsg(fd, msgs + sent, count - sent, 0);
+        if (rtn < 0) {
+            if (errno == EINTR) continue;
+            break;
+        }
+        sent += rtn;
+    }
+
+    // A partial send returns the short count; the caller decides whether that is an error
+    int saved_errno = errno;
+    if (sent == 0) perror("Failed to send UDP batch");
+
+    free(msgs);
+    free(iovecs);
+
+    errno = saved_errno;
+    if (sent == 0) return -1;
+    return sent;
+}
+
+
+int udp_recv_batch(int fd, uint8_t *buffer, size_t buffer_size, unsigned int count, size_t *lengths, struct sockaddr_in *sources, int timeout_ms) {
+    if (count == 0) return 0;
+
+    /*
+    Python keeps sockets with a timeout in O_NONBLOCK mode, so recvmmsg can't be left to block on its own. Wait for
+    the first datagram with poll instead, honouring the socket's timeout (-1 waits forever). A timeout returns -1
+    with errno EAGAIN, without printing anything.
+    */
+
+    struct pollfd ready = { .fd = fd, .events = POLLIN };
+    int polled;
+    do {
+        polled = poll(&ready, 1, timeout_ms);
+    } while (polled < 0 && errno == EINTR);
+
+    if (polled < 0) {
+        int saved_errno = errno;
+        perror("Failed to wait for UDP batch");
+        errno = saved_errno;
+        return -1;
+    }
+    if (polled == 0) {
+        errno = EAGAIN;
+        return -1;
+    }
+
+    struct mmsghdr *msgs = calloc(count, sizeof(struct mmsghdr));
+    struct iovec *iovecs = calloc(count, sizeof(struct iovec));
+    if (msgs == NULL || iovecs == NULL) {
+        free(msgs);
+        free(iovecs);
+        errno = ENOMEM;
+        return -1;
+    }
+
+    // Every message gets its own buffer_size slot inside the one contiguous buffer
+    for (unsigned int i = 0; i < count; i++) {
+        iovecs[i].iov_base = buffer + (i * buffer_size);
+        iovecs[i].iov_len  = buffer_size;
+
+        msgs[i].msg_hdr.msg_iov    = &iovecs[i];
+        msgs[i].msg_hdr.msg_iovlen = 1;
+
+        if (sources != NULL) {
+            msgs[i].msg_hdr.msg_name    = &sources[i];
+            msgs[i].msg_hdr.msg_namelen = sizeof(struct sockaddr_in);
+        }
+    }
+
+    // MSG_WAITFORONE blocks for the first datagram, then takes whatever else is already queued
+    int received;
+    do {
+        received = recvmmsg(fd, msgs, count, MSG_WAITFORONE, NULL);
+    } while (received < 0 && errno == EINTR);
+
+    int saved_errno = errno;
+    if (received < 0) {
+        if (saved_errno != EAGAIN && saved_errno != EWOULDBLOCK) perror("Failed to receive UDP batch");
+    } else {
+        for (int i = 0; i < received; i++) lengths[i] = msgs[i].msg_len;
+    }
+
+    free(msgs);
+    free(iovecs);
+
+    errno = saved_errno;
+    return received;
+}
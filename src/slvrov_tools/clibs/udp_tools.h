@@ -0,0 +1,11 @@
+#ifndef UDP_TOOLS_H
+#define UDP_TOOLS_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <netinet/in.h>
+
+int udp_send_batch(int fd, const uint8_t **buffers, const size_t *lengths, unsigned int count, const struct sockaddr_in *dest);
+int udp_recv_batch(int fd, uint8_t *buffer, size_t buffer_size, unsigned int count, size_t *lengths, struct sockaddr_in *sources, int timeout_ms);
+
+#endif // UDP_TOOLS_H
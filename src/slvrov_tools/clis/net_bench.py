@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# SLVROV Oct 2026
+
+import argparse
+import json
+import sys
+from ..bench_tools import find_regressions, loopback_bench_matrix, read_bench_results, run_loopback_suite, write_bench_results
+from ..misc_tools import sys_error
+
+BUFFER_SIZES = "1472,65507"
+PACKET_SIZES = "64,512,1400"
+MAX_THREADS = "1,4,10"
+
+
+def int_list(text: str) -> list[int]:
+    """Parse a comma separated list of integers for argparse."""
+
+    try: return [int(item) for item in text.split(",") if item]
+    except ValueError: raise argparse.ArgumentTypeError(f"Expected comma separated integers, got {text}")
+
+
+def main() -> None:
+    """Run the UDP loopback benchmark matrix and optionally check it against a baseline."""
+
+    parser = argparse.ArgumentParser(description="Benchmark UDP_Communicator over loopback and report packets/s and latency as JSON")
+
+    parser.add_argument("--packets", "-n", type=int, default=20_000, help="Packets sent per run. Default is 20000")
+    parser.add_argument("--repeats", "-r", type=int, default=3, help="Runs per configuration; the best is kept. Default is 3")
+    parser.add_argument("--buffer-sizes", type=int_list, default=BUFFER_SIZES, help=f"Comma separated recieve buffer sizes. Default is {BUFFER_SIZES}")
+    parser.add_argument("--packet-sizes", type=int_list, default=PACKET_SIZES, help=f"Comma separated packet sizes. Default is {PACKET_SIZES}")
+    parser.add_argument("--max-threads", type=int_list, default=MAX_THREADS, help=f"Comma separated handler thread counts for threaded runs. Default is {MAX_THREADS}")
+    parser.add_argument("--no-threaded", action="store_true", help="Skip threaded runs")
+    parser.add_argument("--output", "-o", help="Write results JSON to this file instead of stdout")
+    parser.add_argument("--baseline", "-b", help="Results JSON from an earlier run to check for throughput regressions")
+    parser.add_argument("--threshold", "-t", type=float, default=0.1, help="Allowed fractional throughput drop against the baseline. Default is 0.1")
+
+    args = parser.parse_args()
+
+    threaded = [False] if args.no_threaded else [False, True]
+    configs = loopback_bench_matrix(args.buffer_sizes, args.packet_sizes, args.max_threads, threaded)
+    if not configs: sys_error("No configurations to run. Packet sizes must not exceed buffer sizes")
+
+    results = run_loopback_suite(configs, args.packets, args.repeats)
+
+    if args.output: write_bench_results(results, args.output)
+    else: json.dump(results, sys.stdout, indent=2)
+
+    if args.baseline:
+        regressions = find_regressions(read_bench_results(args.baseline), results, args.threshold)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression['key']}: {regression['baseline_packets_per_second']:.0f} -> "
+                  f"{regression['packets_per_second']:.0f} packets/s ({regression['change']:+.1%})", file=sys.stderr)
+
+        if regressions: sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+# SLVROV Oct 2026
+
+import struct
+import threading
+from collections import deque
+from time import time_ns
+from typing import Callable
+from .network_tools import UDP_Communicator
+
+CLOCK_REQUEST = 0
+CLOCK_REPLY = 1
+
+# kind, then the NTP timestamps: t1 requester send, t2 responder recieve, t3 responder send (ns on each side's clock)
+clock_probe = struct.Struct("!Bqqq")
+
+
+class Clock_Sync:
+    """
+    NTP-style clock offset and drift estimation between two hosts over a UDP_Communicator, with no NTP server.
+
+    Each probe is timestamped four times: t1 when the request leaves, t2 when the peer recieves it, t3 when the peer
+    replies and t4 when the reply arrives. That gives the round trip time, rtt = (t4 - t1) - (t3 - t2), and the
+    peer's offset, ((t2 - t1) + (t3 - t4)) / 2, which is exact if the two directions took equally long and is off by
+    at most rtt / 2 otherwise. Queueing only ever adds delay, so of every `window` probes only the one with the
+    lowest RTT is kept. A least squares line through the kept samples gives the offset now and how fast it changes
+    (drift), so conversions stay accurate between probes.
+
+    Both ends need a Clock_Sync, which installs itself as the communicator's packet handler and answers the other
+    end's probes. Run the communicator's recieve loop unthreaded (recieve_all), so replies are timestamped promptly.
+
+        sync = Clock_Sync(UDP_Communicator("0.0.0.0", 5300), "192.168.3.20", 5300)
+        threading.Thread(target=sync.communicator.recieve_all, daemon=True).start()
+        sync.start(interval=0.5)
+        frame_time = sync.remote_to_local(rov_timestamp_ns)
+
+    Attributes:
+        communicator (UDP_Communicator): The wrapped communicator.
+        to_IP (str | None): Peer IP probes are sent to, or None for the communicator's connected peer.
+        to_port (int | None): Peer port probes are sent to, or None for the communicator's connected peer.
+        clock (Callable[[], int]): Local clock in ns. Both ends must use the same kind of clock (time.time_ns by
+            default, which matches kernel timestamps and capture files).
+        window (int): Probes per minimum-RTT selection.
+        samples (deque[tuple[int, int, int]]): Kept (local time, offset, rtt) samples, in ns, oldest first.
+        probes_sent (int): Requests sent.
+        replies (int): Replies recieved.
+        answered (int): Requests from the peer answered.
+        running (bool): Indicates if the probing thread is running.
+
+    Key Methods:
+        probe() -> None: Sends one request.
+        start(interval=1.0) -> None: Probes on a background thread.
+        stop() -> None: Stops the background thread.
+        offset_ns(at=None) -> float | None: Peer clock minus local clock, in ns.
+        remote_to_local(timestamp_ns) -> float: Converts a peer timestamp to local clock time.
+        local_to_remote(timestamp_ns) -> float: Converts a local timestamp to peer clock time.
+        snapshot() -> dict: Returns the current estimate and its error bound.
+    """
+
+    def __init__(self, communicator: UDP_Communicator, to_IP: str | None=None, to_port: int | None=None,
+                 clock: Callable[[], int]=time_ns, window: int=8, history: int=32):
+        """
+        Wraps a communicator and installs the clock sync as its packet handler.
+
+        Args:
+            communicator (UDP_Communicator): The communicator to wrap. Dedicate it to clock sync.
+            to_IP (str | None, optional): Peer IP. Defaults to the communicator's connected peer.
+            to_port (int | None, optional): Peer port. Defaults to the communicator's connected peer.
+            clock (Callable[[], int], optional): Local clock in ns. Defaults to time.time_ns.
+            window (int, optional): Probes per minimum-RTT selection. Defaults to 8.
+            history (int, optional): Selected samples kept for the drift fit. Defaults to 32.
+
+        Raises:
+            Exception: If window or history is not positive.
+        """
+
+        if window <= 0 or history <= 0: raise Exception("window and history must be positive")
+
+        self.communicator = communicator
+        self.to_IP = to_IP
+        self.to_port = to_port
+
+        self.clock = clock
+        self.window = window
+        self.samples = deque(maxlen=history)
+
+        self.probes_sent = 0
+        self.replies = 0
+        self.answered = 0
+
+        self._candidates = []  # samples of the window being filled
+        self._fit = None  # (reference local time, offset at reference, drift)
+        self._lock = threading.Lock()
+
+        self.running = False
+        self._thread = None
+        self._stop_event = threading.Event()
+
+        communicator.packet_handler = self.packet_handler_for
+
+    def _transmit(self, packet: bytes, address: tuple | None) -> None:
+        """
+        Args:
+            packet (bytes): The probe.
+            address (tuple | None): Destination, or None to use to_IP/to_port or the connected peer.
+        """
+
+        if address is not None: self.communicator.sendto(packet, *address)
+        elif self.to_IP is not None: self.communicator.sendto(packet, self.to_IP, self.to_port)
+        else: self.communicator.send(packet)
+
+    def probe(self) -> None:
+        """
+        Sends one request to the peer. The estimate updates when the reply arrives.
+        """
+
+        self._transmit(clock_probe.pack(CLOCK_REQUEST, self.clock(), 0, 0), None)
+        self.probes_sent += 1
+
+    def packet_handler_for(self, data: bytes | bytearray | memoryview, address: tuple | None=None) -> None:
+        """
+        Packet handler installed on the communicator. Answers requests and turns replies into samples.
+
+        Args:
+            data (bytes | bytearray | memoryview): The recieved datagram.
+            address (tuple | None, optional): Source address, when recieving with recieve_all.
+        """
+
+        recieved_at = self.clock()
+        if len(data) < clock_probe.size: return  # not a clock probe
+
+        kind, t1, t2, t3 = clock_probe.unpack_from(data)
+
+        if kind == CLOCK_REQUEST:
+            self._transmit(clock_probe.pack(CLOCK_REPLY, t1, recieved_at, self.clock()), address)
+            self.answered += 1
+
+        elif kind == CLOCK_REPLY:
+            rtt = (recieved_at - t1) - (t3 - t2)
+            if rtt < 0 or recieved_at < t1: return  # garbled, or from before a local clock step
+
+            self.replies += 1
+            self._add_sample((t1 + recieved_at) // 2, ((t2 - t1) + (t3 - recieved_at)) / 2, rtt)
+
+    def _add_sample(self, local_time: int, offset: float, rtt: int) -> None:
+        """
+        Adds a measurement, keeping the lowest-RTT one of every window, and refits the estimate.
+
+        Args:
+            local_time (int): Local clock time of the measurement (midpoint of the round trip), in ns.
+            offset (float): Measured peer minus local offset, in ns.
+            rtt (int): Round trip time, in ns.
+        """
+
+        with self._lock:
+            self._candidates.append((local_time, offset, rtt))
+
+            if len(self._candidates) >= self.window:
+                self.samples.append(min(self._candidates, key=lambda sample: sample[2]))
+                self._candidates = []
+
+            self._refit()
+
+    def _refit(self) -> None:
+        """
+        Fits offset = a + drift * (t - reference) through the kept samples, plus the best of the window being filled.
+        Called with the lock held.
+        """
+
+        points = list(self.samples)
+        if self._candidates: points.append(min(self._candidates, key=lambda sample: sample[2]))
+
+        if len(points) < 2:
+            local_time, offset, _ = points[-1]
+            self._fit = (local_time, offset, 0.0)
+            return
+
+        reference = points[-1][0]
+        times = [local_time - reference for local_time, _, _ in points]
+        offsets = [offset for _, offset, _ in points]
+
+        mean_time = sum(times) / len(times)
+        mean_offset = sum(offsets) / len(offsets)
+        spread = sum((time - mean_time) ** 2 for time in times)
+
+        if spread == 0: drift = 0.0
+        else: drift = sum((time - mean_time) * (offset - mean_offset) for time, offset in zip(times, offsets)) / spread
+
+        self._fit = (reference, mean_offset - drift * mean_time, drift)
+
+    def offset_ns(self, at: int | None=None) -> float | None:
+        """
+        Args:
+            at (int | None, optional): Local clock time in ns. Defaults to now.
+
+        Returns:
+            float | None: Peer clock minus local clock at that time, in ns, or None before the first reply.
+        """
+
+        fit = self._fit
+        if fit is None: return None
+
+        reference, offset, drift = fit
+        if at is None: at = self.clock()
+
+        return offset + drift * (at - reference)
+
+    def remote_to_local(self, timestamp_ns: int | float) -> float:
+        """
+        Converts a timestamp taken on the peer's clock to the local clock.
+
+        Args:
+            timestamp_ns (int | float): Peer clock time in ns.
+
+        Returns:
+            float: The same instant on the local clock, in ns.
+
+        Raises:
+            Exception: Before the first reply.
+        """
+
+        offset = self.offset_ns()
+        if offset is None: raise Exception("Clock offset not yet estimated. Call probe or start and wait for a reply")
+
+        local = timestamp_ns - offset
+        return timestamp_ns - self.offset_ns(int(local))  # offset evaluated at the instant itself, for drift
+
+    def local_to_remote(self, timestamp_ns: int | float) -> float:
+        """
+        Converts a local timestamp to the peer's clock.
+
+        Args:
+            timestamp_ns (int | float): Local clock time in ns.
+
+        Returns:
+            float: The same instant on the peer's clock, in ns.
+
+        Raises:
+            Exception: Before the first reply.
+        """
+
+        offset = self.offset_ns(int(timestamp_ns))
+        if offset is None: raise Exception("Clock offset not yet estimated. Call probe or start and wait for a reply")
+
+        return timestamp_ns + offset
+
+    def _run(self, interval: float) -> None:
+        """
+        Background loop: probes every interval seconds until stopped.
+
+        Args:
+            interval (float): Seconds between probes.
+        """
+
+        while not self._stop_event.is_set():
+            try: self.probe()
+            except OSError: pass  # peer not up yet or link down; keep probing
+
+            self._stop_event.wait(interval)
+
+    def start(self, interval: float=1.0) -> None:
+        """
+        Probes the peer every interval seconds on a background daemon thread.
+
+        Args:
+            interval (float, optional): Seconds between probes. Defaults to 1.0.
+        """
+
+        if self.running: return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+        self.running = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the probing thread."""
+
+        if not self.running: return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.running = False
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: "offset_ns" now, "drift_ppm", "error_ns" (half the lowest kept RTT, a bound on the offset error),
+            "min_rtt_ns", sample count and probe counters. The estimate fields are None before the first reply.
+        """
+
+        with self._lock:
+            points = list(self.samples) + self._candidates
+            fit = self._fit
+
+        min_rtt = min(rtt for _, _, rtt in points) if points else None
+
+        return {
+            "offset_ns": self.offset_ns(),
+            "drift_ppm": fit[2] * 1e6 if fit is not None else None,
+            "error_ns": min_rtt / 2 if min_rtt is not None else None,
+            "min_rtt_ns": min_rtt,
+            "samples": len(self.samples),
+            "probes_sent": self.probes_sent,
+            "replies": self.replies,
+            "answered": self.answered,
+        }
@@ -0,0 +1,195 @@
+# SLVROV Oct 2026
+
+import threading
+import traceback
+from time import monotonic, sleep
+from .network_tools import Latency_Histogram, Message_Registry, UDP_Communicator
+
+
+class Command_Sender:
+    """
+    Fixed-rate, latest-value command sender on top of UDP_Communicator and a Message_Registry.
+
+    Control code calls `set` as often as it likes (e.g. on every joystick event); only the newest values of each
+    command are kept. Every tick, the pending commands are packed into one datagram with
+    `Message_Registry.encode_many` and sent, so bandwidth is bounded by the tick rate and the ROV always gets the
+    freshest command. Ticks follow a fixed monotonic schedule; how late each tick ran is kept as jitter statistics.
+
+    Run it on its own thread with `start`, or call `tick` from something else's timer (e.g. ``Reactor.call_every``).
+
+    Attributes:
+        communicator (UDP_Communicator): Communicator datagrams are sent with.
+        registry (Message_Registry): Registry the commands are declared in.
+        rate_hz (float): Ticks per second.
+        period (float): Seconds between ticks.
+        to_IP (str | None): Destination IP, or None to send to the communicator's connected peer.
+        to_port (int | None): Destination port, or None to send to the communicator's connected peer.
+        send_unchanged (bool): Resend every command's latest value every tick, not just the ones set since the last tick.
+        latest (dict[str, tuple]): Latest values by command name.
+        sent_count (int): Datagrams sent.
+        coalesced_count (int): Values overwritten before they were sent.
+        missed_ticks (int): Ticks skipped because the sender fell more than a period behind.
+        jitter (Latency_Histogram): How late each tick ran relative to its schedule, in seconds.
+        running (bool): Indicates if the sender thread is running.
+
+    Key Methods:
+        set(name, *values) -> None: Stores the latest values of a command.
+        tick() -> bool: Sends pending commands now. Returns True if a datagram was sent.
+        start() -> None: Starts ticking on a background thread.
+        stop() -> None: Stops the background thread.
+        snapshot() -> dict: Returns counters and jitter statistics.
+    """
+
+    def __init__(self, communicator: UDP_Communicator, registry: Message_Registry, rate_hz: float=50, to_IP: str | None=None,
+                 to_port: int | None=None, send_unchanged: bool=False):
+        """
+        Initializes a stopped sender.
+
+        Args:
+            communicator (UDP_Communicator): Communicator to send with.
+            registry (Message_Registry): Registry the commands are declared in.
+            rate_hz (float, optional): Ticks per second. Defaults to 50.
+            to_IP (str | None, optional): Destination IP. Defaults to the communicator's connected peer.
+            to_port (int | None, optional): Destination port. Defaults to the communicator's connected peer.
+            send_unchanged (bool, optional): Resend all latest values every tick as a keepalive. Defaults to False.
+
+        Raises:
+            Exception: If rate_hz is not positive.
+        """
+
+        if rate_hz <= 0: raise Exception("rate_hz must be positive")
+
+        self.communicator = communicator
+        self.registry = registry
+
+        self.rate_hz = rate_hz
+        self.period = 1 / rate_hz
+
+        self.to_IP = to_IP
+        self.to_port = to_port
+        self.send_unchanged = send_unchanged
+
+        self.latest = {}
+        self._changed = set()
+        self._lock = threading.Lock()
+
+        self.sent_count = 0
+        self.coalesced_count = 0
+        self.missed_ticks = 0
+        self.jitter = Latency_Histogram()
+
+        self.running = False
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def set(self, name: str, *values) -> None:
+        """
+        Stores the latest values of a command, replacing any not yet sent.
+
+        Args:
+            name (str): Command (message type) name in the registry.
+            *values: Field values, in field order.
+
+        Raises:
+            KeyError: If the command is not registered.
+            struct.error: If the values don't match the command's fields, so a bad value fails here instead of in
+                the sender thread.
+        """
+
+        if name not in self.registry.types_by_name: raise KeyError(f"Command {name} is not registered")
+        self.registry.types_by_name[name].pack(*values)
+
+        with self._lock:
+            if name in self._changed: self.coalesced_count += 1
+
+            self.latest[name] = values
+            self._changed.add(name)
+
+    def tick(self) -> bool:
+        """
+        Packs pending commands into one datagram and sends it. If sending fails, the commands stay pending for
+        the next tick.
+
+        Returns:
+            bool: True if a datagram was sent, False if there was nothing to send.
+        """
+
+        with self._lock:
+            names = self.latest if self.send_unchanged else self._changed
+            messages = [(name, self.latest[name]) for name in names]
+            changed = self._changed
+            self._changed = set()
+
+        if not messages: return False
+
+        try:
+            datagram = self.registry.encode_many(messages)
+
+            if self.to_IP is None: self.communicator.send(datagram)
+            else: self.communicator.sendto(datagram, self.to_IP, self.to_port)
+
+        except BaseException:
+            with self._lock: self._changed |= changed  # anything set since is already pending with newer values
+            raise
+
+        self.sent_count += 1
+        return True
+
+    def _run(self) -> None:
+        """Background loop: ticks on a fixed monotonic schedule until stopped."""
+
+        deadline = monotonic() + self.period
+
+        while not self._stop_event.is_set():
+            wait = deadline - monotonic()
+            if wait > 0 and self._stop_event.wait(wait): break
+
+            now = monotonic()
+            self.jitter.record(max(0.0, now - deadline))
+
+            try: self.tick()
+            except OSError: pass  # a transient send error shouldn't end the control loop; the next tick resends
+            except Exception: traceback.print_exc()  # nor should anything else, or the sender would stop silently
+
+            deadline += self.period
+
+            # If we fell more than a period behind, skip the missed ticks instead of sending a burst
+            now = monotonic()
+            if deadline <= now:
+                skipped = int((now - deadline) // self.period) + 1
+                self.missed_ticks += skipped
+                deadline += skipped * self.period
+
+    def start(self) -> None:
+        """Starts ticking on a background daemon thread."""
+
+        if self.running: return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.running = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread. Pending commands are not flushed; call `tick` to send them."""
+
+        if not self.running: return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.running = False
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: sent, coalesced and missed tick counts, plus the jitter histogram snapshot (seconds).
+        """
+
+        return {
+            "rate_hz": self.rate_hz,
+            "sent": self.sent_count,
+            "coalesced": self.coalesced_count,
+            "missed_ticks": self.missed_ticks,
+            "jitter": self.jitter.snapshot(),
+        }
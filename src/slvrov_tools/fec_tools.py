@@ -0,0 +1,371 @@
+# SLVROV Oct 2026
+
+import random
+import struct
+import threading
+from collections import OrderedDict
+from typing import Callable
+from .network_tools import UDP_Communicator
+
+FEC_DATA = 0
+FEC_PARITY = 1
+
+# kind, group size, index in group, 16-bit group number, payload length (data) or XOR of the lengths (parity)
+fec_header = struct.Struct("!BBBHH")
+
+FEC_GROUP_MODULUS = 1 << 16
+
+
+class _FEC_Encoder:
+    """
+    Sender-side parity accumulator for one destination.
+
+    Attributes:
+        group (int): Number of the group being filled.
+        count (int): Data packets in the group so far.
+        parity (int): XOR of the group's payloads, as little-endian integers.
+        length_parity (int): XOR of the group's payload lengths.
+        longest (int): Longest payload in the group, the parity payload's length.
+    """
+
+    def __init__(self):
+        self.group = random.randrange(FEC_GROUP_MODULUS)  # so a restarted sender doesn't collide with groups the receiver remembers
+        self.reset()
+
+    def reset(self) -> None:
+        """Starts an empty group."""
+
+        self.count = 0
+        self.parity = 0
+        self.length_parity = 0
+        self.longest = 0
+
+
+class _FEC_Group:
+    """
+    Receiver-side state of one parity group.
+
+    Attributes:
+        payloads (dict[int, bytes]): Recieved data payloads by index, for repairs. Cleared once the whole group is delivered.
+        delivered (set[int]): Indexes passed to the packet handler, recieved or rebuilt.
+        parity (tuple[int, int, bytes] | None): (group size, length parity, parity payload) once the parity packet arrives.
+    """
+
+    def __init__(self):
+        self.payloads = {}
+        self.delivered = set()
+        self.parity = None
+
+
+class FEC_Layer:
+    """
+    An optional forward error correction layer for UDP_Communicator. After every `k` data packets to a destination
+    it sends one parity packet holding the XOR of the group, which lets the receiver rebuild any single lost packet
+    of the group without a retransmission.
+
+    Data packets are delivered as soon as they arrive, so FEC adds no latency when nothing is lost; a rebuilt packet
+    is delivered when the parity packet (or the last other member of its group) arrives. Two or more losses in one
+    group can't be repaired and are counted in `unrecoverable_count`. The bandwidth cost is one packet in k + 1,
+    plus a 7 byte header per packet; XOR is done on whole payloads as Python integers, so it stays cheap at video
+    packet rates.
+
+    Every packet gets a header (kind, group size, index, 16-bit group number, length). The layer installs itself as
+    the communicator's packet handler and passes data payloads on to packet_handler. Both ends must use an FEC_Layer.
+
+        fec = FEC_Layer(UDP_Communicator("0.0.0.0", 5600), handle_frame_chunk, k=4)
+        fec.communicator.recieve_all()
+
+    Attributes:
+        communicator (UDP_Communicator): The wrapped communicator.
+        packet_handler (Callable): Called with (payload, address) -- or just (payload) under recieve_from -- per delivered packet.
+        k (int): Data packets per parity packet.
+        max_groups (int): Groups kept per source for late repairs. Older groups are forgotten.
+        drop_probability (float): Fraction of outgoing packets to silently discard, for testing recovery.
+        encoders (dict[tuple | None, _FEC_Encoder]): Parity accumulators by destination (None for the connected peer).
+        groups (dict[tuple, OrderedDict]): Receive groups by source address, then group number.
+        delivered_count (int): Data packets passed to the packet handler, including rebuilt ones.
+        recovered_count (int): Lost packets rebuilt from parity.
+        unrecoverable_count (int): Packets lost from groups that lost more than one, counted when the group is forgotten.
+        duplicate_count (int): Data packets dropped because they were already delivered (e.g. arrived after being rebuilt).
+        parity_sent (int): Parity packets sent.
+        injected_drops (int): Outgoing packets discarded by drop_probability.
+
+    Key Methods:
+        sendto(data, to_IP, to_port) -> None: Sends a data packet, followed by a parity packet every k packets.
+        send(data) -> None: Sends a data packet to the connected peer.
+        flush(to_IP=None, to_port=None) -> None: Sends parity for a partly filled group, e.g. at the end of a frame.
+        packet_handler_for(data, address=None) -> None: Installed as the communicator's packet handler.
+        snapshot() -> dict: Returns the counters.
+    """
+
+    def __init__(self, communicator: UDP_Communicator, packet_handler: Callable, k: int=4, max_groups: int=16,
+                 drop_probability: float=0.0, seed: int | None=None):
+        """
+        Wraps a communicator and installs the FEC layer as its packet handler.
+
+        Args:
+            communicator (UDP_Communicator): The communicator to wrap.
+            packet_handler (Callable): Handler for delivered payloads.
+            k (int, optional): Data packets per parity packet, 1 - 255. Defaults to 4.
+            max_groups (int, optional): Groups kept per source for late repairs. Defaults to 16.
+            drop_probability (float, optional): Fraction of outgoing packets to discard (test only). Defaults to 0.0.
+            seed (int | None, optional): Seed for the drop injection random generator. Defaults to None.
+
+        Raises:
+            Exception: If k is not between 1 and 255.
+        """
+
+        if not 1 <= k <= 255: raise Exception("k must be between 1 and 255")
+
+        self.communicator = communicator
+        self.packet_handler = packet_handler
+        self.k = k
+        self.max_groups = max_groups
+
+        self.drop_probability = drop_probability
+        self._random = random.Random(seed)
+
+        self.encoders = {}
+        self.groups = {}
+
+        self.delivered_count = 0
+        self.recovered_count = 0
+        self.unrecoverable_count = 0
+        self.duplicate_count = 0
+        self.parity_sent = 0
+        self.injected_drops = 0
+
+        self._lock = threading.Lock()  # guards the encoders and receive groups across sender and handler threads
+
+        communicator.packet_handler = self.packet_handler_for
+
+    def _transmit(self, packet: bytes, to_IP: str | None, to_port: int | None) -> None:
+        """
+        Args:
+            packet (bytes): Header and payload.
+            to_IP (str | None): Destination IP, or None to use the connected peer.
+            to_port (int | None): Destination port, or None to use the connected peer.
+        """
+
+        with self._lock:
+            drop = self.drop_probability and self._random.random() < self.drop_probability
+            if drop: self.injected_drops += 1
+
+        if drop: return
+
+        if to_IP is None: self.communicator.send(packet)
+        else: self.communicator.sendto(packet, to_IP, to_port)
+
+    def _parity_packet(self, encoder: _FEC_Encoder) -> bytes:
+        """
+        Builds the parity packet of the encoder's group and starts the next group.
+
+        Args:
+            encoder (_FEC_Encoder): A non-empty encoder.
+
+        Returns:
+            bytes: The parity packet.
+        """
+
+        header = fec_header.pack(FEC_PARITY, encoder.count, encoder.count, encoder.group, encoder.length_parity)
+        packet = header + encoder.parity.to_bytes(encoder.longest, "little")
+
+        encoder.group = (encoder.group + 1) % FEC_GROUP_MODULUS
+        encoder.reset()
+
+        return packet
+
+    def _send_data(self, data: bytes | bytearray, to_IP: str | None, to_port: int | None) -> None:
+        """
+        Sends a data packet and, if it completes a group, the group's parity packet.
+
+        Args:
+            data (bytes | bytearray): The payload. At most 65535 bytes.
+            to_IP (str | None): Destination IP, or None to use the connected peer.
+            to_port (int | None): Destination port, or None to use the connected peer.
+        """
+
+        key = None if to_IP is None else (to_IP, to_port)
+
+        with self._lock:
+            encoder = self.encoders.get(key)
+            if encoder is None: encoder = self.encoders[key] = _FEC_Encoder()
+
+            packet = fec_header.pack(FEC_DATA, self.k, encoder.count, encoder.group, len(data)) + data
+
+            encoder.parity ^= int.from_bytes(data, "little")
+            encoder.length_parity ^= len(data)
+            encoder.longest = max(encoder.longest, len(data))
+            encoder.count += 1
+
+            parity = None
+            if encoder.count == self.k:
+                parity = self._parity_packet(encoder)
+                self.parity_sent += 1
+
+        self._transmit(packet, to_IP, to_port)
+        if parity is not None: self._transmit(parity, to_IP, to_port)
+
+    def sendto(self, data: bytes | bytearray, to_IP: str, to_port: int) -> None:
+        """
+        Sends a data packet to a specific destination, followed by a parity packet if it completes a group.
+
+        Args:
+            data (bytes | bytearray): The payload.
+            to_IP (str): The target IP address.
+            to_port (int): The target port number.
+        """
+
+        self._send_data(data, to_IP, to_port)
+
+    def send(self, data: bytes | bytearray) -> None:
+        """
+        Sends a data packet to the peer the communicator is connected to.
+
+        Args:
+            data (bytes | bytearray): The payload.
+        """
+
+        self._send_data(data, None, None)
+
+    def flush(self, to_IP: str | None=None, to_port: int | None=None) -> None:
+        """
+        Sends parity for a partly filled group now, so the last packets of a burst (e.g. a video frame) are protected
+        without waiting for the next burst. Does nothing if the group is empty.
+
+        Args:
+            to_IP (str | None, optional): Destination IP. Uses the connected peer if None.
+            to_port (int | None, optional): Destination port. Uses the connected peer if None.
+        """
+
+        key = None if to_IP is None else (to_IP, to_port)
+
+        with self._lock:
+            encoder = self.encoders.get(key)
+            if encoder is None or not encoder.count: return
+
+            parity = self._parity_packet(encoder)
+            self.parity_sent += 1
+
+        self._transmit(parity, to_IP, to_port)
+
+    def _deliver(self, payload: bytes | bytearray | memoryview, address: tuple | None) -> None:
+        """
+        Args:
+            payload (bytes | bytearray | memoryview): A data payload.
+            address (tuple | None): Source address, None under recieve_from.
+        """
+
+        if address is None: self.packet_handler(payload)
+        else: self.packet_handler(payload, address)
+
+    def _group(self, address: tuple | None, number: int) -> _FEC_Group:
+        """
+        Args:
+            address (tuple | None): Source address.
+            number (int): Group number.
+
+        Returns:
+            _FEC_Group: The group, created if new. The oldest group of the source is forgotten past max_groups.
+        """
+
+        groups = self.groups.get(address)
+        if groups is None: groups = self.groups[address] = OrderedDict()
+
+        group = groups.get(number)
+        if group is None:
+            group = groups[number] = _FEC_Group()
+            if len(groups) > self.max_groups: self._forget(groups.popitem(last=False)[1])
+
+        return group
+
+    def _forget(self, group: _FEC_Group) -> None:
+        """
+        Counts the unrepaired losses of a group that is being dropped.
+
+        Args:
+            group (_FEC_Group): The group.
+        """
+
+        if group.parity is not None: self.unrecoverable_count += group.parity[0] - len(group.delivered)
+
+    def _repair(self, group: _FEC_Group) -> bytes | None:
+        """
+        Rebuilds the group's missing packet if the parity packet and all but one data packet have arrived.
+
+        Args:
+            group (_FEC_Group): The group.
+
+        Returns:
+            bytes | None: The rebuilt payload, or None if there is nothing to rebuild (yet).
+        """
+
+        size, length_parity, parity = group.parity
+        missing = [index for index in range(size) if index not in group.payloads]
+
+        if len(missing) != 1 or missing[0] in group.delivered: return None
+
+        value = int.from_bytes(parity, "little")
+        length = length_parity
+
+        for payload in group.payloads.values():
+            value ^= int.from_bytes(payload, "little")
+            length ^= len(payload)
+
+        group.payloads[missing[0]] = payload = value.to_bytes(length, "little")
+        group.delivered.add(missing[0])
+        self.recovered_count += 1
+
+        return payload
+
+    def packet_handler_for(self, data: bytes | bytearray | memoryview, address: tuple | None=None) -> None:
+        """
+        Packet handler installed on the communicator. Strips the FEC header, delivers data packets and repairs groups.
+
+        Args:
+            data (bytes | bytearray | memoryview): The recieved datagram.
+            address (tuple | None, optional): Source address, when recieving with recieve_all.
+        """
+
+        if len(data) < fec_header.size: return  # not an FEC packet
+
+        kind, size, index, number, length = fec_header.unpack_from(data)
+        payload = bytes(data[fec_header.size:])  # kept for repairs, so copied out of any reused buffer
+
+        # Group state is updated under the lock, but the handler runs outside it, so threaded handling stays parallel
+        with self._lock:
+            group = self._group(address, number)
+
+            if kind == FEC_PARITY:
+                group.parity = (size, length, payload)
+                payload = None
+            elif index in group.delivered:
+                self.duplicate_count += 1
+                return
+            else:
+                group.payloads[index] = payload
+                group.delivered.add(index)
+
+            rebuilt = self._repair(group) if group.parity is not None else None
+            self.delivered_count += (payload is not None) + (rebuilt is not None)
+
+            # Nothing left to rebuild, so the payloads needn't wait for the group to be forgotten
+            if group.parity is not None and len(group.delivered) == group.parity[0]: group.payloads.clear()
+
+        if payload is not None: self._deliver(payload, address)
+        if rebuilt is not None: self._deliver(rebuilt, address)
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: The delivered, recovered, unrecoverable, duplicate, parity sent and injected drop counts.
+        """
+
+        return {
+            "delivered": self.delivered_count,
+            "recovered": self.recovered_count,
+            "unrecoverable": self.unrecoverable_count,
+            "duplicates": self.duplicate_count,
+            "parity_sent": self.parity_sent,
+            "injected_drops": self.injected_drops,
+        }
@@ -0,0 +1,65 @@
+# SLVROV Oct 2026
+
+import random
+from time import perf_counter_ns
+from .i2c_tools import I2C_Bus
+from .i2c_sim_tools import Simulated_I2C_Backend, Simulated_PCA9685
+from .pca9685 import PCA9685
+
+
+def run_pca9685_bench(refreshes: int=1000, changed: int=4, latency: float=100e-6, byte_time: float=25e-6,
+                      seed: int=0) -> list[dict]:
+    """Count the bus traffic of 16-channel PCA9685 refreshes on a simulated bus, for each way of writing them.
+
+    Every refresh sets all 16 channels, with ``changed`` of them moved to a new pulse length, as a control loop with
+    mostly steady thrusters would. Methods compared: ``write_duty_cycle`` per pin, ``write_duty_cycles``, and
+    ``write_duty_cycles`` with the register shadow. Bus time is simulated (``latency`` per transaction plus
+    ``byte_time`` per byte, about 25e-6 at 400 kHz), so this runs at full speed on any machine.
+
+    Args:
+        refreshes (int): Refreshes per method.
+        changed (int): Channels changed per refresh, 0 - 16.
+        latency (float): Simulated fixed cost per transaction, in seconds.
+        byte_time (float): Simulated cost per byte, in seconds.
+        seed (int): Seed for the pulse lengths, so every method writes the same sequence.
+
+    Returns:
+        list[dict]: One entry per method with refreshes, transactions_per_refresh, bytes_per_refresh,
+        bus_us_per_refresh and cpu_us_per_refresh (driver overhead, simulator included).
+    """
+
+    results = []
+
+    for method in ("write_duty_cycle", "write_duty_cycles", "write_duty_cycles_shadowed"):
+        backend = Simulated_I2C_Backend({0x40: Simulated_PCA9685()}, latency, byte_time, realtime=False, log_size=0)
+        driver = PCA9685(I2C_Bus(1, backend=backend), shadow=method == "write_duty_cycles_shadowed")
+
+        pulse_lengths = {pin_number: 1500.0 for pin_number in range(16)}
+        driver.write_duty_cycles(pulse_lengths)
+        backend.clear()
+
+        generator = random.Random(seed)
+        start = perf_counter_ns()
+
+        for _ in range(refreshes):
+            for pin_number in generator.sample(range(16), changed): pulse_lengths[pin_number] = generator.uniform(1100, 1900)
+
+            if method == "write_duty_cycle":
+                for pin_number, pulse_length in pulse_lengths.items(): driver.write_duty_cycle(pin_number, pulse_length)
+
+            else: driver.write_duty_cycles(pulse_lengths)
+
+        cpu_seconds = (perf_counter_ns() - start) / 1e9
+        stats = backend.snapshot()
+        driver.bus.close()
+
+        results.append({
+            "key": method,
+            "refreshes": refreshes,
+            "transactions_per_refresh": stats["transactions"] / refreshes,
+            "bytes_per_refresh": stats["bytes"] / refreshes,
+            "bus_us_per_refresh": stats["busy_seconds"] / refreshes * 1e6,
+            "cpu_us_per_refresh": cpu_seconds / refreshes * 1e6,
+        })
+
+    return results
@@ -0,0 +1,433 @@
+# SLVROV Oct 2026
+
+import errno
+import threading
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter, sleep
+from .i2c_tools import I2C_M_RD, I2C_TRANSFER_MAX_MSGS, I2C_BLOCK_MAX_LEN
+
+
+@dataclass
+class I2C_Transaction:
+    """One logged transaction on a Simulated_I2C_Backend.
+
+    Attributes:
+        time (float): perf_counter() when the transaction started.
+        kind (str): Backend function called, e.g. ``"write_byte"`` or ``"transfer"``.
+        messages (list[tuple[int, int, bytes]]): ``(address, flags, data)`` of every message on the wire. Writes
+            start with the register byte; reads hold the bytes returned.
+        seconds (float): Simulated bus time the transaction took.
+    """
+
+    time: float
+    kind: str
+    messages: list[tuple[int, int, bytes]]
+    seconds: float
+
+
+class Simulated_I2C_Device:
+    """
+    Register-level model of an I2C slave with 256 byte registers and a register pointer.
+
+    A write message sets the pointer from its first byte, then stores the rest of its bytes from there; a read
+    message returns bytes from the pointer. The pointer moves on after every byte, as set by `next_register`.
+    Subclasses model device behavior by overriding `next_register`, `write_register` and `read_register`.
+
+    Attributes:
+        registers (bytearray): Register values.
+        pointer (int): Register the next byte is read from or written to.
+    """
+
+    def __init__(self, registers: dict[int, int] | None=None):
+        """
+        Args:
+            registers (dict[int, int] | None, optional): Power-on register values. Others start at 0.
+        """
+
+        self.registers = bytearray(256)
+        for register, value in (registers or {}).items(): self.registers[register] = value
+
+        self.pointer = 0
+
+    def next_register(self, register: int) -> int:
+        """
+        Args:
+            register (int): Register just read or written.
+
+        Returns:
+            int: Register the pointer moves to. The default auto-increments, wrapping at 0xFF.
+        """
+
+        return (register + 1) & 0xFF
+
+    def write_register(self, register: int, value: int) -> None:
+        """
+        Args:
+            register (int): Register written.
+            value (int): Byte written.
+        """
+
+        self.registers[register] = value
+
+    def read_register(self, register: int) -> int:
+        """
+        Args:
+            register (int): Register read.
+
+        Returns:
+            int: Byte returned to the master.
+        """
+
+        return self.registers[register]
+
+    def write(self, data: bytes) -> None:
+        """
+        Handles a write message.
+
+        Args:
+            data (bytes): Register byte, then the bytes to store from it onwards.
+        """
+
+        if not data: return
+
+        self.pointer = data[0]
+
+        for value in data[1:]:
+            self.write_register(self.pointer, value)
+            self.pointer = self.next_register(self.pointer)
+
+    def read(self, length: int) -> bytes:
+        """
+        Handles a read message.
+
+        Args:
+            length (int): Bytes to read.
+
+        Returns:
+            bytes: Bytes from the pointer onwards.
+        """
+
+        values = bytearray(length)
+
+        for index in range(length):
+            values[index] = self.read_register(self.pointer)
+            self.pointer = self.next_register(self.pointer)
+
+        return bytes(values)
+
+
+class Simulated_PCA9685(Simulated_I2C_Device):
+    """
+    Register-level model of a PCA9685 PWM controller.
+
+    Models the parts of the datasheet the drivers rely on: MODE1 powers up with SLEEP set, PRE_SCALE only takes
+    writes while asleep, the pointer only auto-increments with MODE1 AI set (rolling over from LED15_OFF_H to
+    MODE1), the ALL_LED registers write every channel and read back as 0, and RESTART is set when sleeping with
+    outputs on and cleared by writing it as 1. Output timing itself is not simulated.
+
+    Attributes:
+        registers (bytearray): Register values.
+        pointer (int): Register the next byte is read from or written to.
+
+    Key Methods:
+        pwm_frequency() -> float: Output frequency set by PRE_SCALE.
+        duty_cycle(pin_number) -> tuple[int, int]: ON and OFF counts of a channel.
+        pulse_length(pin_number) -> float: "on" time of a channel, in μs.
+    """
+
+    MODE1 = 0x00
+    LED0_ON_L = 0x06
+    LED15_OFF_H = 0x45
+    ALL_LED_ON_L = 0xFA
+    ALL_LED_OFF_H = 0xFD
+    PRE_SCALE = 0xFE
+
+    MODE1_RESTART = 0b10000000
+    MODE1_AI = 0b00100000
+    MODE1_SLEEP = 0b00010000
+
+    OSCILLATOR_HZ = 25_000_000
+
+    def __init__(self):
+        """Powers up with the datasheet's reset values."""
+
+        super().__init__({self.MODE1: 0x11, 0x01: 0x04, 0x02: 0xE2, 0x03: 0xE4, 0x04: 0xE8, 0x05: 0xE0, self.PRE_SCALE: 0x1E})
+
+        # Every channel powers up fully off (LEDn_OFF_H bit 4)
+        for pin_number in range(16): self.registers[self.LED0_ON_L + 4 * pin_number + 3] = 0x10
+
+    def next_register(self, register: int) -> int:
+        if not self.registers[self.MODE1] & self.MODE1_AI: return register
+        if register == self.LED15_OFF_H: return self.MODE1
+
+        return (register + 1) & 0xFF
+
+    def write_register(self, register: int, value: int) -> None:
+        if register == self.MODE1:
+            mode1 = self.registers[self.MODE1]
+            restart = mode1 & self.MODE1_RESTART
+
+            if value & self.MODE1_RESTART: restart = 0  # writing 1 clears it
+            elif value & self.MODE1_SLEEP and not mode1 & self.MODE1_SLEEP and self._outputs_on(): restart = self.MODE1_RESTART
+
+            self.registers[self.MODE1] = (value & ~self.MODE1_RESTART) | restart
+
+        elif register == self.PRE_SCALE:
+            if self.registers[self.MODE1] & self.MODE1_SLEEP: self.registers[register] = max(3, value)  # values below 3 read as 3
+
+        elif self.ALL_LED_ON_L <= register <= self.ALL_LED_OFF_H:
+            for pin_number in range(16): self.registers[self.LED0_ON_L + 4 * pin_number + register - self.ALL_LED_ON_L] = value
+
+        else: self.registers[register] = value
+
+    def read_register(self, register: int) -> int:
+        if self.ALL_LED_ON_L <= register <= self.ALL_LED_OFF_H: return 0
+        return self.registers[register]
+
+    def _outputs_on(self) -> bool:
+        """
+        Returns:
+            bool: True if any channel's output is not fully off.
+        """
+
+        return any(self.duty_cycle(pin_number)[1] for pin_number in range(16))
+
+    def pwm_frequency(self) -> float:
+        """
+        Returns:
+            float: Output frequency set by PRE_SCALE, in Hz.
+        """
+
+        return self.OSCILLATOR_HZ / (4096 * (self.registers[self.PRE_SCALE] + 1))
+
+    def duty_cycle(self, pin_number: int) -> tuple[int, int]:
+        """
+        Args:
+            pin_number (int): Channel, 0 - 15.
+
+        Returns:
+            tuple[int, int]: ON and OFF counts (0 - 4095). (4096, 4096) if the full on bit is set, (0, 0) if full off.
+        """
+
+        on_l, on_h, off_l, off_h = self.registers[self.LED0_ON_L + 4 * pin_number:self.LED0_ON_L + 4 * pin_number + 4]
+
+        if off_h & 0x10: return 0, 0  # full off wins over full on
+        if on_h & 0x10: return 4096, 4096
+
+        return on_l | (on_h & 0x0F) << 8, off_l | (off_h & 0x0F) << 8
+
+    def pulse_length(self, pin_number: int) -> float:
+        """
+        Args:
+            pin_number (int): Channel, 0 - 15.
+
+        Returns:
+            float: "on" time per PWM cycle, in μs.
+        """
+
+        on, off = self.duty_cycle(pin_number)
+        if on == 4096: return 1_000_000 / self.pwm_frequency()
+
+        return ((off - on) % 4096) / 4096 * 1_000_000 / self.pwm_frequency()
+
+
+class Simulated_I2C_Backend:
+    """
+    In-process stand-in for the ``pi2c_tools`` bindings, for running I2C drivers without hardware.
+
+    Pass it as ``I2C_Bus(1, backend=Simulated_I2C_Backend({0x40: Simulated_PCA9685()}))``. Every transaction is
+    logged and costs ``latency`` plus ``byte_time`` per byte on the wire (address and register bytes included).
+    With ``realtime`` the calling thread sleeps for that long, otherwise it is only added to ``busy_seconds``, so
+    benchmarks can count simulated bus time without waiting for it.
+
+        backend = Simulated_I2C_Backend({0x40: Simulated_PCA9685()}, latency=100e-6, realtime=False)
+        driver = PCA9685(I2C_Bus(1, backend=backend))
+        driver.write_duty_cycles({pin: 1500 for pin in range(16)})
+        backend.snapshot()["transactions"]
+
+    Attributes:
+        devices (dict[int, Simulated_I2C_Device]): Devices by address.
+        latency (float): Fixed cost of every transaction, in seconds.
+        byte_time (float): Cost of every byte on the wire, in seconds (about 25e-6 at 400 kHz).
+        realtime (bool): Sleep for the simulated time of each transaction.
+        log (deque[I2C_Transaction]): The most recent transactions.
+        transactions (int): Transactions run.
+        bytes_transferred (int): Bytes on the wire, address and register bytes included.
+        busy_seconds (float): Total simulated bus time.
+
+    Key Methods:
+        clear() -> None: Clears the log and counters.
+        snapshot() -> dict: Returns the counters, with transactions by kind.
+    """
+
+    def __init__(self, devices: dict[int, Simulated_I2C_Device] | None=None, latency: float=0.0, byte_time: float=0.0,
+                 realtime: bool=True, log_size: int | None=10_000):
+        """
+        Args:
+            devices (dict[int, Simulated_I2C_Device] | None, optional): Devices by address. Defaults to none.
+            latency (float, optional): Fixed cost of every transaction, in seconds. Defaults to 0.0.
+            byte_time (float, optional): Cost of every byte on the wire, in seconds. Defaults to 0.0.
+            realtime (bool, optional): Sleep for the simulated time of each transaction. Defaults to True.
+            log_size (int | None, optional): Transactions kept in the log, or None for all. Defaults to 10000.
+        """
+
+        self.devices = dict(devices or {})
+        self.latency = latency
+        self.byte_time = byte_time
+        self.realtime = realtime
+
+        self.log = deque(maxlen=log_size)
+        self.transactions = 0
+        self.bytes_transferred = 0
+        self.busy_seconds = 0.0
+        self._by_kind = {}
+
+        self._handles = set()
+        self._next_handle = 3
+        self._lock = threading.Lock()  # the bus runs one transaction at a time
+
+    def i2c_open_bus(self, path: str) -> int:
+        """
+        Args:
+            path (str): Device path. Only used for the caller's bookkeeping.
+
+        Returns:
+            int: A fake file descriptor.
+        """
+
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            self._handles.add(handle)
+
+        return handle
+
+    def i2c_close_bus(self, bus: int) -> None:
+        """
+        Args:
+            bus (int): Handle from i2c_open_bus.
+        """
+
+        with self._lock: self._handles.discard(bus)
+
+    def _run(self, bus: int, kind: str, messages: list[tuple[int, int, bytes | int]]) -> list[bytes]:
+        """
+        Runs messages back to back as one transaction.
+
+        Args:
+            bus (int): Handle from i2c_open_bus.
+            kind (str): Name logged for the transaction.
+            messages (list[tuple[int, int, bytes | int]]): ``(address, flags, data)`` for writes and
+                ``(address, flags, length)`` for reads.
+
+        Returns:
+            list[bytes]: Bytes read, one entry per read message.
+
+        Raises:
+            OSError: EBADF for a closed handle, EREMOTEIO if no device answers at an address.
+        """
+
+        with self._lock:
+            if bus not in self._handles: raise OSError(errno.EBADF, "Simulated I2C bus is not open")
+
+            started = perf_counter()
+            logged = []
+            results = []
+
+            for address, flags, data in messages:
+                device = self.devices.get(address)
+                if device is None: raise OSError(errno.EREMOTEIO, f"No simulated device at address {address:#04x}")
+
+                if flags & I2C_M_RD:
+                    data = device.read(data)
+                    results.append(data)
+
+                else:
+                    data = bytes(data)
+                    device.write(data)
+
+                logged.append((address, flags, data))
+
+            wire_bytes = sum(1 + len(data) for _, _, data in logged)
+            seconds = self.latency + self.byte_time * wire_bytes
+
+            self.log.append(I2C_Transaction(started, kind, logged, seconds))
+            self.transactions += 1
+            self.bytes_transferred += wire_bytes
+            self.busy_seconds += seconds
+            self._by_kind[kind] = self._by_kind.get(kind, 0) + 1
+
+            # Sleeping with the lock held keeps concurrent callers serialized, like the real bus
+            if self.realtime and seconds > 0: sleep(seconds)
+
+        return results
+
+    def i2c_write_byte(self, bus: int, address: int, register: int, value: int) -> None:
+        """Writes one register, as pi2c_tools.i2c_write_byte."""
+
+        self._run(bus, "write_byte", [(address, 0, bytes((register, value)))])
+
+    def i2c_read_byte(self, bus: int, address: int, register: int) -> int:
+        """Reads one register, as pi2c_tools.i2c_read_byte."""
+
+        return self._run(bus, "read_byte", [(address, 0, bytes((register,))), (address, I2C_M_RD, 1)])[0][0]
+
+    def i2c_write_block(self, bus: int, address: int, register: int, values: bytes) -> None:
+        """Writes consecutive registers, as pi2c_tools.i2c_write_block."""
+
+        if not 0 < len(values) < I2C_BLOCK_MAX_LEN: raise ValueError(f"Block must be 1 to {I2C_BLOCK_MAX_LEN - 1} bytes")
+        self._run(bus, "write_block", [(address, 0, bytes((register,)) + bytes(values))])
+
+    def i2c_read_block(self, bus: int, address: int, register: int, length: int) -> bytes:
+        """Reads consecutive registers, as pi2c_tools.i2c_read_block."""
+
+        if not 0 < length <= I2C_BLOCK_MAX_LEN: raise ValueError(f"Block must be 1 to {I2C_BLOCK_MAX_LEN} bytes")
+        return self._run(bus, "read_block", [(address, 0, bytes((register,))), (address, I2C_M_RD, length)])[0]
+
+    def i2c_transfer(self, bus: int, messages: list[tuple[int, int, bytes | bytearray | memoryview]]) -> int:
+        """
+        Runs messages as one transaction. Read buffers are filled in place, as with the C extension.
+
+        Args:
+            bus (int): Handle from i2c_open_bus.
+            messages (list[tuple[int, int, bytes | bytearray | memoryview]]): ``(address, flags, buffer)`` messages.
+
+        Returns:
+            int: Number of messages run.
+        """
+
+        if not 0 < len(messages) <= I2C_TRANSFER_MAX_MSGS:
+            raise ValueError(f"Between 1 and {I2C_TRANSFER_MAX_MSGS} messages can be transferred at once")
+
+        wire = [(address, flags, len(buffer) if flags & I2C_M_RD else buffer) for address, flags, buffer in messages]
+        reads = iter(self._run(bus, "transfer", wire))
+
+        for address, flags, buffer in messages:
+            if flags & I2C_M_RD: memoryview(buffer).cast("B")[:] = next(reads)
+
+        return len(messages)
+
+    def clear(self) -> None:
+        """Clears the log and counters."""
+
+        with self._lock:
+            self.log.clear()
+            self.transactions = 0
+            self.bytes_transferred = 0
+            self.busy_seconds = 0.0
+            self._by_kind = {}
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: "transactions", "bytes", "busy_seconds" and "by_kind" (transactions by backend function).
+        """
+
+        with self._lock:
+            return {
+                "transactions": self.transactions,
+                "bytes": self.bytes_transferred,
+                "busy_seconds": self.busy_seconds,
+                "by_kind": dict(self._by_kind),
+            }
@@ -1,24 +1,68 @@
+import asyncio
+import heapq
+import threading
+from concurrent.futures import Future
 from .misc_tools import fits_in_bits, at_exit
-from .pi2c_tools import *
+
+try:
+    from . import pi2c_tools
+    from .pi2c_tools import I2C_M_RD, I2C_TRANSFER_MAX_MSGS, I2C_BLOCK_MAX_LEN
+except ImportError:  # C extension not built (see Makefile); only simulated backends (see i2c_sim_tools) are available
+    pi2c_tools = None
+    I2C_M_RD = 0x0001
+    I2C_TRANSFER_MAX_MSGS = 42
+    I2C_BLOCK_MAX_LEN = 8192
+
+i2c_priorities = {"control": 0, "sensor": 1, "background": 2}  # lower runs first on an I2C_Bus_Worker
 
 
 class I2C_Bus:
-    """Wrapper around the low-level I2C bus bindings."""
+    """Wrapper around the low-level I2C bus bindings.
+
+    The bindings are the ``pi2c_tools`` C extension by default. Any object with the same ``i2c_*`` functions can be
+    passed as ``backend`` instead, e.g. ``i2c_sim_tools.Simulated_I2C_Backend`` to run drivers without hardware.
+
+    Transactions are serialized with a lock, so threads sharing the bus can't interleave them. For priorities and
+    non-blocking calls, start a worker thread that owns the bus with ``start_worker``.
+    """
 
-    def __init__(self, bus: int, target_address: int | None = None):
+    def __init__(self, bus: int, target_address: int | None = None, backend=None):
         """Open an I2C bus and optionally set a default slave address.
 
         Args:
             bus (int): I2C bus number.
             target_address (int | None): Default slave address for read and write calls.
+            backend: Object providing the ``pi2c_tools`` functions. Defaults to ``pi2c_tools`` itself.
+
+        Raises:
+            Exception: If no backend is given and the C extension is not built.
         """
 
+        if backend is None: backend = pi2c_tools
+        if backend is None: raise Exception("pi2c_tools is not built (run make) and no backend was given.")
+
+        self.backend = backend
         self.bus_number = bus
-        self.bus = i2c_open_bus(f"/dev/i2c-{bus}")
+        self.bus = backend.i2c_open_bus(f"/dev/i2c-{bus}")
 
         self.target_address = target_address
 
-        at_exit(self.close)
+        self.worker = None
+        self._lock = threading.Lock()
+
+        if backend is pi2c_tools: at_exit(self.close)  # simulated buses hold no OS handle, so they aren't closed at exit
+
+    def start_worker(self) -> "I2C_Bus_Worker":
+        """Start a worker thread that runs this bus's queued transactions in priority order.
+
+        Returns:
+            I2C_Bus_Worker: The running worker. Calling again returns the same one.
+        """
+
+        if self.worker is None: self.worker = I2C_Bus_Worker(self)
+        self.worker.start()
+
+        return self.worker
 
     def write_byte_to(self, register: int, value: int, address: int | None = None):
         """Write a byte to a register on a target device.
@@ -39,7 +83,7 @@ class I2C_Bus:
         if not fits_in_bits(register, 8, False): raise Exception(f"Invalid register. Register value {register} too big.")
         if not fits_in_bits(value, 8): raise Exception(f"Value {value} is too big.")
 
-        i2c_write_byte(self.bus, address, register, value)
+        with self._lock: self.backend.i2c_write_byte(self.bus, address, register, value)
 
     def read_byte_from(self, register: int, address: int | None = None) -> int:
         """Read a byte from a register on a target device.
@@ -61,14 +105,80 @@ class I2C_Bus:
 
         if not fits_in_bits(register, 8, False): raise Exception(f"Invalid register. Register value {register} too big.")
 
-        return i2c_read_byte(self.bus, address, register)
+        with self._lock: return self.backend.i2c_read_byte(self.bus, address, register)
+
+    def write_block_to(self, register: int, values: bytes | bytearray | list[int], address: int | None = None):
+        """Write consecutive registers, starting at ``register``, in a single bus transaction.
+
+        The device must auto-increment its register pointer (e.g. PCA9685 with MODE1 AI set).
+
+        Args:
+            register (int): First register address to write.
+            values (bytes | bytearray | list[int]): Byte values for ``register``, ``register + 1``, and so on.
+            address (int | None): Override slave address.
+
+        Raises:
+            ValueError: If no target address is available, a value is not a byte, or the block is empty or too long.
+            Exception: If the register is out of range.
+        """
+
+        if address is None: address = self.target_address
+        if address is None: raise ValueError("No target address set and no address provided for write operation.")
+
+        if not fits_in_bits(register, 8, False): raise Exception(f"Invalid register. Register value {register} too big.")
+
+        # The register address shares the message with the values, and a message holds at most I2C_BLOCK_MAX_LEN bytes
+        if not 0 < len(values) < I2C_BLOCK_MAX_LEN: raise ValueError(f"Block must be 1 to {I2C_BLOCK_MAX_LEN - 1} bytes")
+
+        with self._lock: self.backend.i2c_write_block(self.bus, address, register, bytes(values))
+
+    def read_block_from(self, register: int, length: int, address: int | None = None) -> bytes:
+        """Read consecutive registers, starting at ``register``, in a single bus transaction.
+
+        Args:
+            register (int): First register address to read.
+            length (int): Number of registers to read.
+            address (int | None): Override slave address.
+
+        Returns:
+            bytes: Values of ``register``, ``register + 1``, and so on.
+
+        Raises:
+            ValueError: If no target address is available or length is out of range.
+            Exception: If the register is out of range.
+        """
+
+        if address is None: address = self.target_address
+        if address is None: raise ValueError("No target address set and no address provided for read operation.")
+
+        if not fits_in_bits(register, 8, False): raise Exception(f"Invalid register. Register value {register} too big.")
+
+        with self._lock: return self.backend.i2c_read_block(self.bus, address, register, length)
+
+    def transfer(self, messages: list[tuple[int, int, bytes | bytearray | memoryview]]) -> int:
+        """Run several I2C messages in one ioctl, back to back with repeated starts.
+
+        Each message is ``(address, flags, buffer)``. Writes send ``buffer``; reads (``flags`` including ``I2C_M_RD``)
+        fill ``buffer``, which must be writable (e.g. a ``bytearray``). Use this to update several devices, or
+        several register blocks of one device, for the cost of a single syscall.
+
+        Args:
+            messages (list[tuple[int, int, bytes | bytearray | memoryview]]): Up to ``I2C_TRANSFER_MAX_MSGS`` messages.
+
+        Returns:
+            int: Number of messages the kernel completed.
+        """
+
+        with self._lock: return self.backend.i2c_transfer(self.bus, messages)
 
     def close(self):
-        """Close the open I2C bus handle if one exists."""
+        """Stop the worker, if started, and close the open I2C bus handle if one exists."""
+
+        if self.worker is not None: self.worker.stop()
 
         if self.bus is not None:
-            print("at_exit: Closing I2C bus...")
-            i2c_close_bus(self.bus)
+            if self.backend is pi2c_tools: print("at_exit: Closing I2C bus...")
+            with self._lock: self.backend.i2c_close_bus(self.bus)
             self.bus = None
 
     def open(self, bus: int | None = None):
@@ -84,23 +194,430 @@ class I2C_Bus:
         if bus is not None: self.bus_number = bus
         if self.bus is not None: raise Exception("Bus is already open.")
 
-        self.bus = i2c_open_bus(f"dev/i2c-{self.bus_number}")
+        self.bus = self.backend.i2c_open_bus(f"/dev/i2c-{self.bus_number}")
 
 
-class I2C_Slave:
-    """Base helper for devices addressed on an ``I2C_Bus``."""
+class I2C_Future(Future):
+    """A ``concurrent.futures.Future`` that can also be awaited from asyncio code, e.g. ``await worker.read_byte_from(0)``."""
+
+    def __await__(self):
+        return asyncio.wrap_future(self).__await__()
+
+
+class I2C_Bus_Worker:
+    """
+    Worker thread that owns an I2C_Bus and runs every queued transaction on it, one at a time.
+
+    Transactions are queued with a priority class from `i2c_priorities` and run highest priority first, in order
+    within a class, so a thruster update queued behind a batch of sensor reads goes out next. A write queued while
+    an earlier write to the same register (or block) at the same priority is still waiting is merged into it, as
+    long as nothing else was queued for that device and class in between: the earlier slot sends the newest values
+    and both handles complete together. Transactions of different classes can
+    therefore run in a different order than they were queued; use one class for writes and reads that depend on each
+    other.
+
+    Every call returns an I2C_Future, which works as a ``concurrent.futures.Future`` and is awaitable from asyncio.
+    The C calls release the GIL, so Python code keeps running while the worker waits on the bus. Drivers written
+    against I2C_Bus can use a worker through `client`:
+
+        worker = I2C_Bus(1).start_worker()
+        thrusters = PCA9685(worker.client("control"))
+        depth = await worker.read_block_from(0x00, 3, address=0x76, priority="sensor")
+
+    Attributes:
+        bus (I2C_Bus): The bus transactions run on.
+        running (bool): Indicates if the worker thread is running.
+        completed_by_priority (dict[str, int]): Transactions run, by priority class.
+        merged_writes (int): Writes merged into an earlier queued write.
+
+    Key Methods:
+        write_byte_to / read_byte_from / write_block_to / read_block_from / transfer -> I2C_Future: Queue a
+            transaction; arguments as on I2C_Bus, plus priority.
+        client(priority="control") -> I2C_Bus_Client: Blocking I2C_Bus-like handle for drivers.
+        start() -> None: Starts the worker thread.
+        stop(cancel_pending=False) -> None: Stops the worker thread once queued transactions have run.
+        snapshot() -> dict: Returns queue and completion counts.
+    """
+
+    def __init__(self, bus: I2C_Bus):
+        """
+        Initializes a stopped worker. Use I2C_Bus.start_worker rather than creating one directly.
+
+        Args:
+            bus (I2C_Bus): The bus transactions run on.
+        """
+
+        self.bus = bus
+
+        self.completed_by_priority = {priority: 0 for priority in i2c_priorities}
+        self.merged_writes = 0
+
+        self._heap = []
+        self._sequence = 0
+        self._queued_writes = {}  # (priority, kind, address, register, length) -> waiting write request
+        self._newest = {}  # (priority, address) -> newest waiting request for that device
+        self._condition = threading.Condition()
+
+        self.running = False
+        self._thread = None
+        self._stopping = False
+
+        at_exit(self.stop)
+
+    def _queue(self, priority: str, function, arguments: list, addresses: tuple, merge_key: tuple | None=None) -> I2C_Future:
+        """
+        Queues one transaction, merging it into a waiting write with the same merge_key if there is one and it is
+        still the newest transaction queued for its device, so a merged write never runs ahead of later ones.
+
+        Args:
+            priority (str): Priority class, one of `i2c_priorities`.
+            function (Callable): Bound I2C_Bus method to run.
+            arguments (list): Its arguments.
+            addresses (tuple): Slave addresses the transaction talks to.
+            merge_key (tuple | None, optional): Writes with equal keys replace each other's values while queued.
+
+        Returns:
+            I2C_Future: Resolves with the transaction's result or exception.
+
+        Raises:
+            Exception: If the priority is unknown.
+            RuntimeError: If the worker is not running, like ThreadPoolExecutor.submit after shutdown.
+        """
+
+        if priority not in i2c_priorities: raise Exception(f"Unknown I2C priority {priority}. Select from {tuple(i2c_priorities)}")
+
+        future = I2C_Future()
+
+        with self._condition:
+            if not self.running or self._stopping: raise RuntimeError("I2C bus worker is not running")
+
+            if merge_key is not None:
+                merge_key = (priority, *merge_key)
+                request = self._queued_writes.get(merge_key)
+
+                if request is not None and all(self._newest.get((priority, address)) is request for address in addresses):
+                    request[1] = arguments
+                    request[2].append(future)
+                    self.merged_writes += 1
+                    return future
+
+            request = [function, arguments, [future], merge_key, addresses]
+            if merge_key is not None: self._queued_writes[merge_key] = request
+            for address in addresses: self._newest[priority, address] = request
+
+            self._sequence += 1
+            heapq.heappush(self._heap, (i2c_priorities[priority], self._sequence, priority, request))
+            self._condition.notify()
+
+        return future
+
+    def _run(self) -> None:
+        """Worker loop: runs the highest priority queued transaction until stopped and drained."""
+
+        while True:
+            with self._condition:
+                while not self._heap:
+                    if self._stopping: return
+                    self._condition.wait()
+
+                _, _, priority, request = heapq.heappop(self._heap)
+                function, arguments, futures, merge_key, addresses = request
+
+                # Later writes queue a new request
+                if self._queued_writes.get(merge_key) is request: del self._queued_writes[merge_key]
+                for address in addresses:
+                    if self._newest.get((priority, address)) is request: del self._newest[priority, address]
+
+            futures = [future for future in futures if future.set_running_or_notify_cancel()]
+            if not futures: continue
+
+            try: result = function(*arguments)
+            except BaseException as error:
+                for future in futures: future.set_exception(error)
+            else:
+                for future in futures: future.set_result(result)
+
+            with self._condition: self.completed_by_priority[priority] += 1
+
+    def write_byte_to(self, register: int, value: int, address: int | None=None, priority: str="control") -> I2C_Future:
+        """
+        Queues I2C_Bus.write_byte_to. Merges with a queued write of the same register.
+
+        Returns:
+            I2C_Future: Resolves with None once written.
+        """
+
+        if address is None: address = self.bus.target_address
+        return self._queue(priority, self.bus.write_byte_to, [register, value, address], (address,), ("byte", address, register))
+
+    def read_byte_from(self, register: int, address: int | None=None, priority: str="sensor") -> I2C_Future:
+        """
+        Queues I2C_Bus.read_byte_from.
+
+        Returns:
+            I2C_Future: Resolves with the byte read.
+        """
+
+        if address is None: address = self.bus.target_address
+        return self._queue(priority, self.bus.read_byte_from, [register, address], (address,))
+
+    def write_block_to(self, register: int, values: bytes | bytearray | list[int], address: int | None=None,
+                       priority: str="control") -> I2C_Future:
+        """
+        Queues I2C_Bus.write_block_to. Merges with a queued write of the same register block.
+
+        Returns:
+            I2C_Future: Resolves with None once written.
+        """
+
+        if address is None: address = self.bus.target_address
+        values = bytes(values)  # the caller may reuse its buffer before the write runs
+
+        return self._queue(priority, self.bus.write_block_to, [register, values, address], (address,),
+                           ("block", address, register, len(values)))
+
+    def read_block_from(self, register: int, length: int, address: int | None=None, priority: str="sensor") -> I2C_Future:
+        """
+        Queues I2C_Bus.read_block_from.
 
-    def __init__(self, bus: I2C_Bus, address: int):
+        Returns:
+            I2C_Future: Resolves with the bytes read.
+        """
+
+        if address is None: address = self.bus.target_address
+        return self._queue(priority, self.bus.read_block_from, [register, length, address], (address,))
+
+    def transfer(self, messages: list[tuple[int, int, bytes | bytearray | memoryview]], priority: str="control") -> I2C_Future:
+        """
+        Queues I2C_Bus.transfer. Read buffers are filled by the time the future resolves.
+
+        Returns:
+            I2C_Future: Resolves with the number of messages completed.
+        """
+
+        return self._queue(priority, self.bus.transfer, [messages], tuple({message[0] for message in messages}))
+
+    def client(self, priority: str="control") -> "I2C_Bus_Client":
+        """
+        Args:
+            priority (str, optional): Priority class of the client's transactions. Defaults to "control".
+
+        Returns:
+            I2C_Bus_Client: Handle with the blocking I2C_Bus interface, for drivers such as PCA9685.
+
+        Raises:
+            Exception: If the priority is unknown.
+        """
+
+        if priority not in i2c_priorities: raise Exception(f"Unknown I2C priority {priority}. Select from {tuple(i2c_priorities)}")
+        return I2C_Bus_Client(self, priority)
+
+    def start(self) -> None:
+        """Starts the worker on a background daemon thread."""
+
+        if self.running: return
+
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.running = True
+        self._thread.start()
+
+    def stop(self, cancel_pending: bool=False) -> None:
+        """
+        Stops accepting transactions and stops the thread once the queued ones have run.
+
+        Args:
+            cancel_pending (bool, optional): Cancel queued transactions instead of running them. Defaults to False.
+        """
+
+        if not self.running: return
+
+        with self._condition:
+            self._stopping = True
+
+            if cancel_pending:
+                for _, _, _, (_, _, futures, _, _) in self._heap:
+                    for future in futures: future.cancel()
+
+            self._condition.notify_all()
+
+        if self._thread is not threading.current_thread(): self._thread.join()
+
+        self._thread = None
+        self.running = False
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: "queued" transactions, "merged_writes" and "completed" by priority class.
+        """
+
+        with self._condition:
+            return {
+                "queued": len(self._heap),
+                "merged_writes": self.merged_writes,
+                "completed": dict(self.completed_by_priority),
+            }
+
+
+class I2C_Bus_Client:
+    """
+    Blocking, I2C_Bus-like handle on an I2C_Bus_Worker at one priority. Pass it to drivers in place of the bus, and
+    their transactions are queued on the worker and waited for. Create it with `I2C_Bus_Worker.client`.
+
+    Attributes:
+        worker (I2C_Bus_Worker): The worker transactions are queued on.
+        priority (str): Priority class of this client's transactions.
+    """
+
+    def __init__(self, worker: I2C_Bus_Worker, priority: str):
+        """
+        Args:
+            worker (I2C_Bus_Worker): The worker to queue transactions on.
+            priority (str): Priority class, one of `i2c_priorities`.
+        """
+
+        self.worker = worker
+        self.priority = priority
+
+    @property
+    def target_address(self) -> int | None:
+        """Default slave address of the underlying bus."""
+
+        return self.worker.bus.target_address
+
+    def write_byte_to(self, register: int, value: int, address: int | None=None):
+        """Write a byte to a register, as I2C_Bus.write_byte_to."""
+
+        self.worker.write_byte_to(register, value, address, self.priority).result()
+
+    def read_byte_from(self, register: int, address: int | None=None) -> int:
+        """Read a byte from a register, as I2C_Bus.read_byte_from."""
+
+        return self.worker.read_byte_from(register, address, self.priority).result()
+
+    def write_block_to(self, register: int, values: bytes | bytearray | list[int], address: int | None=None):
+        """Write consecutive registers, as I2C_Bus.write_block_to."""
+
+        self.worker.write_block_to(register, values, address, self.priority).result()
+
+    def read_block_from(self, register: int, length: int, address: int | None=None) -> bytes:
+        """Read consecutive registers, as I2C_Bus.read_block_from."""
+
+        return self.worker.read_block_from(register, length, address, self.priority).result()
+
+    def transfer(self, messages: list[tuple[int, int, bytes | bytearray | memoryview]]) -> int:
+        """Run several messages in one ioctl, as I2C_Bus.transfer."""
+
+        return self.worker.transfer(messages, self.priority).result()
+
+
+class I2C_Slave:
+    """Base helper for devices addressed on an ``I2C_Bus``.
+
+    With ``shadow`` enabled, every value written to or read from the device is remembered. Reads of a remembered
+    register are answered from memory, and writes that would not change a remembered value are skipped, which
+    removes most bus traffic from fixed-rate loops resending steady values. Registers the device changes on its own
+    (status, counters, self-clearing bits) must be marked volatile so they always go to the bus. Call
+    ``invalidate`` after anything that changes registers behind the driver's back, e.g. a device reset or another
+    process writing to it.
+
+    Attributes:
+        bus (I2C_Bus): I2C bus wrapper.
+        address (int): Slave device address.
+        shadow (dict[int, int] | None): Known register values by register, or None if shadowing is off.
+        volatile_registers (set[int]): Registers that bypass the shadow.
+        shadow_reads (int): Reads answered from the shadow.
+        suppressed_writes (int): Register writes skipped because the value was unchanged.
+    """
+
+    def __init__(self, bus: I2C_Bus, address: int, shadow: bool = False, volatile_registers: set[int] | None = None):
         """Store the bus and slave address for a device.
 
         Args:
             bus (I2C_Bus): I2C bus wrapper.
             address (int): Slave device address.
+            shadow (bool): Keep a write-through shadow of the device's registers.
+            volatile_registers (set[int] | None): Registers that must always go to the bus.
         """
 
         self.bus = bus
         self.address = address
 
+        self.shadow = {} if shadow else None
+        self.volatile_registers = set(volatile_registers or ())
+
+        self.shadow_reads = 0
+        self.suppressed_writes = 0
+
+    def set_volatile(self, register: int, volatile: bool = True):
+        """Mark a register as volatile (always read from and written to the bus) or cacheable.
+
+        Args:
+            register (int): Register address.
+            volatile (bool): True to bypass the shadow for this register.
+        """
+
+        if volatile:
+            self.volatile_registers.add(register)
+            if self.shadow is not None: self.shadow.pop(register, None)
+
+        else: self.volatile_registers.discard(register)
+
+    def invalidate(self, register: int | None = None):
+        """Forget shadowed register values, so they are next read from the bus and written unconditionally.
+
+        Args:
+            register (int | None): Register to forget, or None for all of them.
+        """
+
+        if self.shadow is None: return
+
+        if register is None: self.shadow.clear()
+        else: self.shadow.pop(register, None)
+
+    def _remember(self, register: int, values: bytes | bytearray | list[int]):
+        """Store values of ``register`` onwards in the shadow, skipping volatile registers.
+
+        Args:
+            register (int): First register address.
+            values (bytes | bytearray | list[int]): Values of ``register`` onwards.
+        """
+
+        if self.shadow is None: return
+
+        for offset, value in enumerate(values):
+            if register + offset not in self.volatile_registers: self.shadow[register + offset] = value
+
+    def _changed_spans(self, register: int, values: bytes | bytearray | list[int]) -> list[tuple[int, bytes]]:
+        """Split a block write into the runs of registers it would change.
+
+        Unchanged registers between two runs are rewritten anyway when that is cheaper than starting another
+        message, which costs an address and a register byte.
+
+        Args:
+            register (int): First register address.
+            values (bytes | bytearray | list[int]): Values of ``register`` onwards.
+
+        Returns:
+            list[tuple[int, bytes]]: ``(first register, values)`` pairs to write, empty if nothing would change.
+        """
+
+        values = bytes(values)
+        if self.shadow is None: return [(register, values)]
+
+        spans = []  # [first offset, last offset] pairs
+
+        for offset, value in enumerate(values):
+            if register + offset not in self.volatile_registers and self.shadow.get(register + offset) == value: continue
+
+            if spans and offset - spans[-1][1] <= 3: spans[-1][1] = offset
+            else: spans.append([offset, offset])
+
+        self.suppressed_writes += len(values) - sum(last - first + 1 for first, last in spans)
+
+        return [(register + first, values[first:last + 1]) for first, last in spans]
+
     def write_byte(self, register: int, value: int):
         """Write a byte to one of this slave's registers.
 
@@ -112,7 +629,12 @@ class I2C_Slave:
         if not fits_in_bits(register, 8, False): raise Exception(f"Invalid register. Register value {register} too big.")
         if not fits_in_bits(value, 8): Exception(f"Value {value} is too big.")
 
+        if self.shadow is not None and register not in self.volatile_registers and self.shadow.get(register) == value:
+            self.suppressed_writes += 1
+            return
+
         self.bus.write_byte_to(register, value, self.address)
+        self._remember(register, (value,))
 
     def read_byte(self, register: int) -> int:
         """Read a byte from one of this slave's registers.
@@ -126,4 +648,61 @@ class I2C_Slave:
 
         if not fits_in_bits(register, 8, False): raise Exception(f"Invalid register. Register value {register} too big.")
 
-        return self.bus.read_byte_from(register, self.address)
+        if self.shadow is not None and register in self.shadow:
+            self.shadow_reads += 1
+            return self.shadow[register]
+
+        value = self.bus.read_byte_from(register, self.address)
+        self._remember(register, (value,))
+
+        return value
+
+    def write_block(self, register: int, values: bytes | bytearray | list[int]):
+        """Write consecutive registers of this slave in one bus transaction.
+
+        With the shadow on, only the runs of registers that would change are sent, and the write is skipped
+        entirely if nothing would change.
+
+        Args:
+            register (int): First register address to write.
+            values (bytes | bytearray | list[int]): Byte values for ``register`` onwards.
+        """
+
+        self.write_blocks([(register, values)])
+
+    def write_blocks(self, blocks: list[tuple[int, bytes | bytearray | list[int]]]):
+        """Write several register blocks of this slave in one ioctl (see ``I2C_Bus.transfer``).
+
+        Args:
+            blocks (list[tuple[int, bytes | bytearray | list[int]]]): ``(first register, values)`` pairs.
+        """
+
+        spans = [span for register, values in blocks for span in self._changed_spans(register, values)]
+
+        if not spans: return
+        if len(spans) == 1: self.bus.write_block_to(*spans[0], self.address)
+        else: self.bus.transfer([(self.address, 0, bytes((register,)) + values) for register, values in spans])
+
+        for span in spans: self._remember(*span)
+
+    def read_block(self, register: int, length: int) -> bytes:
+        """Read consecutive registers of this slave in one bus transaction.
+
+        The read is answered from the shadow if every register in the block is known.
+
+        Args:
+            register (int): First register address to read.
+            length (int): Number of registers to read.
+
+        Returns:
+            bytes: Values of ``register`` onwards.
+        """
+
+        if self.shadow is not None and all(register + offset in self.shadow for offset in range(length)):
+            self.shadow_reads += length
+            return bytes(self.shadow[register + offset] for offset in range(length))
+
+        values = self.bus.read_block_from(register, length, self.address)
+        self._remember(register, values)
+
+        return values
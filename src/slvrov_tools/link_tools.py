@@ -0,0 +1,426 @@
+# SLVROV Oct 2026
+
+import random
+import struct
+import threading
+from collections import deque
+from time import monotonic_ns
+from typing import Callable
+from .network_tools import UDP_Communicator
+
+LINK_DATA = 0
+LINK_PING = 1
+LINK_PONG = 2
+
+link_header = struct.Struct("!BBIQ")  # kind, stream, sequence, send time (monotonic ns on the sender)
+
+SEQUENCE_MODULUS = 1 << 32
+REPLAY_WINDOW = 64
+
+
+class Sequence_Tracker:
+    """
+    Receiver-side bookkeeping for one (source, stream) sequence number stream: loss, reordering and duplicates.
+
+    Uses a 64 packet sliding bitmap (as in IPsec/DTLS replay protection), so it costs a few integer operations per
+    packet no matter how long the link has been up. Sequence numbers are 32 bits and wrap around.
+
+    A sender that restarts begins again from 0, which looks like a stream of packets far behind the window. After
+    resync_after of those in a row, the tracker assumes a restart and starts over from the current packet.
+
+    Not thread-safe on its own; Link_Layer serializes updates.
+
+    Attributes:
+        highest (int | None): Highest sequence number seen so far.
+        recieved (int): Distinct packets recieved.
+        lost (int): Packets currently missing (skipped over and not yet arrived late).
+        reordered (int): Packets that arrived after a higher sequence number.
+        duplicates (int): Packets recieved more than once.
+        too_old (int): Packets older than the replay window, which cannot be checked for duplication.
+        resync_after (int): Consecutive too_old packets that mean the sender restarted.
+        resyncs (int): Times the tracker started over after a sender restart.
+    """
+
+    def __init__(self, resync_after: int=8):
+        """
+        Initializes an empty tracker.
+
+        Args:
+            resync_after (int, optional): Consecutive too_old packets that mean the sender restarted. Defaults to 8.
+        """
+
+        self.resync_after = resync_after
+        self.resyncs = 0
+        self._too_old_run = 0
+
+        self.highest = None
+        self.window = 0  # bit i set means (highest - i) has been recieved
+
+        self.recieved = 0
+        self.lost = 0
+        self.reordered = 0
+        self.duplicates = 0
+        self.too_old = 0
+
+    def update(self, sequence: int) -> str:
+        """
+        Records a sequence number.
+
+        Args:
+            sequence (int): The packet's sequence number.
+
+        Returns:
+            str: "new" if it is the newest packet so far (or the first after a resync), "late" if it filled an
+            earlier gap, "duplicate" if it was already recieved, or "too_old" if it is behind the replay window.
+        """
+
+        if self.highest is None: return self._restart(sequence)
+
+        ahead = (sequence - self.highest) % SEQUENCE_MODULUS
+
+        if ahead and ahead < SEQUENCE_MODULUS // 2:
+            self._too_old_run = 0
+            self.lost += ahead - 1
+            self.window = ((self.window << ahead) | 1) & ((1 << REPLAY_WINDOW) - 1)
+            self.highest = sequence
+            self.recieved += 1
+            return "new"
+
+        behind = (self.highest - sequence) % SEQUENCE_MODULUS
+
+        if behind >= REPLAY_WINDOW:
+            self._too_old_run += 1
+
+            if self._too_old_run >= self.resync_after:
+                self.resyncs += 1
+                return self._restart(sequence)
+
+            self.too_old += 1
+            return "too_old"
+
+        self._too_old_run = 0
+
+        if self.window & (1 << behind):
+            self.duplicates += 1
+            return "duplicate"
+
+        self.window |= 1 << behind
+        self.recieved += 1
+        self.lost -= 1
+        self.reordered += 1
+        return "late"
+
+    def _restart(self, sequence: int) -> str:
+        """
+        Starts tracking from sequence, forgetting the window.
+
+        Args:
+            sequence (int): The packet's sequence number.
+
+        Returns:
+            str: "new"
+        """
+
+        self._too_old_run = 0
+        self.highest = sequence
+        self.window = 1
+        self.recieved += 1
+        return "new"
+
+    def loss_rate(self) -> float:
+        """
+        Returns:
+            float: Fraction of expected packets that are missing.
+        """
+
+        expected = self.recieved + self.lost
+        return self.lost / expected if expected else 0.0
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: The tracker's counters and loss rate.
+        """
+
+        return {
+            "highest": self.highest,
+            "recieved": self.recieved,
+            "lost": self.lost,
+            "reordered": self.reordered,
+            "duplicates": self.duplicates,
+            "too_old": self.too_old,
+            "resyncs": self.resyncs,
+            "loss_rate": self.loss_rate(),
+        }
+
+
+def _percentile_of(ordered: list[float], percent: float) -> float:
+    """
+    Args:
+        ordered (list[float]): Non-empty, sorted samples.
+        percent (float): Percentile, 0 - 100.
+
+    Returns:
+        float: The nearest-rank percentile.
+    """
+
+    return ordered[min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))]
+
+
+class RTT_Estimator:
+    """
+    Keeps a moving window of round trip time samples and reports percentiles over it.
+
+    Attributes:
+        samples (deque[float]): The most recent RTT samples in seconds.
+        srtt (float | None): Smoothed RTT (RFC 6298 style EWMA, alpha = 1/8), in seconds.
+        last (float | None): Most recent RTT sample in seconds.
+    """
+
+    def __init__(self, window: int=256):
+        """
+        Args:
+            window (int, optional): Number of samples kept for percentiles. Defaults to 256.
+        """
+
+        self.samples = deque(maxlen=window)
+        self.srtt = None
+        self.last = None
+
+    def add(self, rtt: float) -> None:
+        """
+        Args:
+            rtt (float): A round trip time sample in seconds.
+        """
+
+        self.samples.append(rtt)
+        self.last = rtt
+        self.srtt = rtt if self.srtt is None else self.srtt + (rtt - self.srtt) / 8
+
+    def percentile(self, percent: float) -> float | None:
+        """
+        Args:
+            percent (float): Percentile, 0 - 100.
+
+        Returns:
+            float | None: The percentile of the current window in seconds, or None with no samples.
+        """
+
+        if not self.samples: return None
+
+        return _percentile_of(sorted(self.samples), percent)
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: Sample count, min, p50, p90, p99, max, last and smoothed RTT in seconds.
+        """
+
+        if not self.samples: return {"count": 0}
+
+        ordered = sorted(self.samples)
+
+        return {
+            "count": len(ordered),
+            "min": ordered[0],
+            "p50": _percentile_of(ordered, 50),
+            "p90": _percentile_of(ordered, 90),
+            "p99": _percentile_of(ordered, 99),
+            "max": ordered[-1],
+            "last": self.last,
+            "srtt": self.srtt,
+        }
+
+
+class Link_Layer:
+    """
+    An optional header layer for UDP_Communicator that adds per-stream sequence numbers and send timestamps, tracks
+    loss, reordering and duplicates on the receiving side, and measures RTT with ping/pong probes.
+
+    Every datagram gets a 14 byte header (kind, stream, 32-bit sequence, 64-bit send time). The layer installs
+    itself as the communicator's packet handler, answers pings, and passes payloads of data packets on to
+    packet_handler. With drop_stale, late (out-of-order) and duplicate packets are dropped instead of delivered, so a
+    command never overrides a newer one. Both ends of the link must use a Link_Layer. Safe to use with threaded
+    recieves: tracker and counter updates are serialized, and the packet handler runs outside the lock.
+
+        link = Link_Layer(UDP_Communicator("0.0.0.0", 5000), handle_command)
+        link.communicator.recieve_all()
+
+    Attributes:
+        communicator (UDP_Communicator): The wrapped communicator.
+        packet_handler (Callable): Called with (payload, address) -- or just (payload) under recieve_from -- for each delivered packet.
+        drop_stale (bool): Drop late and duplicate packets rather than delivering them.
+        drop_probability (float): Fraction of outgoing packets to silently discard, for testing loss handling.
+        trackers (dict[tuple, Sequence_Tracker]): Receive trackers by (source address, stream).
+        rtt (RTT_Estimator): Round trip times from pong replies.
+        delivered_count (int): Data packets passed to the packet handler.
+        stale_count (int): Data packets dropped as late, duplicate or too old.
+        injected_drops (int): Outgoing packets discarded by drop_probability.
+
+    Key Methods:
+        sendto(data, to_IP, to_port, stream=0) -> None: Sends a data packet with a link header.
+        send(data, stream=0) -> None: Sends a data packet to the connected peer.
+        ping(to_IP=None, to_port=None) -> None: Sends an RTT probe.
+        packet_handler_for(data, address=None) -> None: Installed as the communicator's packet handler.
+        snapshot() -> dict: Returns RTT and per-stream receive statistics.
+    """
+
+    def __init__(self, communicator: UDP_Communicator, packet_handler: Callable, drop_stale: bool=True, rtt_window: int=256,
+                 drop_probability: float=0.0, seed: int | None=None):
+        """
+        Wraps a communicator and installs the link layer as its packet handler.
+
+        Args:
+            communicator (UDP_Communicator): The communicator to wrap.
+            packet_handler (Callable): Handler for delivered payloads.
+            drop_stale (bool, optional): Drop late and duplicate packets. Defaults to True.
+            rtt_window (int, optional): Number of RTT samples kept for percentiles. Defaults to 256.
+            drop_probability (float, optional): Fraction of outgoing packets to discard (test only). Defaults to 0.0.
+            seed (int | None, optional): Seed for the drop injection random generator. Defaults to None.
+        """
+
+        self.communicator = communicator
+        self.packet_handler = packet_handler
+        self.drop_stale = drop_stale
+
+        self.drop_probability = drop_probability
+        self._random = random.Random(seed)
+
+        self.trackers = {}
+        self.rtt = RTT_Estimator(rtt_window)
+
+        self.delivered_count = 0
+        self.stale_count = 0
+        self.injected_drops = 0
+
+        self._next_sequence = {}
+        self._lock = threading.Lock()  # guards sequence numbers and injected_drops when several threads send
+        self._recieve_lock = threading.Lock()  # guards trackers, rtt and the delivery counters across handler threads
+
+        communicator.packet_handler = self.packet_handler_for
+
+    def _header(self, kind: int, stream: int) -> bytes:
+        """
+        Args:
+            kind (int): LINK_DATA or LINK_PING.
+            stream (int): Stream number, 0 - 255.
+
+        Returns:
+            bytes: A header carrying the stream's next sequence number and the current time.
+        """
+
+        with self._lock:
+            key = (kind, stream)
+            sequence = self._next_sequence.get(key, 0)
+            self._next_sequence[key] = (sequence + 1) % SEQUENCE_MODULUS
+
+        return link_header.pack(kind, stream, sequence, monotonic_ns())
+
+    def _transmit(self, packet: bytes, to_IP: str | None, to_port: int | None) -> None:
+        """
+        Args:
+            packet (bytes): Header and payload.
+            to_IP (str | None): Destination IP, or None to use the connected peer.
+            to_port (int | None): Destination port, or None to use the connected peer.
+        """
+
+        if self.drop_probability:
+            with self._lock:
+                dropped = self._random.random() < self.drop_probability
+                if dropped: self.injected_drops += 1
+
+            if dropped: return
+
+        if to_IP is None: self.communicator.send(packet)
+        else: self.communicator.sendto(packet, to_IP, to_port)
+
+    def sendto(self, data: bytes | bytearray, to_IP: str, to_port: int, stream: int=0) -> None:
+        """
+        Sends a data packet to a specific destination.
+
+        Args:
+            data (bytes | bytearray): The payload.
+            to_IP (str): The target IP address.
+            to_port (int): The target port number.
+            stream (int, optional): Stream number (0 - 255). Each stream has its own sequence. Defaults to 0.
+        """
+
+        self._transmit(self._header(LINK_DATA, stream) + data, to_IP, to_port)
+
+    def send(self, data: bytes | bytearray, stream: int=0) -> None:
+        """
+        Sends a data packet to the peer the communicator is connected to.
+
+        Args:
+            data (bytes | bytearray): The payload.
+            stream (int, optional): Stream number (0 - 255). Defaults to 0.
+        """
+
+        self._transmit(self._header(LINK_DATA, stream) + data, None, None)
+
+    def ping(self, to_IP: str | None=None, to_port: int | None=None) -> None:
+        """
+        Sends an RTT probe. The peer's Link_Layer answers with a pong, which adds a sample to `rtt`.
+
+        Args:
+            to_IP (str | None, optional): Target IP. Uses the connected peer if None.
+            to_port (int | None, optional): Target port. Uses the connected peer if None.
+        """
+
+        self._transmit(self._header(LINK_PING, 0), to_IP, to_port)
+
+    def packet_handler_for(self, data: bytes | bytearray | memoryview, address: tuple | None=None) -> None:
+        """
+        Packet handler installed on the communicator. Strips the link header and handles the packet by kind.
+
+        Args:
+            data (bytes | bytearray | memoryview): The recieved datagram.
+            address (tuple | None, optional): Source address, when recieving with recieve_all.
+        """
+
+        if len(data) < link_header.size: return  # not a link layer packet
+
+        kind, stream, sequence, sent_at = link_header.unpack_from(data)
+
+        if kind == LINK_PING:
+            pong = link_header.pack(LINK_PONG, stream, sequence, sent_at) + data[link_header.size:]
+
+            if address is None: self.communicator.send(pong)
+            else: self.communicator.sendto(pong, *address)
+            return
+
+        if kind == LINK_PONG:
+            with self._recieve_lock: self.rtt.add((monotonic_ns() - sent_at) / 1e9)
+            return
+
+        with self._recieve_lock:
+            key = (address, stream)
+            tracker = self.trackers.get(key)
+            if tracker is None: tracker = self.trackers[key] = Sequence_Tracker()
+
+            verdict = tracker.update(sequence)
+            if verdict != "new" and (self.drop_stale or verdict == "duplicate"):
+                self.stale_count += 1
+                return
+
+            self.delivered_count += 1
+
+        payload = data[link_header.size:]
+        if address is None: self.packet_handler(payload)
+        else: self.packet_handler(payload, address)
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: "rtt" (RTT_Estimator.snapshot()), "streams" (Sequence_Tracker.snapshot() by (address, stream)),
+            and the delivered, stale and injected drop counts.
+        """
+
+        with self._recieve_lock:
+            return {
+                "rtt": self.rtt.snapshot(),
+                "streams": {key: tracker.snapshot() for key, tracker in self.trackers.items()},
+                "delivered": self.delivered_count,
+                "stale": self.stale_count,
+                "injected_drops": self.injected_drops,
+            }
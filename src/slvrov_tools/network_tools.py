@@ -1,11 +1,24 @@
 # Caleb Hofschneider SLV ROV 5/2025
 
+import heapq
 import socket
+import struct
 import subprocess
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import traceback
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from time import perf_counter, sleep
+from concurrent.futures import Future, ThreadPoolExecutor
 from .misc_tools import at_exit
 from typing import Callable
 
+try:
+    from .pudp_tools import udp_send_batch, udp_recv_batch
+    HAS_BATCHED_UDP = True
+except ImportError:  # C extension not built (see Makefile) or not running on Linux
+    HAS_BATCHED_UDP = False
+
 protocols_by_transport = {
             "raw": socket.SOCK_RAW,
 
@@ -38,385 +51,3364 @@ protocols_by_transport = {
 
             "quic": socket.SOCK_DGRAM}
 
+handler_queue_policies = ("block", "drop_oldest", "drop_newest", "coalesce")
+handler_priorities = {"control": 0, "telemetry": 1, "debug": 2}  # lower runs first in a shared Handler_Pool
 
-class Network_Communicator:
+# (DSCP code point, SO_PRIORITY) per traffic class. DSCP marks packets for switches and the tether's far end; SO_PRIORITY
+# picks the band of the local egress queue (pfifo_fast/prio qdiscs), so control leaves ahead of queued video
+traffic_classes = {
+    "control": (46, 6),       # EF, expedited forwarding
+    "video": (34, 5),         # AF41
+    "telemetry": (18, 4),     # AF21
+    "best_effort": (0, 0),
+    "bulk": (8, 1),           # CS1, scavenger
+}
+SO_PRIORITY = getattr(socket, "SO_PRIORITY", 12)
+
+# Linux socket options the socket module doesn't export (asm-generic values, as used on the Pi and x86)
+SO_TIMESTAMPNS = getattr(socket, "SO_TIMESTAMPNS", 35)
+SO_RXQ_OVFL = getattr(socket, "SO_RXQ_OVFL", 40)
+kernel_timespec = struct.Struct("@ll")  # struct timespec for SO_TIMESTAMPNS(_OLD): tv_sec, tv_nsec as C longs
+kernel_drop_counter = struct.Struct("@I")  # SO_RXQ_OVFL ancillary data: uint32 drops so far
+
+
+class Handler_Queue:
     """
-    A class to manage socket-based communication using multithreading, with protocol abstraction for various common 
-    network protocols. Designed for both connection-oriented (TCP) and connectionless (UDP) communication patterns.
+    A bounded queue of pending packet handler calls, drained by a limited number of worker tasks.
+
+    Overflow policies (used when the queue holds maxsize entries and another packet arrives):
+        "block": The receiving thread waits until a worker frees a spot.
+        "drop_oldest": The oldest pending packet is discarded to make room.
+        "drop_newest": The incoming packet is discarded.
+        "coalesce": Only the latest pending packet per key (source address) is kept. A newer packet from the same
+            source replaces the pending one in place; a packet from a new source when full drops the oldest entry.
 
     Attributes:
-        IP (str): Local IP address the socket binds to.
-        port (int): Local port number to bind the socket to.
-        protocols_by_transport (dict): Mapping of protocol names (e.g., 'tcp', 'udp', 'http') to socket types.
-        protocol (str): The specified protocol in lowercase, used to resolve socket type.
-        communication_type (int): Socket type (e.g., socket.SOCK_STREAM) based on protocol.
-        packet_handler (Callable): Function used to handle received packets. Defaults to an internal test handler.
-        recieved_count (int): Counter tracking the number of packets received when using the test handler.
-        socket (socket.socket): The underlying bound socket object.
-        bound (bool): Boolean flag indicating if the socket is currently open and bound.
-        to_IP (str): Remote IP address to connect to (used in client mode).
-        to_port (int): Remote port number to connect to.
-        connected (bool): Flag indicating if a connection to a remote host is active.
-        executor (ThreadPoolExecutor): Thread pool used to spawn packet handler threads.
+        maxsize (int): Maximum number of pending handler calls.
+        policy (str): One of `handler_queue_policies`.
+        max_workers (int): Maximum number of workers draining the queue at once.
+        workers (int): Number of workers currently draining the queue.
+        dropped_count (int): Number of packets discarded by the overflow policy.
+        pending (OrderedDict): Pending handler arguments keyed by source (coalesce) or arrival number.
 
     Key Methods:
-        connect_to(to_IP, to_port) -> None: Establishes a connection to a remote IP and port.
-        disconnect() -> None: Disconnects from the remote endpoint by nulling the connection.
-        reconnect() -> None: Re-establishes the most recent connection (after disconnect).
-        spawn_handler_thread(*args) -> None: Spawns a thread to handle incoming packet data using the assigned handler.
-        set_socket() -> socket.socket: Creates and binds a socket with the specified communication type.
-        open(IP=None, port=None) -> None: Opens (or re-opens) the socket on the given or previous IP/port.
-        close() -> None: Closes the socket if currently bound.
-        test_packet_handler(*args) -> str: Default handler that prints packet details and increments `recieved_count`.
+        put(arguments, key=None) -> bool: Queues handler arguments. Returns True if a new worker should be started.
+        get() -> tuple | None: Pops the next handler arguments, or retires the calling worker and returns None if empty.
     """
 
-    def __init__(self, IP: str, port: int, protocol: str, packet_handler: Callable | str="test", max_threads: int=10):
+    def __init__(self, maxsize: int, policy: str="block", max_workers: int=10):
         """
-        Initializes the network communicator with socket parameters.
+        Initializes an empty handler queue.
 
         Args:
-            IP (str): Local IP address to bind to.
-            port (int): Local port to bind to.
-            protocol (str): Protocol name (e.g., 'tcp', 'udp', 'http').
-            packet_handler (Callable | str): Handler for incoming packets or 'test' for default.
-            max_threads (int): Maximum number of handler threads, set to 10 as default
+            maxsize (int): Maximum number of pending handler calls.
+            policy (str, optional): Overflow policy, one of `handler_queue_policies`. Defaults to "block".
+            max_workers (int, optional): Maximum number of concurrent workers. Defaults to 10.
+
+        Raises:
+            Exception: If maxsize is not positive or the policy is unknown.
         """
 
-        global protocols_by_transport
+        if maxsize <= 0: raise Exception("Handler queue size must be positive")
+        if policy not in handler_queue_policies: raise Exception(f"Unknown overflow policy {policy}. Select from {handler_queue_policies}")
 
-        self.IP = IP
-        self.port = port
+        self.maxsize = maxsize
+        self.policy = policy
+        self.max_workers = max_workers
 
-        self.protocols_by_transport = protocols_by_transport
-        self.protocol = protocol.strip().lower()
-        self.communication_type = self._resolve_comm_type()
+        self.workers = 0
+        self.dropped_count = 0
 
-        if packet_handler == "test": self.packet_handler = self.test_packet_handler
-        else: self.packet_handler = packet_handler
-        self.recieved_count = 0
+        self.pending = OrderedDict()
+        self._arrivals = 0
 
-        self.socket = self.set_socket()
-        self.bound = True
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
 
-        self.to_IP = None
-        self.to_port = None
-        self.connected = False
+    def __len__(self) -> int:
+        return len(self.pending)
 
-        self.executor = ThreadPoolExecutor(max_workers=max_threads)
+    def put(self, arguments: tuple, key=None) -> bool:
+        """
+        Queues a packet handler call, applying the overflow policy if the queue is full.
 
-        at_exit(self.close)
+        Args:
+            arguments (tuple): Arguments to pass to the packet handler.
+            key (optional): Coalescing key, normally the source address. Only used by the "coalesce" policy.
 
-    def test_packet_handler(self, *args) -> str:
+        Returns:
+            bool: True if the caller should start another worker to drain the queue.
         """
-        Default packet handler used for testing. Prints information about the packet just recieved.
-        
-        Args:
-            *args: Tuple of (data, address) or just (data,) depending on protocol context.
+
+        with self._lock:
+            if self.policy == "coalesce":
+                if key in self.pending:
+                    self.pending[key] = arguments  # keeps its place in line, but now holds the freshest value
+                    self.dropped_count += 1
+                    return False
+            else:
+                key = self._arrivals
+                self._arrivals += 1
+
+            if len(self.pending) >= self.maxsize:
+                if self.policy == "block":
+                    while len(self.pending) >= self.maxsize: self._not_full.wait()
+                elif self.policy == "drop_newest":
+                    self.dropped_count += 1
+                    return False
+                else:
+                    self.pending.popitem(last=False)
+                    self.dropped_count += 1
+
+            self.pending[key] = arguments
+
+            if self.workers < self.max_workers:
+                self.workers += 1
+                return True
+            return False
+
+    def get(self) -> tuple | None:
+        """
+        Pops the oldest pending handler call. Workers must exit when this returns None.
 
         Returns:
-            description (str): information printed about recieved packet
+            tuple | None: Handler arguments, or None if the queue is empty (the calling worker is retired).
+        """
+
+        with self._lock:
+            if not self.pending:
+                self.workers -= 1
+                return None
+
+            _, arguments = self.pending.popitem(last=False)
+            self._not_full.notify()
+            return arguments
+
+
+class Handler_Pool:
+    """
+    A handler thread pool that several communicators can share, so a process with many communicators runs a fixed
+    number of handler threads instead of max_threads per communicator.
+
+    Each communicator gets a `Handler_Pool_Client` with a priority class (see `handler_priorities`) and a quota.
+    Queued work runs in priority order ("control" before "telemetry" before "debug", first come first served
+    within a class), and a client never has more than quota calls queued or running in the pool at once; the rest
+    wait in the client's own backlog. Work that is already running is not preempted.
+
+    Attributes:
+        max_threads (int): Maximum number of worker threads.
+        threads (list[threading.Thread]): Started worker threads. Started on demand, up to max_threads.
+        completed_by_priority (dict[str, int]): Calls run to completion, by priority class.
+
+    Key Methods:
+        client(priority="telemetry", quota=None) -> Handler_Pool_Client: Returns an executor-like handle for one communicator.
+        shutdown(wait=True) -> None: Stops the worker threads once queued work is done.
+        snapshot() -> dict: Returns thread, queue and completion counts.
+    """
+
+    def __init__(self, max_threads: int=8):
+        """
+        Initializes an idle pool. Threads are started as work arrives.
+
+        Args:
+            max_threads (int, optional): Maximum number of worker threads. Defaults to 8.
 
         Raises:
-            Exception: If len(args) is not 1 or 2
+            Exception: If max_threads is not positive.
         """
 
-        if len(args) == 2:
-            data, address = args
-            description = f"{self.recieved_count}\tRecieved {len(data)} bytes from port {address[1]} on {address[0]}"
-        elif len(args) == 1:
-            description = f"{self.recieved_count}\tRecieved {len(data)} bytes from {self.to_IP}"
-        else: raise Exception("Internal Error: Test handler not functioning correctly")
+        if max_threads <= 0: raise Exception("Handler pool needs at least one thread")
 
-        print(description)
-        return description
+        self.max_threads = max_threads
+        self.threads = []
+        self.completed_by_priority = {priority: 0 for priority in handler_priorities}
 
-    def _resolve_comm_type(self):
+        self._heap = []
+        self._sequence = 0
+        self._idle = 0
+        self._shutdown = False
+        self._condition = threading.Condition()
+
+    def client(self, priority: str="telemetry", quota: int | None=None) -> "Handler_Pool_Client":
         """
-        Resolves the socket type from the protocol string.
+        Args:
+            priority (str, optional): Priority class, one of `handler_priorities`. Defaults to "telemetry".
+            quota (int | None, optional): Most calls the client may have queued or running in the pool. Defaults to max_threads.
 
         Returns:
-            int: Socket type (e.g., socket.SOCK_STREAM).
+            Handler_Pool_Client: Handle with the `submit`/`shutdown` interface of a ThreadPoolExecutor.
 
         Raises:
-            Exception: If protocol is not supported.
+            Exception: If the priority is unknown or the quota is not positive.
         """
 
-        try:
-            return self.protocols_by_transport[self.protocol]
-        except KeyError:
-            raise Exception("Unsupported protocol. Select valid from .protocols_by_transport or resort to primitive types 'udp', 'tcp' and 'raw'")
+        if priority not in handler_priorities: raise Exception(f"Unknown handler priority {priority}. Select from {tuple(handler_priorities)}")
+        if quota is None: quota = self.max_threads
+        if quota <= 0: raise Exception("Handler pool quota must be positive")
 
-    def connect_to(self, to_IP: str, to_port: int) -> None:
+        return Handler_Pool_Client(self, priority, quota)
+
+    def _push(self, client: "Handler_Pool_Client", work: tuple) -> None:
         """
-        Connects the socket to a remote IP and port.
+        Queues one call for the workers. The caller holds the condition and has counted it against client's quota.
 
         Args:
-            to_IP (str): Destination IP address.
-            to_port (int): Destination port number.
+            client (Handler_Pool_Client): Client the call belongs to.
+            work (tuple): (future, function, arguments).
         """
 
-        self.to_IP = to_IP
-        self.to_port = to_port
+        self._sequence += 1
+        heapq.heappush(self._heap, (handler_priorities[client.priority], self._sequence, client, work))
 
-        self.socket.connect((to_IP, to_port))
-        self.connected = True
+        if self._idle: self._condition.notify()
+        elif len(self.threads) < self.max_threads:
+            thread = threading.Thread(target=self._worker, daemon=True)
+            self.threads.append(thread)
+            thread.start()
 
-    def disconnect(self) -> None:
+    def _submit(self, client: "Handler_Pool_Client", function: Callable, arguments: tuple) -> Future:
         """
-        Disconnects from the current remote endpoint by connecting to a null address.
+        Args:
+            client (Handler_Pool_Client): Submitting client.
+            function (Callable): Function to run.
+            arguments (tuple): Arguments to pass to it.
+
+        Returns:
+            Future: Resolves with the function's result or exception.
+
+        Raises:
+            RuntimeError: If the client or the pool has been shut down, like ThreadPoolExecutor.submit.
         """
 
-        self.socket.connect(("0.0.0.0", 0))
-        self.connected = False
+        future = Future()
+        work = (future, function, arguments)
 
-    def reconnect(self) -> None:
+        with self._condition:
+            if self._shutdown or client.closed: raise RuntimeError("cannot schedule new futures after shutdown")
+
+            if client.admitted < client.quota:
+                client.admitted += 1
+                self._push(client, work)
+            else: client.backlog.append(work)
+
+        return future
+
+    def _worker(self) -> None:
         """
-        Reconnects to the most recent remote IP and port (set using the 'connect' method) after disconnect
+        Worker loop: runs the highest priority queued call, then admits the next call from the same client's backlog.
         """
 
-        self.socket.connect((self.to_IP, self.to_port))
-        self.connected = True
+        while True:
+            with self._condition:
+                while not self._heap:
+                    if self._shutdown: return
+
+                    self._idle += 1
+                    self._condition.wait()
+                    self._idle -= 1
+
+                _, _, client, (future, function, arguments) = heapq.heappop(self._heap)
+
+            if future.set_running_or_notify_cancel():
+                try: future.set_result(function(*arguments))
+                except BaseException as error: future.set_exception(error)
+
+            with self._condition:
+                self.completed_by_priority[client.priority] += 1
+
+                if client.backlog: self._push(client, client.backlog.popleft())
+                else: client.admitted -= 1
+
+                if not client.admitted: self._condition.notify_all()  # wakes client.shutdown(wait=True)
 
-    def spawn_handler_thread(self, *arguments) -> None:
+    def shutdown(self, wait: bool=True) -> None:
         """
-        Spawns a new thread to handle packets using the packet_handler.
+        Stops accepting work. Workers exit once everything already queued has run.
 
         Args:
-            *arguments: Arguments to pass to the packet handler function.
+            wait (bool, optional): Wait for the workers to exit. Defaults to True.
         """
 
-        self.executor.submit(self.packet_handler, *arguments)
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
 
-    def set_socket(self) -> socket.socket:
-        """
-        Creates and binds a socket to the specified local IP and port.
+        if wait:
+            for thread in self.threads:
+                if thread is not threading.current_thread(): thread.join()
 
+    def snapshot(self) -> dict:
+        """
         Returns:
-            self.socket (socket.socket): The bound socket object.
+            dict: "threads", "idle", "queued" (calls waiting for a worker) and "completed" by priority class.
         """
 
-        self.socket = socket.socket(socket.AF_INET, self.communication_type)
-        self.socket.bind((self.IP, self.port))
+        with self._condition:
+            return {
+                "threads": len(self.threads),
+                "idle": self._idle,
+                "queued": len(self._heap),
+                "completed": dict(self.completed_by_priority),
+            }
 
-        self.bound = True
-        return self.socket
 
-    def close(self) -> None:
+class Handler_Pool_Client:
+    """
+    One communicator's handle on a shared Handler_Pool. Has the parts of the ThreadPoolExecutor interface the
+    communicators use, so it can stand in for a private executor. Create it with `Handler_Pool.client`.
+
+    Attributes:
+        pool (Handler_Pool): The shared pool.
+        priority (str): Priority class of this client's work.
+        quota (int): Most calls this client may have queued or running in the pool at once.
+        admitted (int): Calls currently queued or running in the pool.
+        backlog (deque): Calls waiting for the client to get under its quota.
+        closed (bool): Set by `shutdown`. A closed client accepts no new work.
+    """
+
+    def __init__(self, pool: Handler_Pool, priority: str, quota: int):
         """
-        Closes the local socket if it is currently bound.
+        Args:
+            pool (Handler_Pool): The shared pool.
+            priority (str): Priority class, one of `handler_priorities`.
+            quota (int): Most calls queued or running in the pool at once.
         """
 
-        if self.bound:
-            self.socket.close()
-            self.bound = False
+        self.pool = pool
+        self.priority = priority
+        self.quota = quota
 
-    def open(self, IP: str=None, port: int=None) -> None:
+        self.admitted = 0
+        self.backlog = deque()
+        self.closed = False
+
+    def submit(self, function: Callable, *arguments) -> Future:
+        """
+        Schedules function(*arguments) on the shared pool.
+
+        Returns:
+            Future: Resolves with the function's result or exception.
+        """
+
+        return self.pool._submit(self, function, arguments)
+
+    def pending_count(self) -> int:
+        """
+        Returns:
+            int: Calls submitted by this client that have not finished yet.
         """
-        Opens a local socket with provided IP/port or reopens the socket using last bound IP/port.
+
+        with self.pool._condition:
+            return self.admitted + len(self.backlog)
+
+    def shutdown(self, wait: bool=True, cancel_futures: bool=False) -> None:
+        """
+        Stops accepting work from this client. The shared pool keeps running.
 
         Args:
-            IP (str, optional): New IP address to bind to.
-            port (int, optional): New port number to bind to.
+            wait (bool, optional): Wait until this client's submitted calls have finished. Defaults to True.
+            cancel_futures (bool, optional): Cancel calls still waiting in the backlog. Defaults to False.
         """
 
-        if IP is not None and port is not None: 
-            self.IP = IP
-            self.port = port
+        with self.pool._condition:
+            self.closed = True
 
-        self.set_socket()
+            if cancel_futures:
+                while self.backlog: self.backlog.popleft()[0].cancel()
 
+            if wait:
+                while self.admitted or self.backlog: self.pool._condition.wait()
 
-# Caleb Hofschneider SLV ROV 5/2025
 
-from typing import Callable, List
+_shared_handler_pool = None
+_shared_handler_pool_lock = threading.Lock()
 
-class UDP_Communicator(Network_Communicator):
+
+def shared_handler_pool(max_threads: int=8) -> Handler_Pool:
     """
-    A specialized subclass of Network_Communicator for handling UDP-based network communication.
+    Returns the process-wide Handler_Pool, creating it on first use. Pass it as `handler_pool` to communicators
+    that should share handler threads.
 
-    This communicator supports sending and receiving UDP packets using both connected and unconnected socket modes.
-    It inherits threading, socket setup, and packet handling from the base class and adds UDP-specific transmission 
-    and reception capabilities.
+    Args:
+        max_threads (int, optional): Thread limit, used only when the pool is first created. Defaults to 8.
 
-    Attributes:
-        IP (str): Local IP address to bind to.
-        port (int): Local port number for communication.
-        protocol (str): Always set to 'udp' for this subclass.
-        packet_handler (Callable): Function used to process received packets.
-        recieved_count (int): Counter that tracks how many packets have been received.
-        socket (socket.socket): The UDP socket object used for communication.
-        connected (bool): Indicates if the socket is connected to a specific remote host.
-        executor (ThreadPoolExecutor): Thread pool used to execute packet handler functions concurrently.
+    Returns:
+        Handler_Pool: The shared pool.
+    """
 
-    Key Methods:
-        sendto(data, to_IP, to_port) -> None:
-            Sends a UDP packet to a specific remote IP and port.
+    global _shared_handler_pool
 
-        send(data) -> None:
-            Sends a UDP packet using a previously connected socket.
+    with _shared_handler_pool_lock:
+        if _shared_handler_pool is None:
+            _shared_handler_pool = Handler_Pool(max_threads)
+            at_exit(_shared_handler_pool.shutdown)
 
-        send_queue(data, IP="", port=-1) -> None:
-            Sends multiple UDP packets either to a connected host or to a provided destination.
+        return _shared_handler_pool
 
-        recieve_all(count="continual", buffer_size=1521, threaded=False) -> None:
-            Listens for incoming packets from any address and optionally handles them in threads.
 
-        recieve_from(IP=None, port=None, count="continual", buffer_size=1521, threaded=False) -> None:
-            Receives packets from a specific IP/port or a connected host, using a packet handler that 
-            accepts only the raw data.
+latency_bucket_bounds = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class Latency_Histogram:
+    """
+    A fixed-bucket histogram of durations in seconds. Recording is a bisect and two additions, so it is cheap enough
+    to run for every packet.
+
+    Attributes:
+        bounds (tuple[float, ...]): Upper bound (seconds) of each bucket. One extra overflow bucket follows the last.
+        counts (list[int]): Samples per bucket, `len(bounds) + 1` long.
+        count (int): Total number of samples.
+        total (float): Sum of all samples, in seconds.
+        max (float): Largest sample, in seconds.
     """
 
-    def __init__(self, IP: str, port: int, packet_handler: Callable | str="test", max_threads: int=10):
+    def __init__(self, bounds: tuple[float, ...]=latency_bucket_bounds):
         """
-        Initializes the UDP_Communicator with a bound UDP socket and packet handler.
+        Initializes an empty histogram.
 
         Args:
-            IP (str): The local IP address to bind the socket to.
-            port (int): The local port number to bind the socket to.
-            packet_handler (Callable): Function to handle received packets.
-            max_threads (int, optional): Maximum number of threads for handling packets. Defaults to 10.
+            bounds (tuple[float, ...], optional): Ascending bucket upper bounds in seconds. Defaults to `latency_bucket_bounds`.
         """
-        
-        super().__init__(IP=IP, port=port, packet_handler=packet_handler, protocol="udp", max_threads=max_threads)
 
-    def sendto(self, data: bytes | bytearray, to_IP: str, to_port: int) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
         """
-        Sends a UDP packet to a specific destination IP and port.
+        Adds one sample. Safe to call from several handler threads.
 
         Args:
-            data (bytes | bytearray): The packet data to send.
-            to_IP (str): The target IP address.
-            to_port (int): The target port number.
+            seconds (float): The duration to record.
         """
 
-        self.socket.sendto(data, (to_IP, to_port))
+        index = bisect_left(self.bounds, seconds)
 
-    def send(self, data: bytes | bytearray) -> None:
-        """
-        Sends a UDP packet using the connected socket.
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max: self.max = seconds
 
-        This method assumes that the socket has already been connected using `connect_to`.
+    def percentile(self, percent: float) -> float:
+        """
+        Estimates a percentile as the upper bound of the bucket it falls in.
 
         Args:
-            data (bytes | bytearray): The packet data to send.
+            percent (float): Percentile, 0 - 100.
 
-        Raises:
-            Exception: If the socket is not connected.
+        Returns:
+            float: Bucket upper bound in seconds (`max` for the overflow bucket), or 0.0 with no samples.
         """
-        
-        if not self.connected: raise Exception("Must connect using 'connect_to' method in order to use this")
-        self.socket.send(data)
 
-    def send_queue(self, data: List[bytes | bytearray], IP: str="", port: int=-1) -> None:
-        """
-        Sends a sequence of UDP packets either to a connected peer or to the specified destination.
+        with self._lock:
+            counts = list(self.counts)
+            count, mx = self.count, self.max
 
-        If the communicator is connected, packets are sent using the `send` method.
-        Otherwise, a destination IP and port must be provided to use `sendto`.
+        return self._percentile(counts, count, mx, percent)
+
+    def _percentile(self, counts: list[int], count: int, mx: float, percent: float) -> float:
+        """
+        Estimates a percentile from a consistent copy of the bucket counts (see `percentile`).
 
         Args:
-            data (List[bytes | bytearray]): A list of packet data to send.
-            IP (str, optional): Target IP address if not connected. Defaults to "".
-            port (int, optional): Target port if not connected. Defaults to -1.
+            counts (list[int]): Samples per bucket.
+            count (int): Total number of samples.
+            mx (float): Largest sample, in seconds.
+            percent (float): Percentile, 0 - 100.
 
-        Raises:
-            Exception: If no connection is active and no destination IP/port is provided.
+        Returns:
+            float: Bucket upper bound in seconds (`mx` for the overflow bucket), or 0.0 with no samples.
         """
-        
-        if self.connected:
-            for item in data:
-                self.send(item)
 
-        else:
-            if IP == "" or port == -1: raise Exception("Please provide IP and port or connect")
+        if count == 0: return 0.0
 
-            for item in data:
-                self.sendto(data=item, to_IP=IP, to_port=port)
+        target = count * percent / 100
+        seen = 0
 
-    def recieve_all(self, count: int | str="continual", buffer_size: int=1472, threaded: bool=False) -> None:
-        """
-        Recieves packets from the socket\n
-        NOTE: Packet handler must be configured to accept a bytes 'data' AND an str 'address' argument\n
-        NOTE: This communicator will disconnect from any connected peers to recieve using this function
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= target and bucket_count: return self.bounds[index] if index < len(self.bounds) else mx
 
+        return mx
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: Copy of the bucket counts plus count, mean, max, p50 and p99 (seconds).
+        """
+
+        with self._lock:
+            counts = list(self.counts)
+            count, total, mx = self.count, self.total, self.max
+
+        return {
+            "bounds": self.bounds,
+            "counts": counts,
+            "count": count,
+            "mean": total / count if count else 0.0,
+            "max": mx,
+            "p50": self._percentile(counts, count, mx, 50),
+            "p99": self._percentile(counts, count, mx, 99),
+        }
+
+
+class Communicator_Stats:
+    """
+    Performance counters for one communicator: traffic totals plus receive-to-handler latency and handler run time
+    histograms. Use `Network_Communicator.stats_snapshot` to read them along with queue depth and drops.
+
+    Attributes:
+        packets_recieved (int): Packets recieved.
+        bytes_recieved (int): Payload bytes recieved.
+        packets_sent (int): Packets sent.
+        bytes_sent (int): Payload bytes sent.
+        handler_latency (Latency_Histogram): Time from a packet being recieved to its handler starting.
+        handler_time (Latency_Histogram): Time each packet handler call took.
+    """
+
+    def __init__(self):
+        """Initializes zeroed counters."""
+
+        self.packets_recieved = 0
+        self.bytes_recieved = 0
+        self.packets_sent = 0
+        self.bytes_sent = 0
+
+        self.handler_latency = Latency_Histogram()
+        self.handler_time = Latency_Histogram()
+
+        self._lock = threading.Lock()
+
+    def count_recieved(self, packets: int, nbytes: int) -> None:
+        """
+        Args:
+            packets (int): Number of packets recieved.
+            nbytes (int): Their total size in bytes.
+        """
+
+        self.packets_recieved += packets
+        self.bytes_recieved += nbytes
+
+    def count_sent(self, packets: int, nbytes: int) -> None:
+        """
+        Args:
+            packets (int): Number of packets sent.
+            nbytes (int): Their total size in bytes.
+        """
+
+        with self._lock:  # senders may be on several threads
+            self.packets_sent += packets
+            self.bytes_sent += nbytes
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: Traffic counters and histogram snapshots.
+        """
+
+        return {
+            "packets_recieved": self.packets_recieved,
+            "bytes_recieved": self.bytes_recieved,
+            "packets_sent": self.packets_sent,
+            "bytes_sent": self.bytes_sent,
+            "handler_latency": self.handler_latency.snapshot(),
+            "handler_time": self.handler_time.snapshot(),
+        }
+
+
+class Token_Bucket_Pacer:
+    """
+    Token bucket rate limiter for bulk senders. Tokens (bytes) refill at `rate` per second up to `burst`; a send
+    takes tokens for its size and, when there aren't enough, sleeps until they would have refilled. Debts carry
+    over, so the long-run rate holds even for sends larger than the bucket.
+
+    How closely the sleeps hit their deadlines is recorded, since the OS can only wake a thread so precisely; with
+    `snapshot` that shows whether the pacer is actually delivering the configured rate.
+
+    Attributes:
+        rate (float): Refill rate in bytes per second.
+        burst (float): Bucket size in bytes, the most that can be sent back to back.
+        tokens (float): Bytes currently available. Negative while in debt.
+        paced_bytes (int): Bytes that have passed through the pacer.
+        waits (int): Sends that had to sleep.
+        waited (float): Total seconds spent sleeping.
+        lateness (Latency_Histogram): How far past their deadline sleeping sends woke up, in seconds.
+
+    Key Methods:
+        wait(nbytes) -> float: Blocks until nbytes may be sent. Returns the seconds slept.
+        snapshot() -> dict: Returns the configured and achieved rate and the lateness histogram.
+    """
+
+    def __init__(self, rate: float, burst: float | None=None):
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate (float): Bytes per second.
+            burst (float | None, optional): Bucket size in bytes. Defaults to 20 ms worth of rate, and at least one
+                full-size (1500 byte) packet.
+
+        Raises:
+            Exception: If rate or burst is not positive.
+        """
+
+        if rate <= 0: raise Exception("Pacing rate must be positive")
+        if burst is None: burst = max(rate * 0.02, 1500)
+        if burst <= 0: raise Exception("Pacing burst must be positive")
+
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+
+        self.paced_bytes = 0
+        self.waits = 0
+        self.waited = 0.0
+        self.lateness = Latency_Histogram()
+
+        self._last = perf_counter()
+        self._first = None
+        self._lock = threading.Lock()
+
+    def wait(self, nbytes: int) -> float:
+        """
+        Takes nbytes of tokens, sleeping first if the bucket doesn't have them.
+
+        Args:
+            nbytes (int): Size of the upcoming send.
+
+        Returns:
+            float: Seconds slept.
+        """
+
+        with self._lock:
+            now = perf_counter()
+            if self._first is None: self._first = now
+
+            self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+            self._last = now
+
+            self.tokens -= nbytes
+            self.paced_bytes += nbytes
+
+            if self.tokens >= 0: return 0.0
+
+            due = now - self.tokens / self.rate
+
+        sleep(due - now)
+        woke = perf_counter()
+
+        with self._lock:
+            self.waits += 1
+            self.waited += woke - now
+            self.lateness.record(max(0.0, woke - due))
+
+        return woke - now
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: "rate" and "burst" as configured, "achieved_rate" (bytes per second since the first send, which
+            includes the initial burst), "waits", "waited" (seconds) and the "lateness" histogram (seconds).
+        """
+
+        with self._lock:
+            elapsed = perf_counter() - self._first if self._first is not None else 0.0
+
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "paced_bytes": self.paced_bytes,
+                "achieved_rate": self.paced_bytes / elapsed if elapsed else 0.0,
+                "waits": self.waits,
+                "waited": self.waited,
+                "lateness": self.lateness.snapshot(),
+            }
+
+
+class Network_Communicator:
+    """
+    A class to manage socket-based communication using multithreading, with protocol abstraction for various common 
+    network protocols. Designed for both connection-oriented (TCP) and connectionless (UDP) communication patterns.
+
+    Attributes:
+        IP (str): Local IP address the socket binds to.
+        port (int): Local port number to bind the socket to.
+        protocols_by_transport (dict): Mapping of protocol names (e.g., 'tcp', 'udp', 'http') to socket types.
+        protocol (str): The specified protocol in lowercase, used to resolve socket type.
+        communication_type (int): Socket type (e.g., socket.SOCK_STREAM) based on protocol.
+        packet_handler (Callable): Function used to handle received packets. Defaults to an internal test handler.
+        recieved_count (int): Counter tracking the number of packets received when using the test handler.
+        recieve_observer (Callable | None): Called with the packet handler's arguments for every packet (or batch), on
+            the recieving thread as it arrives, before it is handed to a handler thread. None by default.
+        socket (socket.socket): The underlying bound socket object.
+        bound (bool): Boolean flag indicating if the socket is currently open and bound.
+        to_IP (str): Remote IP address to connect to (used in client mode).
+        to_port (int): Remote port number to connect to.
+        connected (bool): Flag indicating if a connection to a remote host is active.
+        executor (ThreadPoolExecutor | Handler_Pool_Client): Runs threaded packet handlers. A private thread pool, or
+            a client of the shared handler_pool. Shut down by `close` and recreated by `open`.
+        max_threads (int): Handler thread limit, or this communicator's quota in a shared handler_pool.
+        handler_pool (Handler_Pool | None): Shared pool handlers run on, or None for a private thread pool.
+        priority (str): Priority class in the shared handler_pool, one of `handler_priorities`.
+        traffic_class (str | None): Traffic class marking outgoing packets, one of `traffic_classes`, or None for the OS default.
+        handler_queue (Handler_Queue | None): Bounded dispatch queue for threaded handling, or None for unbounded.
+        dropped_count (int): Number of packets discarded by the handler queue's overflow policy.
+        stats (Communicator_Stats | None): Performance counters, or None while disabled.
+
+    Key Methods:
+        connect_to(to_IP, to_port) -> None: Establishes a connection to a remote IP and port.
+        disconnect() -> None: Disconnects from the remote endpoint by nulling the connection.
+        reconnect() -> None: Re-establishes the most recent connection (after disconnect).
+        spawn_handler_thread(*args) -> None: Spawns a thread to handle incoming packet data using the assigned handler.
+        set_socket() -> socket.socket: Creates and binds a socket with the specified communication type.
+        open(IP=None, port=None) -> None: Opens (or re-opens) the socket on the given or previous IP/port.
+        close() -> None: Closes the socket if currently bound.
+        test_packet_handler(*args) -> str: Default handler that prints packet details and increments `recieved_count`.
+        enable_stats() -> Communicator_Stats: Starts collecting performance counters.
+        disable_stats() -> None: Stops collecting performance counters.
+        stats_snapshot() -> dict | None: Returns the performance counters, queue depth and drops.
+        set_traffic_class(traffic_class) -> None: Marks outgoing packets with a class's DSCP and SO_PRIORITY.
+    """
+
+    def __init__(self, IP: str, port: int, protocol: str, packet_handler: Callable | str="test", max_threads: int=10,
+                 queue_size: int | None=None, overflow_policy: str="block", stats: bool=False,
+                 handler_pool: Handler_Pool | None=None, priority: str="telemetry", traffic_class: str | None=None):
+        """
+        Initializes the network communicator with socket parameters.
+
+        Args:
+            IP (str): Local IP address to bind to.
+            port (int): Local port to bind to.
+            protocol (str): Protocol name (e.g., 'tcp', 'udp', 'http').
+            packet_handler (Callable | str): Handler for incoming packets or 'test' for default.
+            max_threads (int): Maximum number of handler threads, set to 10 as default
+            queue_size (int | None): Most packets that may wait for a handler thread. None (default) is unbounded.
+            overflow_policy (str): What to do when the handler queue is full. One of `handler_queue_policies`. Default is "block"
+            stats (bool): Collect performance counters from the start (see `enable_stats`). Default is False
+            handler_pool (Handler_Pool | None): Shared pool to run threaded handlers on (e.g. `shared_handler_pool()`),
+                with max_threads as this communicator's quota. None (default) gives the communicator its own threads
+            priority (str): Priority class in the shared handler_pool, one of `handler_priorities`. Default is "telemetry"
+            traffic_class (str | None): Traffic class for outgoing packets, one of `traffic_classes`. Default is None (unmarked)
+        """
+
+        global protocols_by_transport
+
+        self.IP = IP
+        self.port = port
+
+        self.protocols_by_transport = protocols_by_transport
+        self.protocol = protocol.strip().lower()
+        self.communication_type = self._resolve_comm_type()
+
+        if packet_handler == "test": self.packet_handler = self.test_packet_handler
+        else: self.packet_handler = packet_handler
+        self.recieved_count = 0
+        self.recieve_observer = None
+
+        self.socket = self.set_socket()
+        self.bound = True
+
+        self.to_IP = None
+        self.to_port = None
+        self.connected = False
+
+        self.max_threads = max_threads
+        self.handler_pool = handler_pool
+        self.priority = priority
+        self.executor = self._create_executor()
+        self._executor_closed = False
+
+        if queue_size is None: self.handler_queue = None
+        else: self.handler_queue = Handler_Queue(queue_size, overflow_policy, max_threads)
+
+        self.stats = Communicator_Stats() if stats else None
+
+        self.traffic_class = None
+        if traffic_class is not None: self.set_traffic_class(traffic_class)
+
+        at_exit(self.close)
+
+    def test_packet_handler(self, *args) -> str:
+        """
+        Default packet handler used for testing. Prints information about the packet just recieved.
+        
+        Args:
+            *args: Tuple of (data, address) or just (data,) depending on protocol context.
+
+        Returns:
+            description (str): information printed about recieved packet
+
+        Raises:
+            Exception: If len(args) is not 1 or 2
+        """
+
+        if len(args) == 2:
+            data, address = args
+            description = f"{self.recieved_count}\tRecieved {len(data)} bytes from port {address[1]} on {address[0]}"
+        elif len(args) == 1:
+            description = f"{self.recieved_count}\tRecieved {len(data)} bytes from {self.to_IP}"
+        else: raise Exception("Internal Error: Test handler not functioning correctly")
+
+        print(description)
+        return description
+
+    def _resolve_comm_type(self):
+        """
+        Resolves the socket type from the protocol string.
+
+        Returns:
+            int: Socket type (e.g., socket.SOCK_STREAM).
+
+        Raises:
+            Exception: If protocol is not supported.
+        """
+
+        try:
+            return self.protocols_by_transport[self.protocol]
+        except KeyError:
+            raise Exception("Unsupported protocol. Select valid from .protocols_by_transport or resort to primitive types 'udp', 'tcp' and 'raw'")
+
+    def connect_to(self, to_IP: str, to_port: int) -> None:
+        """
+        Connects the socket to a remote IP and port.
+
+        Args:
+            to_IP (str): Destination IP address.
+            to_port (int): Destination port number.
+        """
+
+        self.to_IP = to_IP
+        self.to_port = to_port
+
+        self.socket.connect((to_IP, to_port))
+        self.connected = True
+
+    def disconnect(self) -> None:
+        """
+        Disconnects from the current remote endpoint by connecting to a null address.
+        """
+
+        self.socket.connect(("0.0.0.0", 0))
+        self.connected = False
+
+    def reconnect(self) -> None:
+        """
+        Reconnects to the most recent remote IP and port (set using the 'connect' method) after disconnect
+        """
+
+        self.socket.connect((self.to_IP, self.to_port))
+        self.connected = True
+
+    @property
+    def dropped_count(self) -> int:
+        """
+        Returns:
+            int: Number of packets discarded by the handler queue. Always 0 when the queue is unbounded.
+        """
+
+        if self.handler_queue is None: return 0
+        return self.handler_queue.dropped_count
+
+    def enable_stats(self) -> Communicator_Stats:
+        """
+        Starts collecting performance counters. Keeps existing counters if already enabled.
+
+        Returns:
+            Communicator_Stats: The active counters.
+        """
+
+        if self.stats is None: self.stats = Communicator_Stats()
+        return self.stats
+
+    def disable_stats(self) -> None:
+        """
+        Stops collecting performance counters and discards them. Disabled counters cost one None check per packet.
+        """
+
+        self.stats = None
+
+    def queue_depth(self) -> int:
+        """
+        Returns:
+            int: Number of packets waiting for a handler thread.
+        """
+
+        if self.handler_queue is not None: return len(self.handler_queue)
+        if self.handler_pool is not None: return self.executor.pending_count()
+        return self.executor._work_queue.qsize()
+
+    def stats_snapshot(self) -> dict | None:
+        """
+        Reads the performance counters. Latencies are in seconds.
+
+        Returns:
+            dict | None: Communicator_Stats.snapshot() plus "queue_depth" and "dropped", or None if stats are disabled.
+        """
+
+        stats = self.stats
+        if stats is None: return None
+
+        snapshot = stats.snapshot()
+        snapshot["queue_depth"] = self.queue_depth()
+        snapshot["dropped"] = self.dropped_count
+
+        return snapshot
+
+    def set_traffic_class(self, traffic_class: str) -> None:
+        """
+        Marks outgoing packets with a traffic class: its DSCP code point (IP_TOS) for the network, and its SO_PRIORITY
+        for the local egress queue. Kept across `open`.\n
+        NOTE: SO_PRIORITY above 6 needs CAP_NET_ADMIN, which is why "control" stops at 6
+
+        Args:
+            traffic_class (str): One of `traffic_classes`.
+
+        Raises:
+            Exception: If the traffic class is unknown.
+        """
+
+        if traffic_class not in traffic_classes: raise Exception(f"Unknown traffic class {traffic_class}. Select from {tuple(traffic_classes)}")
+
+        self.traffic_class = traffic_class
+        self._apply_traffic_class()
+
+    def _apply_traffic_class(self) -> None:
+        """
+        Sets IP_TOS and SO_PRIORITY on the socket for the current traffic class.
+        """
+
+        dscp, priority = traffic_classes[self.traffic_class]
+
+        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, dscp << 2)  # DSCP is the top six bits of the TOS byte
+        self.socket.setsockopt(socket.SOL_SOCKET, SO_PRIORITY, priority)
+
+    def _run_handler(self, recieved_at: float | None, arguments: tuple) -> None:
+        """
+        Runs the packet handler, timing it if stats are enabled.
+
+        Args:
+            recieved_at (float | None): perf_counter() timestamp of when the packet was recieved, None if not timed.
+            arguments (tuple): Arguments to pass to the packet handler function.
+        """
+
+        stats = self.stats
+        if stats is None or recieved_at is None:
+            self.packet_handler(*arguments)
+            return
+
+        start = perf_counter()
+        stats.handler_latency.record(start - recieved_at)
+
+        try: self.packet_handler(*arguments)
+        finally: stats.handler_time.record(perf_counter() - start)
+
+    def _dispatch(self, threaded: bool, packets: int, nbytes: int, *arguments, key=None) -> None:
+        """
+        Counts a recieved packet (or batch) and hands it to the packet handler, inline or on a handler thread.
+
+        Args:
+            threaded (bool): Handle on a handler thread instead of inline.
+            packets (int): Number of packets in arguments, for stats.
+            nbytes (int): Number of bytes in arguments, for stats.
+            *arguments: Arguments to pass to the packet handler function.
+            key (optional): Source of the packet, used as the coalescing key by a "coalesce" handler queue.
+        """
+
+        observer = self.recieve_observer
+        if observer is not None: observer(*arguments)
+
+        stats = self.stats
+        if stats is not None: stats.count_recieved(packets, nbytes)
+
+        if threaded: self.spawn_handler_thread(*arguments, key=key)
+        elif stats is None: self.packet_handler(*arguments)
+        else: self._run_handler(perf_counter(), arguments)
+
+    def spawn_handler_thread(self, *arguments, key=None) -> None:
+        """
+        Spawns a new thread to handle packets using the packet_handler.
+
+        If a bounded handler queue is configured, the packet is queued (subject to the overflow policy) and drained
+        by at most max_threads workers instead of being submitted straight to the executor.
+
+        Args:
+            *arguments: Arguments to pass to the packet handler function.
+            key (optional): Source of the packet, used as the coalescing key by a "coalesce" handler queue. Packets
+                without a key are never coalesced.
+        """
+
+        recieved_at = perf_counter() if self.stats is not None else None
+
+        if self.handler_queue is None:
+            self.executor.submit(self._run_handler, recieved_at, arguments)
+            return
+
+        if key is None: key = object()  # unknown source: never merged with another packet
+        if self.handler_queue.put((recieved_at, arguments), key): self.executor.submit(self._drain_handler_queue)
+
+    @staticmethod
+    def _batch_key(batch: list[tuple]) -> object:
+        """
+        Args:
+            batch (list[tuple]): (data, address) pairs from one recieve.
+
+        Returns:
+            object: The batch's source address if every packet came from the same one, else a key no other batch has.
+        """
+
+        addresses = {address for _, address in batch}
+        return addresses.pop() if len(addresses) == 1 else object()
+
+    def _drain_handler_queue(self) -> None:
+        """
+        Worker loop that runs the packet handler on queued packets until the handler queue is empty.
+        """
+
+        while True:
+            entry = self.handler_queue.get()
+            if entry is None: return
+
+            try: self._run_handler(*entry)
+            except Exception: traceback.print_exc()  # one bad packet shouldn't take the worker down
+
+    def _create_executor(self) -> ThreadPoolExecutor | Handler_Pool_Client:
+        """
+        Returns:
+            ThreadPoolExecutor | Handler_Pool_Client: A client of handler_pool if one is set, else a private thread pool.
+        """
+
+        if self.handler_pool is not None: return self.handler_pool.client(self.priority, self.max_threads)
+        return ThreadPoolExecutor(max_workers=self.max_threads)
+
+    def set_socket(self) -> socket.socket:
+        """
+        Creates and binds a socket to the specified local IP and port.
+
+        Returns:
+            self.socket (socket.socket): The bound socket object.
+        """
+
+        self.socket = socket.socket(socket.AF_INET, self.communication_type)
+        self.socket.bind((self.IP, self.port))
+
+        self.bound = True
+        return self.socket
+
+    def close(self) -> None:
+        """
+        Closes the local socket if it is currently bound, and shuts down the handler executor. Handlers already
+        submitted still run; close does not wait for them, so it is safe to call from a handler.
+        """
+
+        if self.bound:
+            self.socket.close()
+            self.bound = False
+
+        self.executor.shutdown(wait=False)
+        self._executor_closed = True
+
+    def open(self, IP: str=None, port: int=None) -> None:
+        """
+        Opens a local socket with provided IP/port or reopens the socket using last bound IP/port.
+
+        Args:
+            IP (str, optional): New IP address to bind to.
+            port (int, optional): New port number to bind to.
+        """
+
+        if IP is not None and port is not None: 
+            self.IP = IP
+            self.port = port
+
+        self.set_socket()
+        if self.traffic_class is not None: self._apply_traffic_class()
+
+        if self._executor_closed:
+            self.executor = self._create_executor()
+            self._executor_closed = False
+
+
+# Caleb Hofschneider SLV ROV 5/2025
+
+import queue
+from typing import Callable, List
+
+
+class Buffer_Pool:
+    """
+    A fixed ring of preallocated bytearray slots for allocation-free receiving with recv_into/recvfrom_into.
+
+    Slots are handed out with `acquire` and must be handed back with `release` once whatever is reading the slot
+    is done with it. When every slot is in use, `acquire` blocks, which throttles a receive loop to the speed of
+    its handlers instead of growing memory.
+
+    Attributes:
+        slot_size (int): Size of each slot in bytes (the largest packet that can be recieved).
+        slot_count (int): Number of slots in the pool.
+        slots (list[bytearray]): The preallocated slot buffers.
+        views (list[memoryview]): A memoryview over each slot, reused for every receive.
+        free (queue.Queue): Indices of slots that are not currently in use.
+
+    Key Methods:
+        acquire(timeout=None) -> int: Takes a free slot index, blocking until one is available.
+        release(index) -> None: Returns a slot index to the pool.
+    """
+
+    def __init__(self, slot_size: int=1472, slot_count: int=32):
+        """
+        Allocates every slot up front.
+
+        Args:
+            slot_size (int, optional): Size of each slot in bytes. Defaults to 1472.
+            slot_count (int, optional): Number of slots. Defaults to 32.
+        """
+
+        if slot_size <= 0 or slot_count <= 0: raise Exception("slot_size and slot_count must be positive")
+
+        self.slot_size = slot_size
+        self.slot_count = slot_count
+
+        self.slots = [bytearray(slot_size) for _ in range(slot_count)]
+        self.views = [memoryview(slot) for slot in self.slots]
+
+        self.free = queue.Queue(maxsize=slot_count)
+        for index in range(slot_count): self.free.put_nowait(index)
+
+    def acquire(self, timeout: float | None=None) -> int:
+        """
+        Takes a free slot out of the pool.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait for a slot. Waits forever if None (default).
+
+        Returns:
+            int: Index of the acquired slot in `slots`/`views`.
+
+        Raises:
+            queue.Empty: If no slot became free before the timeout.
+        """
+
+        return self.free.get(timeout=timeout)
+
+    def release(self, index: int) -> None:
+        """
+        Returns a slot to the pool so it can be recieved into again.
+
+        Args:
+            index (int): Index of the slot, as returned by `acquire`.
+        """
+
+        self.free.put_nowait(index)
+
+    def available(self) -> int:
+        """
+        Returns:
+            int: Number of slots currently free.
+        """
+
+        return self.free.qsize()
+
+
+class UDP_Communicator(Network_Communicator):
+    """
+    A specialized subclass of Network_Communicator for handling UDP-based network communication.
+
+    This communicator supports sending and receiving UDP packets using both connected and unconnected socket modes.
+    It inherits threading, socket setup, and packet handling from the base class and adds UDP-specific transmission 
+    and reception capabilities.
+
+    Attributes:
+        IP (str): Local IP address to bind to.
+        port (int): Local port number for communication.
+        protocol (str): Always set to 'udp' for this subclass.
+        packet_handler (Callable): Function used to process received packets.
+        recieved_count (int): Counter that tracks how many packets have been received.
+        socket (socket.socket): The UDP socket object used for communication.
+        connected (bool): Indicates if the socket is connected to a specific remote host.
+        executor (ThreadPoolExecutor | Handler_Pool_Client): Runs packet handler functions concurrently.
+        buffer_pool (Buffer_Pool | None): Slot pool used by the zero-copy `recieve_*_into` methods, created on first use.
+        reuse_address (bool): Whether SO_REUSEADDR/SO_REUSEPORT are set, so several receivers can share a multicast port.
+        multicast_groups (set[tuple[str, str]]): Joined (group, interface IP) pairs. Rejoined when the socket is reopened.
+        multicast_ttl (int | None): TTL from `set_multicast_ttl`, or None for the kernel default. Reapplied on reopen.
+        multicast_loopback (bool | None): Setting from `set_multicast_loopback`, or None for the kernel default. Reapplied on reopen.
+        multicast_interface (str | None): Interface from `set_multicast_interface`, or None for the kernel default. Reapplied on reopen.
+        kernel_timestamps (bool): Whether SO_TIMESTAMPNS is enabled on the socket.
+        kernel_drops (int): Packets the kernel dropped because the recieve buffer was full (SO_RXQ_OVFL), as of the last
+            timestamped recieve.
+        pacer (Token_Bucket_Pacer | None): Rate limit applied to `send_queue`/`send_batch`, or None for unpaced.
+
+    Key Methods:
+        sendto(data, to_IP, to_port) -> None:
+            Sends a UDP packet to a specific remote IP and port.
+
+        send(data) -> None:
+            Sends a UDP packet using a previously connected socket.
+
+        send_queue(data, IP="", port=-1) -> None:
+            Sends multiple UDP packets either to a connected host or to a provided destination.
+
+        recieve_all(count="continual", buffer_size=1521, threaded=False) -> None:
+            Listens for incoming packets from any address and optionally handles them in threads.
+
+        recieve_from(IP=None, port=None, count="continual", buffer_size=1521, threaded=False) -> None:
+            Receives packets from a specific IP/port or a connected host, using a packet handler that 
+            accepts only the raw data.
+
+        recieve_all_batched(count="continual", batch_size=32, buffer_size=1472, threaded=False) -> None:
+            Like recieve_all, but reads up to batch_size packets per syscall and hands the handler a list.
+
+        recieve_from_batched(IP=None, port=None, count="continual", batch_size=32, buffer_size=1472, threaded=False) -> None:
+            Like recieve_from, but reads up to batch_size packets per syscall and hands the handler a list.
+
+        recieve_all_into(count="continual", buffer_size=1472, pool_size=32, threaded=False) -> None:
+            Like recieve_all, but recieves into a preallocated Buffer_Pool and hands the handler a memoryview.
+
+        recieve_from_into(IP=None, port=None, count="continual", buffer_size=1472, pool_size=32, threaded=False) -> None:
+            Like recieve_from, but recieves into a preallocated Buffer_Pool and hands the handler a memoryview.
+
+        join_group(group, interface_IP="0.0.0.0") -> None / leave_group(group, interface_IP="0.0.0.0") -> None:
+            Joins or leaves a multicast group. To fan telemetry out, the sender just uses sendto(data, group, port).
+
+        set_multicast_ttl(ttl) / set_multicast_loopback(enabled) / set_multicast_interface(interface_IP) -> None:
+            Configure how multicast packets are sent.
+
+        set_buffer_sizes(recieve=None, send=None) -> tuple[int, int]:
+            Sizes the kernel socket buffers (SO_RCVBUF/SO_SNDBUF) and returns the sizes the kernel actually applied.
+
+        enable_kernel_timestamps(drop_counter=True) -> None:
+            Turns on SO_TIMESTAMPNS (and SO_RXQ_OVFL) for the `recieve_*_timestamped` methods.
+
+        recieve_all_timestamped(count="continual", buffer_size=1472, threaded=False) -> None:
+            Like recieve_all, but the handler also gets the kernel arrival time of each packet.
+
+        recieve_from_timestamped(IP=None, port=None, count="continual", buffer_size=1472, threaded=False) -> None:
+            Like recieve_from, but the handler also gets the kernel arrival time of each packet.
+
+        set_pacing(rate, burst=None) -> Token_Bucket_Pacer | None:
+            Rate limits bulk sends (send_queue/send_batch) so they can't crowd out single control datagrams.
+    """
+
+    def __init__(self, IP: str, port: int, packet_handler: Callable | str="test", max_threads: int=10,
+                 queue_size: int | None=None, overflow_policy: str="block", stats: bool=False, reuse_address: bool=False,
+                 handler_pool: Handler_Pool | None=None, priority: str="telemetry", traffic_class: str | None=None):
+        """
+        Initializes the UDP_Communicator with a bound UDP socket and packet handler.
+
+        Args:
+            IP (str): The local IP address to bind the socket to.
+            port (int): The local port number to bind the socket to.
+            packet_handler (Callable): Function to handle received packets.
+            max_threads (int, optional): Maximum number of threads for handling packets. Defaults to 10.
+            queue_size (int | None, optional): Most packets that may wait for a handler thread. Defaults to None (unbounded).
+            overflow_policy (str, optional): Handler queue overflow policy, see Handler_Queue. Defaults to "block".
+            stats (bool, optional): Collect performance counters from the start. Defaults to False.
+            reuse_address (bool, optional): Allow other sockets to bind the same port, e.g. several multicast listeners on one host. Defaults to False.
+            handler_pool (Handler_Pool | None, optional): Shared handler pool, see Network_Communicator. Defaults to None.
+            priority (str, optional): Priority class in the shared handler pool. Defaults to "telemetry".
+            traffic_class (str | None, optional): Traffic class for outgoing packets, see `traffic_classes`. Defaults to None.
+        """
+
+        # set_socket (called by the base initializer) needs these
+        self.reuse_address = reuse_address
+        self.multicast_groups = set()
+        self.multicast_ttl = None
+        self.multicast_loopback = None
+        self.multicast_interface = None
+        self.kernel_timestamps = False
+        self.kernel_drops = 0
+        
+        super().__init__(IP=IP, port=port, packet_handler=packet_handler, protocol="udp", max_threads=max_threads,
+                         queue_size=queue_size, overflow_policy=overflow_policy, stats=stats, handler_pool=handler_pool,
+                         priority=priority, traffic_class=traffic_class)
+
+        self.buffer_pool = None
+        self.pacer = None
+
+    def set_socket(self) -> socket.socket:
+        """
+        Creates and binds a UDP socket, applying reuse_address, rejoining any multicast groups and reapplying the
+        multicast send settings.
+
+        Returns:
+            self.socket (socket.socket): The bound socket object.
+        """
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        if self.reuse_address:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"): self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+        self.socket.bind((self.IP, self.port))
+        self.bound = True
+
+        for group, interface_IP in self.multicast_groups: self._set_membership(socket.IP_ADD_MEMBERSHIP, group, interface_IP)
+        if self.multicast_ttl is not None: self.set_multicast_ttl(self.multicast_ttl)
+        if self.multicast_loopback is not None: self.set_multicast_loopback(self.multicast_loopback)
+        if self.multicast_interface is not None: self.set_multicast_interface(self.multicast_interface)
+        if self.kernel_timestamps: self.enable_kernel_timestamps()
+
+        return self.socket
+
+    def _set_membership(self, option: int, group: str, interface_IP: str) -> None:
+        """
+        Args:
+            option (int): socket.IP_ADD_MEMBERSHIP or socket.IP_DROP_MEMBERSHIP.
+            group (str): Multicast group address.
+            interface_IP (str): Address of the local interface, or "0.0.0.0" to let the kernel choose.
+        """
+
+        membership = socket.inet_aton(group) + socket.inet_aton(interface_IP)  # struct ip_mreq
+        self.socket.setsockopt(socket.IPPROTO_IP, option, membership)
+
+    def join_group(self, group: str, interface_IP: str="0.0.0.0") -> None:
+        """
+        Joins a multicast group so packets sent to it arrive on this socket.\n
+        NOTE: Bind to "0.0.0.0" (or the group address) on the group's port to recieve group traffic
+
+        Args:
+            group (str): Multicast group address, e.g. "239.0.0.1".
+            interface_IP (str, optional): Address of the interface to join on. Defaults to "0.0.0.0" (kernel's choice).
+
+        Raises:
+            Exception: If the address is not an IPv4 multicast address.
+        """
+
+        if not 224 <= int(group.split(".")[0]) <= 239: raise Exception(f"{group} is not an IPv4 multicast address")
+        if (group, interface_IP) in self.multicast_groups: return
+
+        self._set_membership(socket.IP_ADD_MEMBERSHIP, group, interface_IP)
+        self.multicast_groups.add((group, interface_IP))
+
+    def leave_group(self, group: str, interface_IP: str="0.0.0.0") -> None:
+        """
+        Leaves a multicast group joined with `join_group`.
+
+        Args:
+            group (str): Multicast group address.
+            interface_IP (str, optional): Interface address used when joining. Defaults to "0.0.0.0".
+        """
+
+        if (group, interface_IP) not in self.multicast_groups: return
+
+        self._set_membership(socket.IP_DROP_MEMBERSHIP, group, interface_IP)
+        self.multicast_groups.discard((group, interface_IP))
+
+    def set_multicast_ttl(self, ttl: int) -> None:
+        """
+        Sets how many router hops sent multicast packets may cross. 1 (the kernel default) keeps them on the local network.
+
+        Args:
+            ttl (int): Time to live, 0 - 255.
+        """
+
+        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+        self.multicast_ttl = ttl
+
+    def set_multicast_loopback(self, enabled: bool) -> None:
+        """
+        Sets whether multicast packets this socket sends are also delivered to listeners on this host.
+
+        Args:
+            enabled (bool): True to loop sent packets back (the kernel default).
+        """
+
+        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, int(enabled))
+        self.multicast_loopback = enabled
+
+    def set_multicast_interface(self, interface_IP: str) -> None:
+        """
+        Selects the interface multicast packets are sent from, e.g. the tether interface instead of WiFi.
+
+        Args:
+            interface_IP (str): Address of the local interface.
+        """
+
+        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface_IP))
+        self.multicast_interface = interface_IP
+
+    def set_buffer_sizes(self, recieve: int | None=None, send: int | None=None) -> tuple[int, int]:
+        """
+        Sizes the kernel socket buffers. A bigger recieve buffer absorbs longer bursts before the kernel drops packets.\n
+        NOTE: Linux doubles the requested size for bookkeeping and caps it at net.core.rmem_max/wmem_max
+
+        Args:
+            recieve (int | None, optional): SO_RCVBUF size in bytes. Unchanged if None (default).
+            send (int | None, optional): SO_SNDBUF size in bytes. Unchanged if None (default).
+
+        Returns:
+            tuple[int, int]: The (recieve, send) buffer sizes the kernel reports after the change.
+        """
+
+        if recieve is not None: self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recieve)
+        if send is not None: self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send)
+
+        return (self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+                self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF))
+
+    def enable_kernel_timestamps(self, drop_counter: bool=True) -> None:
+        """
+        Has the kernel stamp every packet with its arrival time (SO_TIMESTAMPNS), and optionally report how many
+        packets it dropped for lack of buffer space (SO_RXQ_OVFL). Linux only.
+
+        Args:
+            drop_counter (bool, optional): Also enable SO_RXQ_OVFL, updating `kernel_drops`. Defaults to True.
+        """
+
+        self.socket.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+        if drop_counter: self.socket.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+
+        self.kernel_timestamps = True
+
+    def _recieve_timestamped_once(self, buffer_size: int) -> tuple[bytes, tuple, int | None]:
+        """
+        Recieves one packet with recvmsg and decodes its ancillary data.
+
+        Args:
+            buffer_size (int): The largest packet (in bytes) that can be recieved.
+
+        Returns:
+            tuple[bytes, tuple, int | None]: (data, address, kernel arrival time in ns since the epoch). The time is
+            None if the kernel attached none.
+        """
+
+        data, ancillary, _, addr = self.socket.recvmsg(buffer_size, self._ancillary_size)
+        arrival_ns = None
+
+        for level, kind, payload in ancillary:
+            if level != socket.SOL_SOCKET: continue
+
+            if kind == SO_TIMESTAMPNS:
+                seconds, nanoseconds = kernel_timespec.unpack_from(payload)
+                arrival_ns = seconds * 1_000_000_000 + nanoseconds
+            elif kind == SO_RXQ_OVFL:
+                (self.kernel_drops,) = kernel_drop_counter.unpack_from(payload)
+
+        return data, addr, arrival_ns
+
+    @property
+    def _ancillary_size(self) -> int:
+        return socket.CMSG_SPACE(kernel_timespec.size) + socket.CMSG_SPACE(kernel_drop_counter.size)
+
+    def recieve_all_timestamped(self, count: int | str="continual", buffer_size: int=1472, threaded: bool=False) -> None:
+        """
+        Recieves packets from the socket along with the kernel's arrival time for each\n
+        NOTE: Packet handler must be configured to accept a bytes 'data', a tuple 'address' AND an int 'arrival_ns' argument\n
+        NOTE: arrival_ns is CLOCK_REALTIME in ns (compare with time.time_ns()), or None if timestamps are not enabled\n
+        NOTE: This communicator will disconnect from any connected peers to recieve using this function
+
+        Args:
+            count (int | str, optional): How many packets should be handled before exiting. Default is "continual" for continuous recieving
+            buffer_size (int, optional): The largest packet (in bytes) that can be recieved. Default is 1472
+            threaded (bool, optional): Threads will be spawned if true. Default is False
+
+        Raises:
+            Exception: If an error occurs while receiving data. The socket will be closed.
+        """
+
+        if not self.kernel_timestamps: self.enable_kernel_timestamps()
+
+        if self.connected: 
+            was_connected = True
+            self.disconnect()
+        else: was_connected = False
+
+        if count == "continual":
+            try:
+                while True:
+                    data, addr, arrival_ns = self._recieve_timestamped_once(buffer_size)
+                    self.recieved_count += 1
+
+                    self._dispatch(threaded, 1, len(data), data, addr, arrival_ns, key=addr)
+
+            finally:
+                self.socket.close()
+                raise Exception("Error thrown. Socket closed")
+
+        else:
+            for _ in range(count):
+                data, addr, arrival_ns = self._recieve_timestamped_once(buffer_size)
+                self.recieved_count += 1
+
+                self._dispatch(threaded, 1, len(data), data, addr, arrival_ns, key=addr)
+
+            if was_connected: self.reconnect()
+
+    def recieve_from_timestamped(self, IP: str=None, port: int=None, count: int | str="continual", buffer_size: int=1472, threaded: bool=False) -> None:
+        """
+        Recieves packets from a specified or connected IP address and port along with the kernel's arrival time for each\n
+        NOTE: Packet handler must be configured to accept a bytes 'data' AND an int 'arrival_ns' argument
+
+        Args:
+            IP (str, optional): IP address to connect to. Defaults to connected socket IP if None. Is set to None by default
+            port (int, optional): Port number to connect to. Defaults to connected socket port if None. Is set to None by default
+            count (int | str, optional): Number of packets to receive. Use "continual" to receive indefinitely. Is "continual" by default
+            buffer_size (int, optional): Maximum size of each packet in bytes. Defaults to 1472.
+            threaded (bool, optional): If True, each packet is handled in a separate thread. Defaults to False.
+
+        Raises:
+            Exception: If no destination is provided and was not connected using the 'connect_to' or 'reconnect' methods
+            Exception: If an error occurs during packet reception. The socket will be closed.
+        """
+
+        if IP is not None: self.connect_to(to_IP=IP, to_port=port)
+        else:
+            if self.connected is None or not self.connected: raise Exception("Please provide IP and port")
+
+        if not self.kernel_timestamps: self.enable_kernel_timestamps()
+
+        if count == "continual":
+            try:
+                while True:
+                    data, _, arrival_ns = self._recieve_timestamped_once(buffer_size)
+                    self.recieved_count += 1
+
+                    self._dispatch(threaded, 1, len(data), data, arrival_ns, key=(self.to_IP, self.to_port))
+
+            finally:
+                self.socket.close()
+                raise Exception("Error thrown. Socket closed")
+
+        else:
+            for _ in range(count):
+                data, _, arrival_ns = self._recieve_timestamped_once(buffer_size)
+                self.recieved_count += 1
+
+                self._dispatch(threaded, 1, len(data), data, arrival_ns, key=(self.to_IP, self.to_port))
+
+    def sendto(self, data: bytes | bytearray, to_IP: str, to_port: int) -> None:
+        """
+        Sends a UDP packet to a specific destination IP and port.
+
+        Args:
+            data (bytes | bytearray): The packet data to send.
+            to_IP (str): The target IP address.
+            to_port (int): The target port number.
+        """
+
+        self.socket.sendto(data, (to_IP, to_port))
+        if self.stats is not None: self.stats.count_sent(1, len(data))
+
+    def send(self, data: bytes | bytearray) -> None:
+        """
+        Sends a UDP packet using the connected socket.
+
+        This method assumes that the socket has already been connected using `connect_to`.
+
+        Args:
+            data (bytes | bytearray): The packet data to send.
+
+        Raises:
+            Exception: If the socket is not connected.
+        """
+        
+        if not self.connected: raise Exception("Must connect using 'connect_to' method in order to use this")
+        self.socket.send(data)
+        if self.stats is not None: self.stats.count_sent(1, len(data))
+
+    def send_queue(self, data: List[bytes | bytearray], IP: str="", port: int=-1, batched: bool=False) -> None:
+        """
+        Sends a sequence of UDP packets either to a connected peer or to the specified destination.
+
+        If the communicator is connected, packets are sent using the `send` method.
+        Otherwise, a destination IP and port must be provided to use `sendto`.
+
+        Args:
+            data (List[bytes | bytearray]): A list of packet data to send.
+            IP (str, optional): Target IP address if not connected. Defaults to "".
+            port (int, optional): Target port if not connected. Defaults to -1.
+            batched (bool, optional): Send the whole queue with sendmmsg (see `send_batch`). Defaults to False.
+
+        Raises:
+            Exception: If no connection is active and no destination IP/port is provided.
+            OSError: If batched and the kernel stopped taking packets before the end of the queue.
+        """
+
+        if batched:
+            sent = self.send_batch(data, IP, port)
+            if sent < len(data): raise OSError(f"Only {sent} of {len(data)} packets were sent")
+            return
+
+        if self.pacer is not None:
+            self._send_paced(data, IP, port)
+            return
+        
+        if self.connected:
+            for item in data:
+                self.send(item)
+
+        else:
+            if IP == "" or port == -1: raise Exception("Please provide IP and port or connect")
+
+            for item in data:
+                self.sendto(data=item, to_IP=IP, to_port=port)
+
+    def set_pacing(self, rate: float | None, burst: float | None=None) -> Token_Bucket_Pacer | None:
+        """
+        Rate limits `send_queue` and `send_batch` with a token bucket. `send` and `sendto` are never paced, so
+        control datagrams sent alongside a paced bulk transfer go out immediately.
+
+        Args:
+            rate (float | None): Bytes per second. None removes pacing.
+            burst (float | None, optional): Bucket size in bytes. Defaults to 20 ms worth of rate (see Token_Bucket_Pacer).
+
+        Returns:
+            Token_Bucket_Pacer | None: The new pacer, whose `snapshot` reports its accuracy. None if pacing was removed.
+        """
+
+        self.pacer = None if rate is None else Token_Bucket_Pacer(rate, burst)
+        return self.pacer
+
+    def _send_paced(self, data: List[bytes | bytearray], IP: str, port: int, batched: bool=False) -> int:
+        """
+        Sends packets through the pacer. Batched sends are split into chunks of at most one bucket.
+
+        Args:
+            data (List[bytes | bytearray]): Packets to send.
+            IP (str): Target IP address if not connected.
+            port (int): Target port if not connected.
+            batched (bool, optional): Send each chunk with sendmmsg. Defaults to False.
+
+        Returns:
+            int: Number of packets sent.
+
+        Raises:
+            Exception: If no connection is active and no destination IP/port is provided.
+        """
+
+        if not self.connected and (IP == "" or port == -1): raise Exception("Please provide IP and port or connect")
+
+        pacer = self.pacer
+
+        if not batched:
+            for item in data:
+                pacer.wait(len(item))
+
+                if self.connected: self.send(item)
+                else: self.sendto(data=item, to_IP=IP, to_port=port)
+
+            return len(data)
+
+        sent = 0
+        start = 0
+
+        while start < len(data):
+            end = start
+            nbytes = 0
+
+            while end < len(data) and (end == start or nbytes + len(data[end]) <= pacer.burst):
+                nbytes += len(data[end])
+                end += 1
+
+            pacer.wait(nbytes)
+
+            if self.connected: chunk_sent = udp_send_batch(self.socket.fileno(), data[start:end])
+            else: chunk_sent = udp_send_batch(self.socket.fileno(), data[start:end], IP, port)
+
+            if self.stats is not None: self.stats.count_sent(chunk_sent, sum(len(item) for item in data[start:start + chunk_sent]))
+            sent += chunk_sent
+            if chunk_sent < end - start: break
+
+            start = end
+
+        return sent
+
+    def stats_snapshot(self) -> dict | None:
+        """
+        Reads the performance counters. Latencies are in seconds.
+
+        Returns:
+            dict | None: Network_Communicator.stats_snapshot() plus "pacer" (Token_Bucket_Pacer.snapshot(), or None
+            when unpaced), or None if stats are disabled.
+        """
+
+        snapshot = super().stats_snapshot()
+        if snapshot is not None: snapshot["pacer"] = self.pacer.snapshot() if self.pacer is not None else None
+
+        return snapshot
+
+    def send_batch(self, data: List[bytes | bytearray], IP: str="", port: int=-1) -> int:
+        """
+        Sends a sequence of UDP packets, handing as many as possible to the kernel per sendmmsg syscall.
+
+        Falls back to one syscall per packet when the pudp_tools C extension has not been built.\n
+        NOTE: If the kernel stops taking packets partway (e.g. the send buffer is full), the packets sent so far are
+        counted and the rest are not sent, so the returned count can be short of len(data). `send_queue` raises instead
+
+        Args:
+            data (List[bytes | bytearray]): A list of packet data to send.
+            IP (str, optional): Target IP address if not connected. Defaults to "".
+            port (int, optional): Target port if not connected. Defaults to -1.
+
+        Returns:
+            int: Number of packets sent, from the start of data. May be less than len(data).
+
+        Raises:
+            Exception: If no connection is active and no destination IP/port is provided.
+            OSError: If not even the first packet could be sent.
+        """
+
+        if not self.connected and (IP == "" or port == -1): raise Exception("Please provide IP and port or connect")
+
+        if not HAS_BATCHED_UDP:
+            self.send_queue(data, IP, port)
+            return len(data)
+
+        if self.pacer is not None: return self._send_paced(data, IP, port, batched=True)
+
+        if self.connected: sent = udp_send_batch(self.socket.fileno(), data)
+        else: sent = udp_send_batch(self.socket.fileno(), data, IP, port)
+
+        if self.stats is not None: self.stats.count_sent(sent, sum(len(item) for item in data[:sent]))
+        return sent
+
+    def _recieve_batch(self, batch_size: int, buffer_size: int, with_addresses: bool) -> list:
+        """
+        Blocks until at least one packet arrives (or the socket's timeout passes), then returns up to batch_size
+        queued packets.
+
+        Args:
+            batch_size (int): Maximum number of packets to return.
+            buffer_size (int): The largest packet (in bytes) that can be recieved.
+            with_addresses (bool): Return (data, address) tuples instead of bare data.
+
+        Returns:
+            list: Recieved packets, oldest first.
+
+        Raises:
+            TimeoutError: If the socket has a timeout and no packet arrived in time.
+            BlockingIOError: If the socket is non-blocking and no packet is queued.
+        """
+
+        timeout = self.socket.gettimeout()
+
+        if HAS_BATCHED_UDP:
+            return udp_recv_batch(self.socket.fileno(), batch_size, buffer_size, with_addresses, -1.0 if timeout is None else timeout)
+
+        # Pure Python fallback: wait for the first packet as the socket is set up to, then drain whatever is queued
+        data, addr = self.socket.recvfrom(buffer_size)
+        batch = [(data, addr) if with_addresses else data]
+
+        self.socket.setblocking(False)
+
+        try:
+            while len(batch) < batch_size:
+                try: data, addr = self.socket.recvfrom(buffer_size)
+                except BlockingIOError: break
+
+                batch.append((data, addr) if with_addresses else data)
+
+        finally: self.socket.settimeout(timeout)
+
+        return batch
+
+    def recieve_all_batched(self, count: int | str="continual", batch_size: int=32, buffer_size: int=1472, threaded: bool=False) -> None:
+        """
+        Recieves packets from the socket in batches of up to batch_size packets per syscall\n
+        NOTE: Packet handler must be configured to accept ONLY a list of (bytes 'data', 'address') tuples\n
+        NOTE: This communicator will disconnect from any connected peers to recieve using this function
+
+        Args:
+            count (int | str, optional): How many batches should be handled before exiting. Default is "continual" for continuous recieving
+            batch_size (int, optional): The most packets handed to the handler at once. Default is 32
+            buffer_size (int, optional): The largest packet (in bytes) that can be recieved. Default is 1472
+            threaded (bool, optional): A thread will be spawned per batch if true. Default is False
+
+        Raises:
+            Exception: If an error occurs while receiving data. The socket will be closed.
+        """
+
+        if self.connected: 
+            was_connected = True
+            self.disconnect()
+        else: was_connected = False
+
+        if count == "continual":
+            try:
+                while True:
+                    batch = self._recieve_batch(batch_size, buffer_size, True)
+                    self.recieved_count += len(batch)
+
+                    nbytes = sum(len(data) for data, _ in batch) if self.stats is not None else 0
+                    self._dispatch(threaded, len(batch), nbytes, batch, key=self._batch_key(batch))
+
+            finally:
+                self.socket.close()
+                raise Exception("Error thrown. Socket closed")
+
+        else:
+            for _ in range(count):
+                batch = self._recieve_batch(batch_size, buffer_size, True)
+                self.recieved_count += len(batch)
+
+                nbytes = sum(len(data) for data, _ in batch) if self.stats is not None else 0
+                self._dispatch(threaded, len(batch), nbytes, batch, key=self._batch_key(batch))
+
+            if was_connected: self.reconnect()
+
+    def recieve_from_batched(self, IP: str=None, port: int=None, count: int | str="continual", batch_size: int=32, buffer_size: int=1472, threaded: bool=False) -> None:
+        """
+        Recieves packets from a specified or connected IP address and port in batches of up to batch_size packets per syscall\n
+        NOTE: Packet handler must be configured to accept ONLY a list of bytes 'data'
+
+        Args:
+            IP (str, optional): IP address to connect to. Defaults to connected socket IP if None. Is set to None by default
+            port (int, optional): Port number to connect to. Defaults to connected socket port if None. Is set to None by default
+            count (int | str, optional): Number of batches to receive. Use "continual" to receive indefinitely. Is "continual" by default
+            batch_size (int, optional): The most packets handed to the handler at once. Defaults to 32.
+            buffer_size (int, optional): Maximum size of each packet in bytes. Defaults to 1472.
+            threaded (bool, optional): If True, each batch is handled in a separate thread. Defaults to False.
+
+        Raises:
+            Exception: If no destination is provided and was not connected using the 'connect_to' or 'reconnect' methods
+            Exception: If an error occurs during packet reception. The socket will be closed.
+        """
+
+        if IP is not None: self.connect_to(to_IP=IP, to_port=port)
+        else:
+            if self.connected is None or not self.connected: raise Exception("Please provide IP and port")
+
+        if count == "continual":
+            try:
+                while True:
+                    batch = self._recieve_batch(batch_size, buffer_size, False)
+                    self.recieved_count += len(batch)
+
+                    nbytes = sum(len(data) for data in batch) if self.stats is not None else 0
+                    self._dispatch(threaded, len(batch), nbytes, batch, key=(self.to_IP, self.to_port))
+
+            finally:
+                self.socket.close()
+                raise Exception("Error thrown. Socket closed")
+
+        else:
+            for _ in range(count):
+                batch = self._recieve_batch(batch_size, buffer_size, False)
+                self.recieved_count += len(batch)
+
+                nbytes = sum(len(data) for data in batch) if self.stats is not None else 0
+                self._dispatch(threaded, len(batch), nbytes, batch, key=(self.to_IP, self.to_port))
+
+    def _get_buffer_pool(self, buffer_size: int, pool_size: int) -> Buffer_Pool:
+        """
+        Returns the communicator's Buffer_Pool, replacing it if the requested geometry changed.
+
+        Args:
+            buffer_size (int): Required slot size in bytes.
+            pool_size (int): Required number of slots.
+
+        Returns:
+            Buffer_Pool: A pool with matching slot size and count.
+        """
+
+        pool = self.buffer_pool
+        if pool is None or pool.slot_size != buffer_size or pool.slot_count != pool_size:
+            pool = self.buffer_pool = Buffer_Pool(buffer_size, pool_size)
+
+        return pool
+
+    def _handle_pooled(self, pool: Buffer_Pool, slot: int, recieved_at: float | None, *arguments) -> None:
+        """
+        Runs the packet handler on a pooled slot, then gives the slot back to the pool.
+
+        Args:
+            pool (Buffer_Pool): Pool the slot was acquired from.
+            slot (int): Index of the slot holding the packet.
+            recieved_at (float | None): perf_counter() timestamp of when the packet was recieved, None if not timed.
+            *arguments: Arguments to pass to the packet handler function.
+        """
+
+        try: self._run_handler(recieved_at, arguments)
+        finally: pool.release(slot)
+
+    def _recieve_into_once(self, pool: Buffer_Pool, with_address: bool, threaded: bool) -> None:
+        """
+        Recieves one packet into a free pool slot and dispatches it to the packet handler.
+
+        Args:
+            pool (Buffer_Pool): Pool to recieve into.
+            with_address (bool): Use recvfrom_into and pass the source address to the handler.
+            threaded (bool): Handle the packet on the executor instead of inline.
+        """
+
+        slot = pool.acquire()
+
+        try:
+            if with_address:
+                nbytes, addr = self.socket.recvfrom_into(pool.views[slot])
+                arguments = (pool.views[slot][:nbytes], addr)
+            else:
+                nbytes = self.socket.recv_into(pool.views[slot])
+                arguments = (pool.views[slot][:nbytes],)
+        except BaseException:
+            pool.release(slot)
+            raise
+
+        self.recieved_count += 1
+
+        stats = self.stats
+        if stats is not None:
+            stats.count_recieved(1, nbytes)
+            recieved_at = perf_counter()
+        else: recieved_at = None
+
+        observer = self.recieve_observer
+        if observer is not None: observer(*arguments)
+
+        # Bypasses the handler queue: a dropped packet would leak its slot, and pool_size already bounds the backlog
+        if threaded: self.executor.submit(self._handle_pooled, pool, slot, recieved_at, *arguments)
+        else: self._handle_pooled(pool, slot, recieved_at, *arguments)
+
+    def recieve_all_into(self, count: int | str="continual", buffer_size: int=1472, pool_size: int=32, threaded: bool=False) -> None:
+        """
+        Recieves packets from the socket into preallocated buffers, without allocating a bytes object per packet\n
+        NOTE: Packet handler must be configured to accept a memoryview 'data' AND an str 'address' argument\n
+        NOTE: 'data' is only valid until the handler returns. Copy it (bytes(data)) to keep it longer\n
+        NOTE: This communicator will disconnect from any connected peers to recieve using this function
+
+        Args:
+            count (int | str, optional): How many packets should be handled before exiting. Default is "continual" for continuous recieving
+            buffer_size (int, optional): The largest packet (in bytes) that can be recieved. Default is 1472
+            pool_size (int, optional): Number of preallocated slots, i.e. how many packets can be in flight at once. Default is 32
+            threaded (bool, optional): Threads will be spawned if true. Recieving blocks while all slots are in use. Default is False
+
+        Raises:
+            Exception: If an error occurs while receiving data. The socket will be closed.
+        """
+
+        pool = self._get_buffer_pool(buffer_size, pool_size)
+
+        if self.connected: 
+            was_connected = True
+            self.disconnect()
+        else: was_connected = False
+
+        if count == "continual":
+            try:
+                while True: self._recieve_into_once(pool, True, threaded)
+
+            finally:
+                self.socket.close()
+                raise Exception("Error thrown. Socket closed")
+
+        else:
+            for _ in range(count): self._recieve_into_once(pool, True, threaded)
+
+            if was_connected: self.reconnect()
+
+    def recieve_from_into(self, IP: str=None, port: int=None, count: int | str="continual", buffer_size: int=1472, pool_size: int=32, threaded: bool=False) -> None:
+        """
+        Recieves packets from a specified or connected IP address and port into preallocated buffers\n
+        NOTE: Packet handler must be configured to accept ONLY a memoryview 'data' argument\n
+        NOTE: 'data' is only valid until the handler returns. Copy it (bytes(data)) to keep it longer
+
+        Args:
+            IP (str, optional): IP address to connect to. Defaults to connected socket IP if None. Is set to None by default
+            port (int, optional): Port number to connect to. Defaults to connected socket port if None. Is set to None by default
+            count (int | str, optional): Number of packets to receive. Use "continual" to receive indefinitely. Is "continual" by default
+            buffer_size (int, optional): Maximum size of each packet in bytes. Defaults to 1472.
+            pool_size (int, optional): Number of preallocated slots, i.e. how many packets can be in flight at once. Defaults to 32.
+            threaded (bool, optional): If True, each packet is handled in a separate thread. Defaults to False.
+
+        Raises:
+            Exception: If no destination is provided and was not connected using the 'connect_to' or 'reconnect' methods
+            Exception: If an error occurs during packet reception. The socket will be closed.
+        """
+
+        if IP is not None: self.connect_to(to_IP=IP, to_port=port)
+        else:
+            if self.connected is None or not self.connected: raise Exception("Please provide IP and port")
+
+        pool = self._get_buffer_pool(buffer_size, pool_size)
+
+        if count == "continual":
+            try:
+                while True: self._recieve_into_once(pool, False, threaded)
+
+            finally:
+                self.socket.close()
+                raise Exception("Error thrown. Socket closed")
+
+        else:
+            for _ in range(count): self._recieve_into_once(pool, False, threaded)
+
+    def recieve_all(self, count: int | str="continual", buffer_size: int=1472, threaded: bool=False) -> None:
+        """
+        Recieves packets from the socket\n
+        NOTE: Packet handler must be configured to accept a bytes 'data' AND an str 'address' argument\n
+        NOTE: This communicator will disconnect from any connected peers to recieve using this function
+
+        Args:
+            count (int, optional): How many packets revice_from should handle before exiting. Default is "continual" for continuous recieving
+            buffer_size (int, optional): The largest packet (in bytes) that can be recieved. Default is 1472
+            threaded (bool, optional): Threads will be spawned if true. Default is False
+
+        Raises:
+            Exception: If an error occurs while receiving data. The socket will be closed.
+        """
+
+        if self.connected: 
+            was_connected = True
+            self.disconnect()
+        else: was_connected = False
+
+        if count == "continual":
+            try:
+                while True:
+                    data, addr = self.socket.recvfrom(buffer_size)
+                    self.recieved_count += 1
+
+                    self._dispatch(threaded, 1, len(data), data, addr, key=addr)
+
+            finally:
+                self.socket.close()
+                raise Exception("Error thrown. Socket closed")
+
+        else:
+            for _ in range(count):
+                data, addr = self.socket.recvfrom(buffer_size)
+                self.recieved_count += 1
+
+                self._dispatch(threaded, 1, len(data), data, addr, key=addr)
+
+            if was_connected: self.reconnect()
+
+    def recieve_from(self, IP: str=None, port: int=None, count: int | str="continual", buffer_size: int=1472, threaded: bool=False) -> None:
+        """
+        Recieves packets from a specified or connected IP address and port\n
+        NOTE: Packet handler must be configured to accept ONLY a bytes 'data' argument
+
+        Args:
+            IP (str, optional): IP address to connect to. Defaults to connected socket IP if None. Is set to None by default
+            port (int, optional): Port number to connect to. Defaults to connected socket port if None. Is set to None by default
+            count (int | str, optional): Number of packets to receive. Use "continual" to receive indefinitely. Is "continual" by default
+            buffer_size (int, optional): Maximum size of each packet in bytes. Defaults to 1472.
+            threaded (bool, optional): If True, each packet is handled in a separate thread. Defaults to False.
+
+        Raises:
+            Exception: If no destination is provided and was not connected using the 'connect_to' or 'reconnect' methods
+            Exception: If an error occurs during packet reception. The socket will be closed.
+        """
+
+        if IP is not None: self.connect_to(to_IP=IP, to_port=port)
+        else:
+            if self.connected is None or not self.connected: raise Exception("Please provide IP and port")
+
+        if count == "continual":
+            try:
+                while True:
+                    data = self.socket.recv(buffer_size)
+                    self.recieved_count += 1
+
+                    self._dispatch(threaded, 1, len(data), data, key=(self.to_IP, self.to_port))
+                    
+            finally:
+                self.socket.close()
+                raise Exception("Error thrown. Socket closed")
+
+        else:
+            for _ in range(count):
+                data = self.socket.recv(buffer_size)
+                self.recieved_count += 1
+                
+                self._dispatch(threaded, 1, len(data), data, key=(self.to_IP, self.to_port))
+
+
+import asyncio
+
+
+class _Async_UDP_Protocol(asyncio.DatagramProtocol):
+    """asyncio protocol that forwards datagram transport events to an AsyncUDP_Communicator."""
+
+    def __init__(self, communicator):
+        self.communicator = communicator
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        self.communicator._on_datagram(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        self.communicator.last_error = exc
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.communicator._on_closed()
+
+    def pause_writing(self) -> None:
+        self.communicator.can_write.clear()
+
+    def resume_writing(self) -> None:
+        self.communicator.can_write.set()
+
+
+class AsyncUDP_Communicator:
+    """
+    An asyncio-native UDP communicator built on `loop.create_datagram_endpoint`, for use alongside `AsyncJoystick`
+    on a single event loop without any threads.
+
+    Packets are either passed to a packet_handler (plain function or coroutine function) as they arrive, or queued
+    for `recieve()` / `async for data, address in communicator`. When the queue is full, the oldest packet is dropped.
+
+    Attributes:
+        IP (str): Local IP address to bind to.
+        port (int): Local port number for communication.
+        packet_handler (Callable | None): Called with (data, address) for every packet. Packets are queued if None.
+        recieved_count (int): Counter that tracks how many packets have been received.
+        dropped_count (int): Number of queued packets discarded because the queue was full.
+        transport (asyncio.DatagramTransport | None): The datagram transport, set by `start`.
+        packets (asyncio.Queue | None): Packets waiting to be recieved, created by `start`.
+        can_write (asyncio.Event | None): Set while the transport accepts writes; cleared under backpressure.
+        to_IP (str): Remote IP address used by `send`.
+        to_port (int): Remote port number used by `send`.
+        connected (bool): Indicates if a default remote host has been set with `connect_to`.
+        started (bool): Indicates if the endpoint is open.
+        last_error (Exception | None): The most recent error reported by the transport (e.g. ICMP port unreachable).
+
+    Key Methods:
+        start() -> None: Opens the datagram endpoint on the running loop.
+        stop() -> None: Closes the endpoint and ends any `async for` loops.
+        sendto(data, to_IP, to_port) -> None: Sends a packet, waiting out transport backpressure.
+        send(data) -> None: Sends a packet to the host set with `connect_to`.
+        send_queue(data, IP="", port=-1) -> None: Sends several packets to the connected or provided destination.
+        recieve() -> tuple[bytes, tuple]: Awaits the next (data, address) packet.
+    """
+
+    def __init__(self, IP: str, port: int, packet_handler: Callable | None=None, max_queue: int=1024):
+        """
+        Prepares an asyncio UDP communicator. Nothing is bound until `start` is awaited.
+
+        Args:
+            IP (str): The local IP address to bind the socket to.
+            port (int): The local port number to bind the socket to.
+            packet_handler (Callable | None, optional): Handler for incoming (data, address) packets. Defaults to None (queue packets).
+            max_queue (int, optional): Most packets kept waiting for `recieve`. Defaults to 1024.
+        """
+
+        self.IP = IP
+        self.port = port
+
+        self.packet_handler = packet_handler
+        self.max_queue = max_queue
+
+        self.recieved_count = 0
+        self.dropped_count = 0
+
+        self.transport = None
+        self.packets = None
+        self.can_write = None
+
+        self.to_IP = None
+        self.to_port = None
+        self.connected = False
+
+        self.started = False
+        self.last_error = None
+        self._handler_tasks = set()
+
+    async def start(self) -> None:
+        """Bind the socket and start recieving on the running event loop."""
+
+        if self.started: return
+
+        loop = asyncio.get_running_loop()
+
+        self.packets = asyncio.Queue(maxsize=self.max_queue)
+        self.can_write = asyncio.Event()
+        self.can_write.set()
+
+        self.transport, _ = await loop.create_datagram_endpoint(lambda: _Async_UDP_Protocol(self), local_addr=(self.IP, self.port))
+        self.started = True
+
+    def stop(self) -> None:
+        """Close the endpoint, cancel running handler tasks and wake anything waiting on `recieve`."""
+
+        if not self.started: return
+
+        self.transport.close()
+        self._on_closed()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _on_datagram(self, data: bytes, addr: tuple) -> None:
+        """
+        Routes a recieved datagram to the packet handler or the packet queue.
+
+        Args:
+            data (bytes): Packet payload.
+            addr (tuple): (IP, port) of the sender.
+        """
+
+        self.recieved_count += 1
+
+        if self.packet_handler is not None:
+            result = self.packet_handler(data, addr)
+
+            if asyncio.iscoroutine(result):
+                task = asyncio.ensure_future(result)
+                self._handler_tasks.add(task)
+                task.add_done_callback(self._handler_tasks.discard)
+            return
+
+        if self.packets.full():
+            self.packets.get_nowait()
+            self.dropped_count += 1
+
+        self.packets.put_nowait((data, addr))
+
+    def _on_closed(self) -> None:
+        """Mark the communicator closed and release waiters. Safe to call more than once."""
+
+        if not self.started: return
+        self.started = False
+
+        for task in list(self._handler_tasks): task.cancel()
+
+        self.can_write.set()  # senders blocked on backpressure wake up and see the communicator is closed
+
+        # None marks the end of the stream for recieve()/async for
+        if self.packets.full(): self.packets.get_nowait()
+        self.packets.put_nowait(None)
+
+    def connect_to(self, to_IP: str, to_port: int) -> None:
+        """
+        Sets the default destination used by `send` and `send_queue`.
+
+        Args:
+            to_IP (str): Destination IP address.
+            to_port (int): Destination port number.
+        """
+
+        self.to_IP = to_IP
+        self.to_port = to_port
+        self.connected = True
+
+    def disconnect(self) -> None:
+        """Clears the default destination."""
+
+        self.connected = False
+
+    async def sendto(self, data: bytes | bytearray, to_IP: str, to_port: int) -> None:
+        """
+        Sends a UDP packet to a specific destination, first waiting until the transport is not paused.
+
+        Args:
+            data (bytes | bytearray): The packet data to send.
+            to_IP (str): The target IP address.
+            to_port (int): The target port number.
+
+        Raises:
+            Exception: If the communicator has not been started or was stopped.
+        """
+
+        if not self.started: raise Exception("Communicator is not started. Await 'start' first")
+
+        if not self.can_write.is_set():
+            await self.can_write.wait()
+            if not self.started: raise Exception("Communicator is not started. Await 'start' first")  # stopped while paused
+
+        self.transport.sendto(data, (to_IP, to_port))
+
+    async def send(self, data: bytes | bytearray) -> None:
+        """
+        Sends a UDP packet to the destination set with `connect_to`.
+
+        Args:
+            data (bytes | bytearray): The packet data to send.
+
+        Raises:
+            Exception: If no destination was set.
+        """
+
+        if not self.connected: raise Exception("Must connect using 'connect_to' method in order to use this")
+        await self.sendto(data, self.to_IP, self.to_port)
+
+    async def send_queue(self, data: List[bytes | bytearray], IP: str="", port: int=-1) -> None:
+        """
+        Sends a sequence of UDP packets either to the connected peer or to the specified destination.
+
+        Args:
+            data (List[bytes | bytearray]): A list of packet data to send.
+            IP (str, optional): Target IP address if not connected. Defaults to "".
+            port (int, optional): Target port if not connected. Defaults to -1.
+
+        Raises:
+            Exception: If no connection is active and no destination IP/port is provided.
+        """
+
+        if self.connected: IP, port = self.to_IP, self.to_port
+        elif IP == "" or port == -1: raise Exception("Please provide IP and port or connect")
+
+        for item in data: await self.sendto(item, IP, port)
+
+    async def recieve(self) -> tuple:
+        """
+        Awaits the next queued packet. Only usable when no packet_handler is set.
+
+        Returns:
+            tuple[bytes, tuple]: (data, address) of the packet.
+
+        Raises:
+            Exception: If a packet handler is set, or the communicator was stopped.
+        """
+
+        if self.packet_handler is not None: raise Exception("Packets are passed to the packet handler, not queued")
+        if self.packets is None: raise Exception("Communicator is not started. Await 'start' first")
+
+        packet = await self.packets.get()
+
+        if packet is None:
+            self.packets.put_nowait(None)  # keep the end marker for any other waiters
+            raise Exception("Communicator stopped")
+
+        return packet
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> tuple:
+        try: return await self.recieve()
+        except Exception:
+            if not self.started: raise StopAsyncIteration
+            raise
+
+
+import multiprocessing
+import os
+
+shard_counter_fields = ("recieved", "bytes", "handler_errors")
+
+
+def _shard_worker(index: int, IP: str, port: int, packet_handler: Callable, buffer_size: int, counters, stop_event, ready) -> None:
+    """
+    Recieve loop run inside each Sharded_UDP_Receiver worker process.
+
+    Args:
+        index (int): Shard number, used to locate this shard's counters.
+        IP (str): Local IP address to bind to.
+        port (int): Local port number shared by every shard.
+        packet_handler (Callable): Handler called with (data, address) for every packet.
+        buffer_size (int): The largest packet (in bytes) that can be recieved.
+        counters (multiprocessing.Array): Shared counters, `len(shard_counter_fields)` slots per shard.
+        stop_event (multiprocessing.Event): Set by the parent to end the loop.
+        ready (multiprocessing.Semaphore): Released once the socket is bound.
+    """
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((IP, port))
+    sock.settimeout(0.25)  # how often the stop event is checked while idle
+    ready.release()
+
+    base = index * len(shard_counter_fields)
+
+    try:
+        while not stop_event.is_set():
+            try: data, addr = sock.recvfrom(buffer_size)
+            except socket.timeout: continue
+
+            counters[base] += 1
+            counters[base + 1] += len(data)
+
+            try: packet_handler(data, addr)
+            except Exception:
+                counters[base + 2] += 1
+                traceback.print_exc()
+    finally:
+        sock.close()
+
+
+class Sharded_UDP_Receiver:
+    """
+    Spreads recieving on one IP/port across several worker processes, so packet handlers are not limited by the GIL.
+
+    Every worker binds its own SO_REUSEPORT socket to the same address and the kernel balances incoming flows across
+    them. Balancing is per flow (source IP/port), so a single sender always lands on the same shard -- the gain
+    comes from several senders or several source ports.\n
+    NOTE: packet_handler runs in another process. It must be picklable (a module-level function) when the
+    multiprocessing start method is not fork, and it cannot change state in the parent process.
+
+    Attributes:
+        IP (str): Local IP address the shards bind to.
+        port (int): Local port number the shards share.
+        packet_handler (Callable): Handler called with (data, address) for every packet.
+        shards (int): Number of worker processes.
+        buffer_size (int): The largest packet (in bytes) that can be recieved.
+        processes (list[multiprocessing.Process]): The running worker processes.
+        started (bool): Indicates if the workers are running.
+
+    Key Methods:
+        start(timeout=5.0) -> None: Starts the workers and waits for every shard to bind.
+        stop(timeout=1.0) -> None: Signals the workers to exit and joins them.
+        counters() -> dict: Returns counters totalled across shards, plus a per-shard breakdown.
+    """
+
+    def __init__(self, IP: str, port: int, packet_handler: Callable, shards: int | None=None, buffer_size: int=1472):
+        """
+        Prepares a sharded receiver. No processes are started until `start` is called.
+
+        Args:
+            IP (str): The local IP address to bind to.
+            port (int): The local port number to bind to.
+            packet_handler (Callable): Handler called with (data, address) for every packet.
+            shards (int | None, optional): Number of worker processes. Defaults to the number of CPU cores.
+            buffer_size (int, optional): The largest packet (in bytes) that can be recieved. Defaults to 1472.
+
+        Raises:
+            Exception: If the platform has no SO_REUSEPORT.
+        """
+
+        if not hasattr(socket, "SO_REUSEPORT"): raise Exception("SO_REUSEPORT is not supported on this platform")
+
+        self.IP = IP
+        self.port = port
+        self.packet_handler = packet_handler
+        self.shards = shards if shards is not None else os.cpu_count() or 1
+        self.buffer_size = buffer_size
+
+        self._counters = multiprocessing.Array("Q", self.shards * len(shard_counter_fields), lock=False)
+        self._stop_event = multiprocessing.Event()
+        self._ready = multiprocessing.Semaphore(0)
+
+        self.processes = []
+        self.started = False
+
+        at_exit(self.stop)
+
+    def start(self, timeout: float=5.0) -> None:
+        """
+        Starts one worker process per shard and waits until each has bound its socket.
+
+        Args:
+            timeout (float, optional): Seconds to wait for each shard to bind. Defaults to 5.0.
+
+        Raises:
+            Exception: If a shard fails to bind in time. Any started shards are stopped.
+        """
+
+        if self.started: return
+
+        self._stop_event.clear()
+
+        for index in range(self.shards):
+            process = multiprocessing.Process(
+                target=_shard_worker,
+                args=(index, self.IP, self.port, self.packet_handler, self.buffer_size, self._counters, self._stop_event, self._ready),
+                daemon=True,
+            )
+            process.start()
+            self.processes.append(process)
+
+        self.started = True
+
+        for _ in range(self.shards):
+            if not self._ready.acquire(timeout=timeout):
+                self.stop()
+                raise Exception(f"Not every shard bound to {self.IP}:{self.port}. Is the port taken by a socket without SO_REUSEPORT?")
+
+    def stop(self, timeout: float=1.0) -> None:
+        """
+        Signals every shard to exit, then joins them, terminating any that do not exit in time.
+
+        Args:
+            timeout (float, optional): Seconds to wait for each shard. Defaults to 1.0.
+        """
+
+        if not self.started: return
+
+        self._stop_event.set()
+
+        for process in self.processes:
+            process.join(timeout)
+            if process.is_alive(): process.terminate()
+
+        self.processes = []
+        self.started = False
+
+    def counters(self) -> dict:
+        """
+        Reads the shared shard counters. Counters keep their values after `stop`.
+
+        Returns:
+            dict: Totals for each of `shard_counter_fields`, plus "shards": a list of per-shard dicts.
+        """
+
+        width = len(shard_counter_fields)
+        values = self._counters[:]
+
+        per_shard = [dict(zip(shard_counter_fields, values[index * width:(index + 1) * width])) for index in range(self.shards)]
+        totals = {field: sum(shard[field] for shard in per_shard) for field in shard_counter_fields}
+        totals["shards"] = per_shard
+
+        return totals
+
+
+from collections import namedtuple
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Message_Type:
+    """
+    A fixed-size binary message: one type-id byte followed by fields packed with a precompiled struct.Struct.
+
+    Attributes:
+        type_id (int): Byte (0 - 255) identifying the message on the wire.
+        name (str): Unique message name. Also the name of the decoded namedtuple.
+        fields (list[str]): Field names, in packing order.
+        format (str): struct format of the fields without a byte order prefix (e.g. "hhhB"). Always little-endian.
+        handler (Callable | None): Called with (message, address) when this type is recieved.
+        codec (struct.Struct): Precompiled codec for the type id plus fields.
+        size (int): Size of an encoded message in bytes, type id included.
+        tuple_type (type): namedtuple class messages are decoded into.
+    """
+
+    type_id: int
+    name: str
+    fields: list[str]
+    format: str
+    handler: Callable | None = None
+    codec: struct.Struct = field(init=False, repr=False)
+    size: int = field(init=False)
+    tuple_type: type = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if not 0 <= self.type_id <= 255: raise Exception(f"Message type id {self.type_id} must fit in one byte")
+        if self.format and self.format[0] in "@=<>!": raise Exception("Leave the byte order out of the message format. Messages are always little-endian")
+
+        self.codec = struct.Struct("<B" + self.format)
+        self.size = self.codec.size
+        self.tuple_type = namedtuple(self.name, self.fields)
+
+        if len(self.fields) != len(self.codec.unpack(bytes(self.size))) - 1:
+            raise Exception(f"Message {self.name} has {len(self.fields)} fields but format '{self.format}' packs a different number of values")
+
+    def pack(self, *values) -> bytes:
+        """
+        Encodes one message, type id included.
+
+        Args:
+            *values: Field values, in the order of `fields`.
+
+        Returns:
+            bytes: The encoded message.
+        """
+
+        return self.codec.pack(self.type_id, *values)
+
+    def unpack_from(self, data: bytes | bytearray | memoryview, offset: int=0) -> tuple:
+        """
+        Decodes one message starting at offset (where its type id byte is).
+
+        Args:
+            data (bytes | bytearray | memoryview): Buffer holding the message.
+            offset (int, optional): Position of the type id byte. Defaults to 0.
+
+        Returns:
+            tuple: A namedtuple of the message's fields.
+        """
+
+        return self.tuple_type._make(self.codec.unpack_from(data, offset)[1:])
+
+
+class Message_Registry:
+    """
+    A registry of Message_Types that encodes messages, packs several into one datagram, and routes recieved
+    datagrams to per-type handlers through a 256-entry dispatch table.
+
+    Use `packet_handler` as the packet handler of a UDP_Communicator (it works for both recieve_all and
+    recieve_from) and register a handler per message type:
+
+        registry = Message_Registry()
+        registry.register(1, "thrust", ["x", "y", "z"], "hhh", handle_thrust)
+        comm = UDP_Communicator("0.0.0.0", 5000, packet_handler=registry.packet_handler)
+
+    Attributes:
+        types (list[Message_Type | None]): Dispatch table indexed by type id.
+        types_by_name (dict[str, Message_Type]): Registered types by name.
+        unhandled_count (int): Number of recieved messages whose type has no handler.
+
+    Key Methods:
+        register(type_id, name, fields, format, handler=None) -> Message_Type: Declares a message type.
+        set_handler(name, handler) -> None: Sets or replaces the handler of a registered type.
+        encode(name, *values) -> bytes: Encodes one message.
+        encode_many(messages) -> bytes: Packs several (name, values) messages into one datagram.
+        decode(data) -> list[tuple[Message_Type, tuple]]: Decodes every message in a datagram.
+        dispatch(data, address=None) -> int: Decodes a datagram and calls the handler of each message.
+        packet_handler(data, address=None) -> None: `dispatch` with the UDP_Communicator packet handler signature.
+    """
+
+    def __init__(self):
+        """Initializes an empty registry."""
+
+        self.types = [None] * 256
+        self.types_by_name = {}
+        self.unhandled_count = 0
+
+    def register(self, type_id: int, name: str, fields: list[str], format: str, handler: Callable | None=None) -> Message_Type:
+        """
+        Declares a message type.
+
+        Args:
+            type_id (int): Byte identifying the message on the wire.
+            name (str): Unique message name.
+            fields (list[str]): Field names, in packing order.
+            format (str): struct format of the fields, without byte order.
+            handler (Callable | None, optional): Called with (message, address) when recieved. Defaults to None.
+
+        Returns:
+            Message_Type: The registered type.
+
+        Raises:
+            Exception: If the type id doesn't fit in a byte.
+            NameError: If the type id or name is already registered.
+        """
+
+        if not 0 <= type_id <= 255: raise Exception(f"Message type id {type_id} out of range. Must be 0 - 255")
+        if self.types[type_id] is not None: raise NameError(f"Message type id {type_id} is already used by {self.types[type_id].name}")
+        if name in self.types_by_name: raise NameError(f"Message name {name} is already registered")
+
+        message_type = Message_Type(type_id, name, list(fields), format, handler)
+
+        self.types[type_id] = message_type
+        self.types_by_name[name] = message_type
+
+        return message_type
+
+    def set_handler(self, name: str, handler: Callable | None) -> None:
+        """
+        Sets the handler of a registered message type.
+
+        Args:
+            name (str): Name of the message type.
+            handler (Callable | None): Called with (message, address), or None to ignore the type.
+        """
+
+        self.types_by_name[name].handler = handler
+
+    def encode(self, name: str, *values) -> bytes:
+        """
+        Encodes one message.
+
+        Args:
+            name (str): Name of the message type.
+            *values: Field values, in field order.
+
+        Returns:
+            bytes: The encoded message, ready to send on its own or concatenate with others.
+        """
+
+        return self.types_by_name[name].pack(*values)
+
+    def encode_many(self, messages: list[tuple[str, tuple]]) -> bytes:
+        """
+        Packs several messages back to back into one datagram.
+
+        Args:
+            messages (list[tuple[str, tuple]]): (name, values) pairs.
+
+        Returns:
+            bytes: The concatenated messages.
+        """
+
+        types_by_name = self.types_by_name
+        return b"".join([types_by_name[name].pack(*values) for name, values in messages])
+
+    def decode(self, data: bytes | bytearray | memoryview) -> list[tuple[Message_Type, tuple]]:
+        """
+        Decodes every message in a datagram.
+
+        Args:
+            data (bytes | bytearray | memoryview): The recieved datagram.
+
+        Returns:
+            list[tuple[Message_Type, tuple]]: (type, message namedtuple) for each message, in order.
+
+        Raises:
+            Exception: If a type id is unknown or a message is truncated.
+        """
+
+        types = self.types
+        messages = []
+
+        offset = 0
+        end = len(data)
+
+        while offset < end:
+            message_type = types[data[offset]]
+            if message_type is None: raise Exception(f"Unknown message type id {data[offset]} at byte {offset}")
+            if offset + message_type.size > end: raise Exception(f"Truncated {message_type.name} message at byte {offset}")
+
+            messages.append((message_type, message_type.unpack_from(data, offset)))
+            offset += message_type.size
+
+        return messages
+
+    def dispatch(self, data: bytes | bytearray | memoryview, address: tuple | None=None) -> int:
+        """
+        Decodes a datagram and calls each message's type handler with (message, address).
+
+        Args:
+            data (bytes | bytearray | memoryview): The recieved datagram.
+            address (tuple | None, optional): Source address of the datagram, passed through to handlers.
+
+        Returns:
+            int: Number of messages handled.
+        """
+
+        handled = 0
+
+        for message_type, message in self.decode(data):
+            if message_type.handler is None:
+                self.unhandled_count += 1
+                continue
+
+            message_type.handler(message, address)
+            handled += 1
+
+        return handled
+
+    def packet_handler(self, data: bytes | bytearray | memoryview, address: tuple | None=None) -> None:
+        """
+        Packet handler for UDP_Communicator that dispatches every message in the packet.
+
+        Args:
+            data (bytes | bytearray | memoryview): The recieved datagram.
+            address (tuple | None, optional): Source address, when recieving with recieve_all.
+        """
+
+        self.dispatch(data, address)
+
+
+import selectors
+
+tcp_frame_header = struct.Struct("!I")
+
+
+class Stream_Reassembler:
+    """
+    Splits a TCP byte stream into length-prefixed messages (4-byte big-endian length, then payload).
+
+    Bytes are recieved with recv_into straight into one reusable buffer, so partial reads are reassembled without
+    concatenating bytes objects. The buffer grows only when a single message is larger than it.
+
+    Attributes:
+        buffer (bytearray): Recieve buffer.
+        start (int): Index of the first unconsumed byte in the buffer.
+        end (int): Index one past the last recieved byte in the buffer.
+        max_message_size (int): Largest accepted message payload in bytes.
+    """
+
+    def __init__(self, buffer_size: int=65536, max_message_size: int=16 * 1024 * 1024):
+        """
+        Args:
+            buffer_size (int, optional): Initial buffer size in bytes. Defaults to 65536.
+            max_message_size (int, optional): Largest accepted message payload in bytes. Defaults to 16 MiB.
+        """
+
+        self.buffer = bytearray(buffer_size)
+        self._view = memoryview(self.buffer)
+        self.start = 0
+        self.end = 0
+        self.max_message_size = max_message_size
+
+    def _make_room(self, needed: int) -> None:
+        """
+        Moves unconsumed bytes to the front of the buffer, growing it if it cannot hold needed bytes.
+
+        Args:
+            needed (int): Bytes the buffer must be able to hold from the front.
+        """
+
+        pending = self.end - self.start
+
+        if needed > len(self.buffer):
+            buffer = bytearray(max(needed, 2 * len(self.buffer)))
+            buffer[:pending] = self._view[self.start:self.end]
+
+            self._view.release()
+            self.buffer = buffer
+            self._view = memoryview(buffer)
+        else:
+            self.buffer[:pending] = self._view[self.start:self.end]
+
+        self.start = 0
+        self.end = pending
+
+    def recv_from(self, sock: socket.socket) -> list[bytes] | None:
+        """
+        Does one recv_into on sock and returns every message it completed.
+
+        Args:
+            sock (socket.socket): Connected stream socket with data ready.
+
+        Returns:
+            list[bytes] | None: Completed messages (possibly none), or None if the peer closed the connection.
+
+        Raises:
+            ValueError: If a message header announces more than max_message_size bytes. The stream can't be
+                resynchronized after this, so drop the connection.
+        """
+
+        if self.end == len(self.buffer): self._make_room(self.end - self.start + 1)
+
+        nbytes = sock.recv_into(self._view[self.end:])
+        if nbytes == 0: return None
+
+        self.end += nbytes
+        return self._extract()
+
+    def _extract(self) -> list[bytes]:
+        """
+        Returns:
+            list[bytes]: Every complete message in the buffer, consuming them.
+        """
+
+        messages = []
+        header_size = tcp_frame_header.size
+
+        while self.end - self.start >= header_size:
+            (length,) = tcp_frame_header.unpack_from(self.buffer, self.start)
+            if length > self.max_message_size: raise ValueError(f"Message of {length} bytes exceeds max_message_size ({self.max_message_size})")
+
+            frame_end = self.start + header_size + length
+            if frame_end > self.end:
+                # Incomplete: make sure the rest of this frame will fit before the next recv
+                if frame_end > len(self.buffer): self._make_room(header_size + length)
+                break
+
+            messages.append(bytes(self._view[self.start + header_size:frame_end]))
+            self.start = frame_end
+
+        if self.start == self.end: self.start = self.end = 0
+        return messages
+
+
+def frame_message(data: bytes | bytearray | memoryview) -> bytes:
+    """
+    Prefixes a message with its 4-byte big-endian length for TCP_Communicator.
+
+    Args:
+        data (bytes | bytearray | memoryview): Message payload.
+
+    Returns:
+        bytes: The framed message.
+    """
+
+    return tcp_frame_header.pack(len(data)) + data
+
+
+class _TCP_Connection:
+    """
+    Server side state of one client connection: its reassembler and the framed bytes still waiting to be written.
+
+    Attributes:
+        sock (socket.socket): The client socket.
+        address (tuple): The client's (IP, port) address.
+        reassembler (Stream_Reassembler): Splits the client's byte stream into messages.
+        outgoing (bytearray): Framed bytes the socket hasn't taken yet.
+        lock (threading.Lock): Guards outgoing and closing, so several threads can send to the client.
+        closing (bool): Set once the client failed or fell too far behind. The serve loop drops it.
+    """
+
+    def __init__(self, sock: socket.socket, address: tuple, reassembler: Stream_Reassembler):
+        """
         Args:
-            count (int, optional): How many packets revice_from should handle before exiting. Default is "continual" for continuous recieving
-            buffer_size (int, optional): The largest packet (in bytes) that can be recieved. Default is 1472
+            sock (socket.socket): The client socket.
+            address (tuple): The client's (IP, port) address.
+            reassembler (Stream_Reassembler): Reassembler for the client's byte stream.
+        """
+
+        self.sock = sock
+        self.address = address
+        self.reassembler = reassembler
+        self.outgoing = bytearray()
+        self.lock = threading.Lock()
+        self.closing = False
+
+    def flush(self) -> bool:
+        """
+        Writes as much of outgoing as the socket takes without blocking. Hold `lock` while calling.
+
+        Returns:
+            bool: True if everything was written.
+
+        Raises:
+            OSError: If the connection failed.
+        """
+
+        while self.outgoing:
+            try: sent = self.sock.send(self.outgoing, socket.MSG_DONTWAIT)
+            except (BlockingIOError, InterruptedError): return False
+
+            del self.outgoing[:sent]
+
+        return True
+
+
+class TCP_Communicator(Network_Communicator):
+    """
+    A specialized subclass of Network_Communicator for length-prefixed message communication over TCP.
+
+    As a server (`listen` then `serve`), one thread multiplexes the listening socket and every connected client with
+    a `selectors` selector. As a client (`connect_to` then `send`/`recieve_from`), it talks to a single server.
+    Messages are framed with a 4-byte big-endian length prefix and reassembled with recv_into, so the packet handler
+    always sees whole messages.
+
+    Sending to clients never blocks: each client has its own send buffer, written as far as the socket allows right
+    away and flushed by the `serve` loop as the client catches up. A client whose buffer grows past
+    send_buffer_limit is dropped instead of stalling the others. `sendto` and `broadcast` are safe to call from
+    handler threads as well as inline handlers; the selector is only ever touched by the thread running `serve`.
+
+    Attributes:
+        nodelay (bool): Whether TCP_NODELAY is set on connections, disabling Nagle's algorithm for low latency.
+        buffer_size (int): Initial per-connection recieve buffer size in bytes.
+        max_message_size (int): Largest accepted message payload in bytes.
+        listening (bool): Indicates if the socket is listening for clients.
+        send_buffer_limit (int): Most bytes queued for one client before it is considered stalled and dropped.
+        clients (dict[tuple, socket.socket]): Connected client sockets by (IP, port) address.
+        selector (selectors.BaseSelector | None): Selector used by `serve`.
+
+    Key Methods:
+        listen(backlog=16) -> None: Starts accepting clients.
+        serve(count="continual", threaded=False) -> None: Accepts clients and handles their messages in one thread.
+        sendto(data, to_IP, to_port) -> None: Sends a message to a connected client.
+        broadcast(data) -> None: Sends a message to every connected client.
+        send(data) -> None: Sends a message to the server connected with `connect_to`.
+        send_queue(data) -> None: Sends several messages to the server in one write.
+        recieve_from(IP=None, port=None, count="continual", threaded=False) -> None: Handles messages from the server.
+    """
+
+    def __init__(self, IP: str, port: int, packet_handler: Callable | str="test", max_threads: int=10, nodelay: bool=True,
+                 buffer_size: int=65536, max_message_size: int=16 * 1024 * 1024, queue_size: int | None=None,
+                 overflow_policy: str="block", stats: bool=False, handler_pool: Handler_Pool | None=None, priority: str="telemetry",
+                 traffic_class: str | None=None, send_buffer_limit: int=4 * 1024 * 1024):
+        """
+        Initializes the TCP_Communicator with a bound TCP socket and packet handler.
+
+        Args:
+            IP (str): The local IP address to bind the socket to.
+            port (int): The local port number to bind the socket to. Use 0 for a client on any free port.
+            packet_handler (Callable): Function to handle received messages.
+            max_threads (int, optional): Maximum number of threads for handling messages. Defaults to 10.
+            nodelay (bool, optional): Set TCP_NODELAY on connections. Defaults to True.
+            buffer_size (int, optional): Initial per-connection recieve buffer size. Defaults to 65536.
+            max_message_size (int, optional): Largest accepted message payload. Defaults to 16 MiB.
+            queue_size (int | None, optional): Most messages that may wait for a handler thread. Defaults to None (unbounded).
+            overflow_policy (str, optional): Handler queue overflow policy, see Handler_Queue. Defaults to "block".
+            stats (bool, optional): Collect performance counters from the start. Defaults to False.
+            handler_pool (Handler_Pool | None, optional): Shared handler pool, see Network_Communicator. Defaults to None.
+            priority (str, optional): Priority class in the shared handler pool. Defaults to "telemetry".
+            traffic_class (str | None, optional): Traffic class for outgoing messages, see `traffic_classes`. Defaults to None.
+            send_buffer_limit (int, optional): Most bytes queued for one client before it is dropped. Defaults to 4 MiB.
+        """
+
+        self.nodelay = nodelay
+        self.buffer_size = buffer_size
+        self.max_message_size = max_message_size
+        self.send_buffer_limit = send_buffer_limit
+
+        self.listening = False
+        self.clients = {}
+        self.selector = None
+
+        self._reassembler = None
+        self._send_lock = threading.Lock()  # the client side connection
+
+        self._connections = {}  # (IP, port) -> _TCP_Connection, server side
+        self._pending = set()  # addresses whose selector registration the serve loop must update
+        self._pending_lock = threading.Lock()
+        self._wake_reader = None
+        self._wake_writer = None
+
+        super().__init__(IP=IP, port=port, packet_handler=packet_handler, protocol="tcp", max_threads=max_threads,
+                         queue_size=queue_size, overflow_policy=overflow_policy, stats=stats, handler_pool=handler_pool,
+                         priority=priority, traffic_class=traffic_class)
+
+    def set_socket(self) -> socket.socket:
+        """
+        Creates and binds a TCP socket, with SO_REUSEADDR so a restarted server can rebind right away.
+
+        Returns:
+            self.socket (socket.socket): The bound socket object.
+        """
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((self.IP, self.port))
+
+        self.bound = True
+        return self.socket
+
+    def _configure_connection(self, sock: socket.socket) -> None:
+        """
+        Args:
+            sock (socket.socket): A connected socket to apply TCP options to.
+        """
+
+        if self.nodelay: sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def connect_to(self, to_IP: str, to_port: int) -> None:
+        """
+        Connects to a TCP server.
+
+        Args:
+            to_IP (str): Server IP address.
+            to_port (int): Server port number.
+        """
+
+        super().connect_to(to_IP, to_port)
+
+        self._configure_connection(self.socket)
+        self._reassembler = Stream_Reassembler(self.buffer_size, self.max_message_size)
+
+    def disconnect(self) -> None:
+        """
+        Closes the connection to the server and reopens a fresh socket, ready for `reconnect`. Goes through `open`,
+        so the handler executor and traffic class are restored too.
+        """
+
+        self.close()
+        self.open()
+        self.connected = False
+
+    def reconnect(self) -> None:
+        """
+        Reconnects to the most recent server (set using the 'connect_to' method) after disconnect
+        """
+
+        self.connect_to(self.to_IP, self.to_port)
+
+    def listen(self, backlog: int=16) -> None:
+        """
+        Starts listening for client connections.
+
+        Args:
+            backlog (int, optional): Number of unaccepted connections the kernel will queue. Defaults to 16.
+        """
+
+        self.socket.listen(backlog)
+        self.listening = True
+
+    def _send_framed(self, sock: socket.socket, frames: bytes) -> None:
+        """
+        Writes already framed bytes to the server connected with `connect_to`.
+
+        Args:
+            sock (socket.socket): Connection to write to.
+            frames (bytes): One or more framed messages.
+        """
+
+        with self._send_lock:
+            sock.sendall(frames)
+
+    def _queue_framed(self, connection: _TCP_Connection, frames: bytes) -> bool:
+        """
+        Queues framed bytes for a client and writes what the socket takes right away. Never blocks.
+
+        Args:
+            connection (_TCP_Connection): Client to send to.
+            frames (bytes): One or more framed messages.
+
+        Returns:
+            bool: False if the client failed or is too far behind, and is being dropped.
+        """
+
+        with connection.lock:
+            if connection.closing: return False
+
+            connection.outgoing += frames
+
+            try: done = connection.flush()
+            except OSError: done, connection.closing = False, True
+
+            if len(connection.outgoing) > self.send_buffer_limit: connection.closing = True
+            if done: return True
+
+            closing = connection.closing
+
+        self._request_update(connection.address)  # start watching for EVENT_WRITE, or drop it
+        return not closing
+
+    def _request_update(self, address: tuple) -> None:
+        """
+        Asks the serve loop to update a client's selector registration (write interest, or dropping it), waking it
+        up if it is waiting in select.
+
+        Args:
+            address (tuple): The client's (IP, port) address.
+        """
+
+        with self._pending_lock: self._pending.add(address)
+
+        wake_writer = self._wake_writer
+        if wake_writer is None: return
+
+        try: wake_writer.send(b"\0", socket.MSG_DONTWAIT)
+        except OSError: pass  # already woken (pipe full) or closing
+
+    def _apply_pending(self) -> None:
+        """Updates the selector for clients that need write interest changed or are being dropped. Serve thread only."""
+
+        with self._pending_lock: addresses, self._pending = self._pending, set()
+
+        for address in addresses:
+            connection = self._connections.get(address)
+            if connection is None: continue
+
+            with connection.lock: closing, waiting = connection.closing, bool(connection.outgoing)
+
+            if closing:
+                self._drop_client(address)
+                continue
+
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if waiting else 0)
+            if self.selector.get_key(connection.sock).events != events: self.selector.modify(connection.sock, events, connection)
+
+    def _flush_client(self, connection: _TCP_Connection) -> None:
+        """
+        Writes a client's queued bytes once its socket is writable again. Serve thread only.
+
+        Args:
+            connection (_TCP_Connection): The writable client.
+        """
+
+        with connection.lock:
+            try: connection.flush()
+            except OSError: connection.closing = True
+
+        with self._pending_lock: self._pending.add(connection.address)
+
+    def send(self, data: bytes | bytearray) -> None:
+        """
+        Sends one message to the server connected with `connect_to`.
+
+        Args:
+            data (bytes | bytearray): The message to send.
+
+        Raises:
+            Exception: If not connected.
+        """
+
+        if not self.connected: raise Exception("Must connect using 'connect_to' method in order to use this")
+
+        self._send_framed(self.socket, frame_message(data))
+        if self.stats is not None: self.stats.count_sent(1, len(data))
+
+    def send_queue(self, data: List[bytes | bytearray]) -> None:
+        """
+        Sends several messages to the server in a single write.
+
+        Args:
+            data (List[bytes | bytearray]): The messages to send.
+
+        Raises:
+            Exception: If not connected.
+        """
+
+        if not self.connected: raise Exception("Must connect using 'connect_to' method in order to use this")
+
+        self._send_framed(self.socket, b"".join([frame_message(item) for item in data]))
+        if self.stats is not None: self.stats.count_sent(len(data), sum(len(item) for item in data))
+
+    def sendto(self, data: bytes | bytearray, to_IP: str, to_port: int) -> None:
+        """
+        Queues one message for a client connected to this server. Never blocks.
+
+        Args:
+            data (bytes | bytearray): The message to send.
+            to_IP (str): The client's IP address.
+            to_port (int): The client's port number.
+
+        Raises:
+            Exception: If no such client is connected.
+            ConnectionError: If the client failed or fell more than send_buffer_limit behind, and is being dropped.
+        """
+
+        connection = self._connections.get((to_IP, to_port))
+        if connection is None: raise Exception(f"No client connected from {to_IP}:{to_port}")
+
+        if not self._queue_framed(connection, frame_message(data)): raise ConnectionError(f"Client {to_IP}:{to_port} is being dropped")
+        if self.stats is not None: self.stats.count_sent(1, len(data))
+
+    def broadcast(self, data: bytes | bytearray) -> None:
+        """
+        Queues one message for every connected client. Never blocks. Clients that failed or fell more than
+        send_buffer_limit behind are skipped and dropped.
+
+        Args:
+            data (bytes | bytearray): The message to send.
+        """
+
+        frame = frame_message(data)
+
+        for connection in list(self._connections.values()):
+            if self._queue_framed(connection, frame) and self.stats is not None: self.stats.count_sent(1, len(data))
+
+    def _accept(self) -> None:
+        """Accepts a pending client and registers it with the selector."""
+
+        client, address = self.socket.accept()
+        self._configure_connection(client)
+
+        connection = _TCP_Connection(client, address, Stream_Reassembler(self.buffer_size, self.max_message_size))
+
+        self.clients[address] = client
+        self._connections[address] = connection
+        self.selector.register(client, selectors.EVENT_READ, connection)
+
+    def _drop_client(self, address: tuple) -> None:
+        """
+        Unregisters and closes a client connection. Only called from the serve thread, or by `close`.
+
+        Args:
+            address (tuple): The client's (IP, port) address.
+        """
+
+        connection = self._connections.pop(address, None)
+        client = self.clients.pop(address, None)
+        if client is None: return
+
+        if connection is not None:
+            with connection.lock: connection.closing = True  # later sends to it fail fast
+
+        if self.selector is not None:
+            try: self.selector.unregister(client)
+            except (KeyError, ValueError): pass
+
+        client.close()
+
+    def serve(self, count: int | str="continual", threaded: bool=False) -> None:
+        """
+        Accepts clients, handles their messages and writes queued replies, all from the calling thread\n
+        NOTE: Packet handler must be configured to accept a bytes 'data' AND a tuple 'address' argument\n
+        NOTE: Calls `listen` if the communicator is not already listening
+
+        Args:
+            count (int | str, optional): How many messages should be handled before exiting. Default is "continual" for continuous serving
             threaded (bool, optional): Threads will be spawned if true. Default is False
 
         Raises:
-            Exception: If an error occurs while receiving data. The socket will be closed.
+            Exception: If an error occurs while serving. The socket and all client connections will be closed.
         """
 
-        if self.connected: 
-            was_connected = True
-            self.disconnect()
-        else: was_connected = False
+        if not self.listening: self.listen()
 
-        if count == "continual":
-            try:
-                while True:
-                    data, addr = self.socket.recvfrom(buffer_size)
-                    self.recieved_count += 1
+        if self.selector is None:
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.socket, selectors.EVENT_READ, None)
 
-                    if threaded: self.spawn_handler_thread(data, addr)
-                    else: self.packet_handler(data, addr)
+            # Lets other threads wake select up when a client needs write interest or dropping
+            self._wake_reader, self._wake_writer = socket.socketpair()
+            self._wake_reader.setblocking(False)
+            self.selector.register(self._wake_reader, selectors.EVENT_READ, self._wake_reader)
 
-            finally:
-                self.socket.close()
-                raise Exception("Error thrown. Socket closed")
+        handled = 0
 
-        else:
-            for _ in range(count):
-                data, addr = self.socket.recvfrom(buffer_size)
-                self.recieved_count += 1
+        try:
+            while count == "continual" or handled < count:
+                self._apply_pending()
 
-                if threaded: self.spawn_handler_thread(data, addr)
-                else: self.packet_handler(data, addr)
+                for key, events in self.selector.select():
+                    if key.data is None:
+                        self._accept()
+                        continue
 
-            if was_connected: self.reconnect()
+                    if key.data is self._wake_reader:
+                        try: self._wake_reader.recv(4096)
+                        except BlockingIOError: pass
+                        continue
 
-    def recieve_from(self, IP: str=None, port: int=None, count: int | str="continual", buffer_size: int=1472, threaded: bool=False) -> None:
+                    connection = key.data
+                    if connection.address not in self._connections: continue  # dropped earlier in this batch
+
+                    if events & selectors.EVENT_WRITE: self._flush_client(connection)
+                    if not events & selectors.EVENT_READ: continue
+
+                    try: messages = connection.reassembler.recv_from(connection.sock)
+                    except (ConnectionError, OSError, ValueError): messages = None  # closed, reset or a corrupt frame header
+
+                    if messages is None:
+                        self._drop_client(connection.address)
+                        continue
+
+                    for message in messages:
+                        self.recieved_count += 1
+                        self._dispatch(threaded, 1, len(message), message, connection.address, key=connection.address)
+
+                    handled += len(messages)
+
+        except BaseException:
+            self.close()
+            raise Exception("Error thrown. Socket closed")
+
+    def recieve_from(self, IP: str=None, port: int=None, count: int | str="continual", threaded: bool=False) -> None:
         """
-        Recieves packets from a specified or connected IP address and port\n
+        Recieves messages from the server specified or connected with 'connect_to'\n
         NOTE: Packet handler must be configured to accept ONLY a bytes 'data' argument
 
         Args:
-            IP (str, optional): IP address to connect to. Defaults to connected socket IP if None. Is set to None by default
-            port (int, optional): Port number to connect to. Defaults to connected socket port if None. Is set to None by default
-            count (int | str, optional): Number of packets to receive. Use "continual" to receive indefinitely. Is "continual" by default
-            buffer_size (int, optional): Maximum size of each packet in bytes. Defaults to 1472.
-            threaded (bool, optional): If True, each packet is handled in a separate thread. Defaults to False.
+            IP (str, optional): Server IP address to connect to. Uses the current connection if None. Is set to None by default
+            port (int, optional): Server port number to connect to. Uses the current connection if None. Is set to None by default
+            count (int | str, optional): Number of messages to receive. Use "continual" to receive indefinitely. Is "continual" by default
+            threaded (bool, optional): If True, each message is handled in a separate thread. Defaults to False.
 
         Raises:
-            Exception: If no destination is provided and was not connected using the 'connect_to' or 'reconnect' methods
-            Exception: If an error occurs during packet reception. The socket will be closed.
+            Exception: If no server is provided and was not connected using the 'connect_to' or 'reconnect' methods
+            Exception: If the server closes the connection or an error occurs. The socket will be closed.
         """
 
         if IP is not None: self.connect_to(to_IP=IP, to_port=port)
-        else:
-            if self.connected is None or not self.connected: raise Exception("Please provide IP and port")
+        elif not self.connected: raise Exception("Please provide IP and port")
 
-        if count == "continual":
-            try:
-                while True:
-                    data = self.socket.recv(buffer_size)
+        handled = 0
+
+        try:
+            while count == "continual" or handled < count:
+                messages = self._reassembler.recv_from(self.socket)
+                if messages is None: raise ConnectionError("Server closed the connection")
+
+                for message in messages:
                     self.recieved_count += 1
+                    self._dispatch(threaded, 1, len(message), message, key=(self.to_IP, self.to_port))
 
-                    if threaded: self.spawn_handler_thread(data)
-                    else: self.packet_handler(data)
-                    
-            finally:
-                self.socket.close()
-                raise Exception("Error thrown. Socket closed")
+                handled += len(messages)
+
+        except BaseException:
+            self.close()
+            self.connected = False
+            raise Exception("Error thrown. Socket closed")
+
+    def close(self) -> None:
+        """
+        Closes every client connection, the selector and the local socket.
+        """
+
+        for address in list(self.clients): self._drop_client(address)
+
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
+
+        wake_reader, wake_writer = self._wake_reader, self._wake_writer
+        self._wake_reader = self._wake_writer = None
+
+        if wake_writer is not None:
+            wake_writer.close()
+            wake_reader.close()
+
+        with self._pending_lock: self._pending.clear()
+
+        self.listening = False
+        super().close()
 
-        else:
-            for _ in range(count):
-                data = self.socket.recv(buffer_size)
-                self.recieved_count += 1
-                
-                if threaded: self.spawn_handler_thread(data)
-                else: self.packet_handler(data)
 
 import shutil
 from pathlib import Path
@@ -115,27 +115,37 @@ from time import sleep
 from .i2c_tools import *
 
 MODE1_REG = 0x00
+LED0_ON_L_REG = 0x06
+ALL_LED_ON_L_REG = 0xFA
 PRESCALE_REG = 0xFE
 PCA9685_HZ = 25_000_000
 
+MODE1_RESTART = 0b10000000
+MODE1_AI = 0b00100000  # register auto-increment, needed for block writes
+
 
 
 class PCA9685(I2C_Slave):
     """I2C wrapper for the PCA9685 PWM controller."""
 
-    def __init__(self, bus: I2C_Bus, frequency: int=50, address: int=0x40):
+    def __init__(self, bus: I2C_Bus, frequency: int=50, address: int=0x40, shadow: bool=False):
         """Initialize the controller and program its PWM frequency.
 
         Args:
             bus (I2C_Bus): Open I2C bus to communicate over.
             frequency (int): Desired PWM frequency in hertz.
             address (int): I2C address of the controller.
+            shadow (bool): Keep a register shadow (see I2C_Slave), so steady duty cycles don't touch the bus.
+                Only the driver may write to the board while this is on.
         """
 
-        super().__init__(bus, address)
+        # The chip sets MODE1's RESTART bit itself when it sleeps with outputs on, and ALL_LED reads back as 0
+        volatile_registers = {MODE1_REG, *range(ALL_LED_ON_L_REG, ALL_LED_ON_L_REG + 4)}
+        super().__init__(bus, address, shadow, volatile_registers)
         
         self.pwm_frequency = frequency
         self.pwm_time = 1_000_000 / frequency
+        self.auto_increment = False
 
         self.write_prescale()
 
@@ -192,3 +202,82 @@ class PCA9685(I2C_Slave):
 
         self.write_byte(pin_offset + 8, off_time & 0xFF)  # Saves 8 low bits to LEDn_OFF_L
         self.write_byte(pin_offset + 9, off_time >> 8)  # Saves 4 high bits to first bits of LEDn_OFF_H; rest are reserved or for special use case which I don't know how to use
+
+    def enable_auto_increment(self):
+        """
+        Sets the AI bit in the MODE1 register so block writes step through consecutive registers.
+        """
+
+        mode1 = self.read_byte(MODE1_REG)
+        self.write_byte(MODE1_REG, (mode1 & ~MODE1_RESTART) | MODE1_AI)  # writing RESTART back as 1 would restart the outputs
+        self.auto_increment = True
+
+    def invalidate(self, register: int | None=None):
+        """Forget shadowed register values (see I2C_Slave.invalidate), and with them whether AI is known to be set.
+
+        Args:
+            register (int | None): Register to forget, or None for all of them.
+        """
+
+        super().invalidate(register)
+        if register is None or register == MODE1_REG: self.auto_increment = False
+
+    def _duty_cycle_registers(self, pulse_length: float, start: float=0) -> bytes:
+        """
+        Args:
+            pulse_length (float): the length of the "on" part of the PWM cycle (μs)
+            start (float): how long into the PWM cycle to start the "on" signal (μs)
+
+        Returns:
+            bytes: LEDn_ON_L, LEDn_ON_H, LEDn_OFF_L and LEDn_OFF_H values. The OFF count is where the pulse ends, so
+            it is the ON count plus the pulse, wrapped into the 4096 count cycle. The pulse is capped at 4095 counts,
+            as 4096 would set the full on/off bits instead.
+        """
+
+        on_time = round(start / self.pwm_time * 4096) % 4096
+        off_time = (on_time + min(4095, round(pulse_length / self.pwm_time * 4096))) % 4096
+
+        return bytes((on_time & 0xFF, on_time >> 8, off_time & 0xFF, off_time >> 8))
+
+    def write_duty_cycles(self, pulse_lengths: dict[int, float], start: float=0, use_all_led: bool=False):
+        """
+        Writes the duty cycles of several pins in as few bus transactions as possible.
+
+        Each pin's four LEDn registers follow the previous pin's, so runs of consecutive pins are written as one
+        auto-incrementing block, and separate runs go out together in a single ioctl (see I2C_Bus.transfer). A full
+        16-channel refresh is one 64 byte block.
+
+        Args:
+            pulse_lengths (dict[int, float]): "on" pulse length (μs) by pin number, 0 - 15.
+            start (float): how long into the PWM cycle to start the "on" signal (μs); default is 0
+            use_all_led (bool): If every pulse length is the same, write it once to the ALL_LED registers instead.
+                NOTE: this sets all 16 channels, not only the pins given. Default is False
+
+        Raises:
+            Exception: If a pin number is out of range.
+        """
+
+        if not pulse_lengths: return
+        if any(not 0 <= pin_number <= 15 for pin_number in pulse_lengths): raise Exception("Pin number out of range")
+
+        if not self.auto_increment: self.enable_auto_increment()
+
+        if use_all_led and len(set(pulse_lengths.values())) == 1:
+            values = self._duty_cycle_registers(next(iter(pulse_lengths.values())), start)
+            self.write_block(ALL_LED_ON_L_REG, values)
+            self._remember(LED0_ON_L_REG, values * 16)  # ALL_LED writes every LEDn register
+            return
+
+        # Coalesce consecutive pins into (first register, values) blocks
+        blocks = []
+        previous = None
+
+        for pin_number in sorted(pulse_lengths):
+            values = self._duty_cycle_registers(pulse_lengths[pin_number], start)
+
+            if previous is not None and pin_number == previous + 1: blocks[-1][1].extend(values)
+            else: blocks.append((LED0_ON_L_REG + 4 * pin_number, bytearray(values)))
+
+            previous = pin_number
+
+        self.write_blocks(blocks)
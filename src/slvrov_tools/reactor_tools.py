@@ -0,0 +1,308 @@
+# SLVROV Oct 2026
+
+import heapq
+import os
+import selectors
+import socket
+import struct
+import traceback
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Callable
+from .joystick_tools import JoystickEvent, JoystickEventType, SimpleJoystick
+from .network_tools import UDP_Communicator
+
+
+@dataclass(order=True)
+class Reactor_Timer:
+    """A scheduled callback. Returned by `Reactor.call_later`/`call_every` so it can be cancelled.
+
+    Attributes:
+        deadline (float): ``time.monotonic()`` time the callback is next due.
+        sequence (int): Tie breaker so timers due at the same time run in scheduling order.
+        interval (float | None): Seconds between runs for periodic timers, None for one-shot timers.
+        callback (Callable): Function to call.
+        args (tuple): Arguments passed to the callback.
+        cancelled (bool): Set by `Reactor.cancel`. Cancelled timers are skipped.
+        runs (int): Number of times the callback has run.
+        missed (int): Periodic deadlines skipped because the reactor was busy past them.
+    """
+
+    deadline: float
+    sequence: int
+    interval: float | None = field(compare=False)
+    callback: Callable = field(compare=False)
+    args: tuple = field(compare=False, default=())
+    cancelled: bool = field(compare=False, default=False)
+    runs: int = field(compare=False, default=0)
+    missed: int = field(compare=False, default=0)
+
+
+class Reactor:
+    """
+    A single-thread event loop built on ``selectors`` that multiplexes UDP_Communicator sockets, joystick devices,
+    arbitrary readable file objects and timers, so none of them need a thread of their own.
+
+    Callbacks run on the thread that called `run` and should return quickly; a slow callback delays everything else.
+    Exceptions raised by callbacks are printed and the loop carries on.
+
+    Attributes:
+        selector (selectors.BaseSelector): Selector watching every registered file object.
+        timers (list[Reactor_Timer]): Heap of pending timers.
+        running (bool): Indicates if `run` is currently looping.
+
+    Key Methods:
+        add_reader(fileobj, callback, *args) -> None: Calls callback(*args) whenever fileobj is readable.
+        remove_reader(fileobj) -> None: Stops watching a file object.
+        add_udp_communicator(communicator, buffer_size=1472, max_per_wake=64) -> None: Handles a communicator's packets.
+        add_joystick(joystick, callback) -> None: Calls callback(event) for every joystick event.
+        call_later(delay, callback, *args) -> Reactor_Timer: Runs a callback once after delay seconds.
+        call_every(interval, callback, *args) -> Reactor_Timer: Runs a callback every interval seconds.
+        cancel(timer) -> None: Cancels a timer.
+        run(duration=None) -> None: Dispatches events until `stop` is called or duration passes.
+        stop() -> None: Makes `run` return. Safe to call from another thread or a signal handler.
+    """
+
+    def __init__(self):
+        """Creates the selector and the wakeup channel used by `stop`."""
+
+        self.selector = selectors.DefaultSelector()
+        self.timers = []
+        self.running = False
+
+        self._sequence = 0
+
+        # stop() writes a byte here so a select() blocked in another thread returns immediately
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self.selector.register(self._wake_reader, selectors.EVENT_READ, (self._clear_wakeup, ()))
+
+    def add_reader(self, fileobj, callback: Callable, *args) -> None:
+        """
+        Calls callback(*args) whenever fileobj is readable.
+
+        Args:
+            fileobj: A socket, file object or file descriptor.
+            callback (Callable): Function to call. It must consume the available input, or it will be called again at once.
+            *args: Arguments passed to the callback.
+        """
+
+        self.selector.register(fileobj, selectors.EVENT_READ, (callback, args))
+
+    def remove_reader(self, fileobj) -> None:
+        """
+        Stops watching a file object. Does nothing if it is not registered.
+
+        Args:
+            fileobj: A file object previously passed to one of the add methods.
+        """
+
+        try: self.selector.unregister(fileobj)
+        except (KeyError, ValueError): pass
+
+    def add_udp_communicator(self, communicator: UDP_Communicator, buffer_size: int=1472, max_per_wake: int=64) -> None:
+        """
+        Handles every packet a UDP_Communicator recieves on the reactor thread.\n
+        NOTE: Packet handler must be configured to accept a bytes 'data' AND a tuple 'address' argument, as with recieve_all
+
+        Args:
+            communicator (UDP_Communicator): An open communicator. Do not also run one of its recieve loops.
+            buffer_size (int, optional): The largest packet (in bytes) that can be recieved. Defaults to 1472.
+            max_per_wake (int, optional): Most packets read per readiness event, so one busy socket can't starve the rest. Defaults to 64.
+        """
+
+        self.add_reader(communicator.socket, self._read_udp, communicator, buffer_size, max_per_wake)
+
+    def _read_udp(self, communicator: UDP_Communicator, buffer_size: int, max_per_wake: int) -> None:
+        """
+        Drains queued packets from a communicator's socket without blocking.
+
+        Args:
+            communicator (UDP_Communicator): Communicator whose socket is readable.
+            buffer_size (int): The largest packet (in bytes) that can be recieved.
+            max_per_wake (int): Most packets to read before returning to the loop.
+        """
+
+        sock = communicator.socket
+
+        for _ in range(max_per_wake):
+            try: data, addr = sock.recvfrom(buffer_size, socket.MSG_DONTWAIT)
+            except BlockingIOError: return
+
+            communicator.recieved_count += 1
+            communicator._dispatch(False, 1, len(data), data, addr)
+
+    def add_joystick(self, joystick: SimpleJoystick, callback: Callable) -> None:
+        """
+        Calls callback(event) with a JoystickEvent for every event the joystick produces.
+
+        Pass ``ExecutorJoystick.interpret_event`` as the callback to keep an ExecutorJoystick's state up to date, and
+        schedule its ``execute_events`` with `call_every`.
+
+        Args:
+            joystick (SimpleJoystick): An open joystick. Do not also call its get_event method.
+            callback (Callable): Function called with each JoystickEvent.
+        """
+
+        self.add_reader(joystick.device, self._read_joystick, joystick, callback)
+
+    def _read_joystick(self, joystick: SimpleJoystick, callback: Callable) -> None:
+        """
+        Reads one joystick packet and passes the decoded event to the callback.
+
+        Args:
+            joystick (SimpleJoystick): Joystick whose device is readable.
+            callback (Callable): Function called with the JoystickEvent.
+        """
+
+        # os.read skips the file object's buffer, so the reactor never blocks waiting to fill it
+        input_data = os.read(joystick.device.fileno(), joystick.packet_size)
+
+        if len(input_data) < joystick.packet_size:
+            if not input_data: self.remove_reader(joystick.device)  # device unplugged
+            return
+
+        time, value, event_type, type_index = struct.unpack(joystick.data_format, input_data)
+        callback(JoystickEvent(time, JoystickEventType(event_type), type_index, value))
+
+    def _schedule(self, delay: float, interval: float | None, callback: Callable, args: tuple) -> Reactor_Timer:
+        """
+        Args:
+            delay (float): Seconds until the first run.
+            interval (float | None): Seconds between runs, or None to run once.
+            callback (Callable): Function to call.
+            args (tuple): Arguments passed to the callback.
+
+        Returns:
+            Reactor_Timer: The scheduled timer.
+        """
+
+        self._sequence += 1
+        timer = Reactor_Timer(monotonic() + delay, self._sequence, interval, callback, args)
+        heapq.heappush(self.timers, timer)
+
+        return timer
+
+    def call_later(self, delay: float, callback: Callable, *args) -> Reactor_Timer:
+        """
+        Runs callback(*args) once, delay seconds from now.
+
+        Args:
+            delay (float): Seconds to wait.
+            callback (Callable): Function to call.
+            *args: Arguments passed to the callback.
+
+        Returns:
+            Reactor_Timer: Handle that can be passed to `cancel`.
+        """
+
+        return self._schedule(delay, None, callback, args)
+
+    def call_every(self, interval: float, callback: Callable, *args) -> Reactor_Timer:
+        """
+        Runs callback(*args) every interval seconds on a fixed monotonic schedule. Runs that fall behind are skipped
+        (and counted in ``missed``) rather than bunched up.
+
+        Args:
+            interval (float): Seconds between runs. The first run is one interval from now.
+            callback (Callable): Function to call.
+            *args: Arguments passed to the callback.
+
+        Returns:
+            Reactor_Timer: Handle that can be passed to `cancel`.
+
+        Raises:
+            Exception: If interval is not positive.
+        """
+
+        if interval <= 0: raise Exception("Timer interval must be positive")
+        return self._schedule(interval, interval, callback, args)
+
+    def cancel(self, timer: Reactor_Timer) -> None:
+        """
+        Cancels a timer. It is dropped from the heap the next time it comes due.
+
+        Args:
+            timer (Reactor_Timer): Timer returned by `call_later` or `call_every`.
+        """
+
+        timer.cancelled = True
+
+    def _run_timers(self) -> None:
+        """Runs every timer that is due and reschedules periodic ones."""
+
+        now = monotonic()
+
+        while self.timers and self.timers[0].deadline <= now:
+            timer = heapq.heappop(self.timers)
+            if timer.cancelled: continue
+
+            try: timer.callback(*timer.args)
+            except Exception: traceback.print_exc()
+
+            timer.runs += 1
+
+            if timer.interval is not None and not timer.cancelled:
+                timer.deadline += timer.interval
+
+                now = monotonic()
+                if timer.deadline <= now:
+                    skipped = int((now - timer.deadline) // timer.interval) + 1
+                    timer.missed += skipped
+                    timer.deadline += skipped * timer.interval
+
+                heapq.heappush(self.timers, timer)
+
+    def _clear_wakeup(self) -> None:
+        """Empties the wakeup channel after `stop`."""
+
+        try:
+            while self._wake_reader.recv(64): pass
+        except BlockingIOError: pass
+
+    def run(self, duration: float | None=None) -> None:
+        """
+        Dispatches file events and timers on the calling thread until `stop` is called.
+
+        Args:
+            duration (float | None, optional): Return after this many seconds. Runs until stopped if None (default).
+        """
+
+        self.running = True
+        end = monotonic() + duration if duration is not None else None
+
+        try:
+            while self.running:
+                now = monotonic()
+                if end is not None and now >= end: break
+
+                timeout = None
+                if self.timers: timeout = max(0.0, self.timers[0].deadline - now)
+                if end is not None: timeout = end - now if timeout is None else min(timeout, end - now)
+
+                for key, _ in self.selector.select(timeout):
+                    callback, args = key.data
+
+                    try: callback(*args)
+                    except Exception: traceback.print_exc()
+
+                self._run_timers()
+        finally:
+            self.running = False
+
+    def stop(self) -> None:
+        """Makes `run` return after the current callback."""
+
+        self.running = False
+
+        try: self._wake_writer.send(b"\0")
+        except (BlockingIOError, OSError): pass
+
+    def close(self) -> None:
+        """Stops the reactor and closes the selector and wakeup channel. Registered file objects are left open."""
+
+        self.stop()
+        self.selector.close()
+        self._wake_reader.close()
+        self._wake_writer.close()
@@ -0,0 +1,833 @@
+# SLVROV Oct 2026
+
+import ctypes
+import os
+import platform
+import socket
+import struct
+import sys
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from time import monotonic, perf_counter, sleep
+from typing import Callable
+from .network_tools import Buffer_Pool, Handler_Pool, Network_Communicator, UDP_Communicator
+
+SHM_MAGIC = b"SLVSHM1\0"
+
+# Ring header layout. head and tail sit on their own cache lines so producer and consumer don't false-share
+ring_field = struct.Struct("<Q")
+ring_word = struct.Struct("<I")
+RING_CAPACITY = 8
+RING_OWNER_PID = 16
+RING_CLOSED = 24
+RING_HEAD = 64       # bytes ever written, only stored by the producer
+RING_TAIL = 128      # bytes ever read, only stored by the consumer
+RING_WAKE = 192      # futex word, bumped by the producer after every publish
+RING_WAITING = 196   # set by the consumer while it sleeps on the futex
+RING_DATA = 256
+
+shm_record_header = struct.Struct("<I4sH")  # payload length, source IPv4 address, source port
+SHM_WRAP = 0xFFFFFFFF  # record length marking "the rest of the ring is unused, continue at offset 0"
+
+FUTEX_WAIT = 0
+FUTEX_WAKE = 1
+futex_syscalls = {"x86_64": 202, "aarch64": 98, "armv7l": 240, "armv6l": 240, "i686": 240}
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+try:
+    from .pshm_tools import shm_load_acquire, shm_store_release, shm_fence
+    HAS_SHM_ATOMICS = True
+except ImportError:  # C extension not built (see Makefile)
+    HAS_SHM_ATOMICS = False
+
+    # x86_64 keeps stores in order and loads in order, and an aligned 8 byte struct store is one instruction, so plain
+    # stores and loads are enough there. Only the futex handshake's store-then-load is left unfenced (see wait)
+    def shm_load_acquire(buffer, offset: int) -> int: return ring_field.unpack_from(buffer, offset)[0]
+    def shm_store_release(buffer, offset: int, value: int) -> None: ring_field.pack_into(buffer, offset, value)
+    def shm_fence() -> None: pass
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    SYS_futex = futex_syscalls[platform.machine()] if sys.platform == "linux" else None
+except (OSError, KeyError):  # not Linux, or an architecture we don't know the syscall number for
+    _libc = None
+    SYS_futex = None
+
+
+def shm_endpoint_name(IP: str, port: int) -> str:
+    """
+    Args:
+        IP (str): Endpoint IP address.
+        port (int): Endpoint port.
+
+    Returns:
+        str: Shared memory segment name of the endpoint's recieve ring (it lives in /dev/shm on Linux).
+    """
+
+    return f"slvrov_{IP.replace('.', '_')}_{port}"
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class SHM_Ring:
+    """
+    A single-producer, single-consumer ring of variable sized records in a `multiprocessing.shared_memory`
+    segment, used as the recieve queue of a SHM_Communicator.
+
+    The producer only ever stores `head` and the consumer only ever stores `tail` (both 64-bit byte counters at
+    8-byte aligned offsets), so no lock is shared between processes. Each side publishes its counter with a release
+    store and reads the other's with an acquire load (the pshm_tools C extension), so a record's bytes are visible
+    before the head that covers them, and its space is only reused after the tail has passed it; the 64-bit
+    counters are never torn, on 32-bit ARM included. Without the extension rings only work on x86_64, whose memory
+    ordering makes plain loads and stores enough. A sleeping consumer is woken through a futex on the shared
+    mapping, and only when it has announced that it is sleeping, so a busy consumer costs the producer no syscalls
+    at all. Where futexes aren't available the consumer polls.
+
+    Attributes:
+        name (str): Shared memory segment name.
+        memory (shared_memory.SharedMemory): The mapped segment.
+        capacity (int): Size of the record area in bytes.
+        owner (bool): True for the consumer that created (and will unlink) the segment.
+        dropped_count (int): Records this producer discarded because the ring was full.
+
+    Key Methods:
+        create(name, capacity) -> SHM_Ring: Creates a ring as its consumer.
+        attach(name) -> SHM_Ring: Opens an existing ring as its producer.
+        write(data, address) -> bool: Appends a record. Returns False if the ring was full.
+        peek() -> tuple[memoryview, tuple] | None: Returns the oldest record without consuming it.
+        advance() -> None: Consumes the record returned by `peek`.
+        wait(timeout=None) -> bool: Sleeps until the ring has a record.
+        close() -> None: Unmaps the segment, unlinking it if this is the owner.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        """
+        Wraps a mapped segment. Use `create` or `attach` instead of calling this directly.
+
+        Args:
+            memory (shared_memory.SharedMemory): The mapped segment.
+            owner (bool): Whether this side created the segment.
+        """
+
+        self.memory = memory
+        self.name = memory.name
+        self.owner = owner
+        self.buffer = memory.buf
+
+        (self.capacity,) = ring_field.unpack_from(self.buffer, RING_CAPACITY)
+        self.dropped_count = 0
+
+        # The futex needs the word's address in this process. The ctypes view is dropped right away so it doesn't
+        # hold an export on the buffer (which would stop the segment from being closed)
+        word = ctypes.c_uint32.from_buffer(self.buffer, RING_WAKE)
+        self._wake_address = ctypes.addressof(word)
+        del word
+
+        self._pending = 0  # size of the record handed out by peek, consumed by advance
+
+    @classmethod
+    def create(cls, name: str, capacity: int) -> "SHM_Ring":
+        """
+        Creates a ring as its consumer. A segment left behind by a consumer that has since died is replaced.
+
+        Args:
+            name (str): Segment name.
+            capacity (int): Record area size in bytes, rounded up to a multiple of 8.
+
+        Returns:
+            SHM_Ring: The new ring.
+
+        Raises:
+            Exception: If a live process already owns a ring by that name, or the atomics extension is needed and missing.
+        """
+
+        _check_atomics()
+        capacity = _align(capacity)
+
+        try: memory = _open_memory(name, create=True, size=RING_DATA + capacity)
+        except FileExistsError:
+            stale = _open_memory(name)
+            (owner_pid,) = ring_field.unpack_from(stale.buf, RING_OWNER_PID)
+
+            try:
+                os.kill(owner_pid, 0)
+                alive = True
+            except ProcessLookupError: alive = False
+            except PermissionError: alive = True
+
+            stale.close()
+            if alive and owner_pid: raise Exception(f"Shared memory endpoint {name} is in use by process {owner_pid}")
+
+            _unlink_memory(stale)
+            memory = _open_memory(name, create=True, size=RING_DATA + capacity)
+
+        memory.buf[:RING_DATA] = bytes(RING_DATA)
+        ring_field.pack_into(memory.buf, RING_CAPACITY, capacity)
+        ring_field.pack_into(memory.buf, RING_OWNER_PID, os.getpid())
+        memory.buf[:len(SHM_MAGIC)] = SHM_MAGIC  # written last, so a producer never sees a half-initialized header
+
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SHM_Ring":
+        """
+        Opens an existing ring as its producer.
+
+        Args:
+            name (str): Segment name.
+
+        Returns:
+            SHM_Ring: The ring.
+
+        Raises:
+            FileNotFoundError: If no such ring exists (yet).
+            Exception: If the atomics extension is needed and missing.
+        """
+
+        _check_atomics()
+        memory = _open_memory(name)
+
+        if bytes(memory.buf[:len(SHM_MAGIC)]) != SHM_MAGIC or ring_field.unpack_from(memory.buf, RING_CLOSED)[0]:
+            memory.close()
+            raise FileNotFoundError(f"Shared memory endpoint {name} is not open")
+
+        return cls(memory, owner=False)
+
+    @property
+    def closed(self) -> bool:
+        """
+        Returns:
+            bool: True once the consumer has closed the ring. Producers should reattach, as it may have been replaced.
+        """
+
+        return self.buffer is None or ring_field.unpack_from(self.buffer, RING_CLOSED)[0] != 0
+
+    def write(self, data: bytes | bytearray | memoryview, address: tuple) -> bool:
+        """
+        Appends one record. Only one thread of one process may write to a ring at a time.
+
+        Args:
+            data (bytes | bytearray | memoryview): The payload.
+            address (tuple): Source (IP, port) recorded with the payload.
+
+        Returns:
+            bool: True if the record was written, False if the ring was full and it was dropped.
+
+        Raises:
+            Exception: If the payload can never fit in the ring.
+        """
+
+        buffer = self.buffer
+        size = _align(shm_record_header.size + len(data))
+        if size > self.capacity: raise Exception(f"Packet of {len(data)} bytes does not fit in a {self.capacity} byte ring")
+
+        (head,) = ring_field.unpack_from(buffer, RING_HEAD)  # only this side stores head
+        tail = shm_load_acquire(buffer, RING_TAIL)  # the consumer is done with everything before tail
+
+        position = head % self.capacity
+        skip = self.capacity - position if position + size > self.capacity else 0
+
+        if head + skip + size - tail > self.capacity:
+            self.dropped_count += 1
+            return False
+
+        if skip:
+            ring_word.pack_into(buffer, RING_DATA + position, SHM_WRAP)
+            position = 0
+
+        start = RING_DATA + position
+        shm_record_header.pack_into(buffer, start, len(data), socket.inet_aton(address[0]), address[1])
+        buffer[start + shm_record_header.size:start + shm_record_header.size + len(data)] = data
+
+        shm_store_release(buffer, RING_HEAD, head + skip + size)  # publishes the record
+
+        (wake,) = ring_word.unpack_from(buffer, RING_WAKE)
+        ring_word.pack_into(buffer, RING_WAKE, (wake + 1) & 0xFFFFFFFF)
+
+        shm_fence()  # pairs with the fence in wait: either the consumer sees head, or this sees it waiting
+        if ring_word.unpack_from(buffer, RING_WAITING)[0]: self._futex(FUTEX_WAKE, 1)
+
+        return True
+
+    def peek(self) -> tuple[memoryview, tuple] | None:
+        """
+        Returns the oldest record without consuming it. Call `advance` once done with the payload.
+
+        Returns:
+            tuple[memoryview, tuple] | None: (payload view into the ring, source (IP, port)), or None if the ring is
+            empty. The view must be released before `advance`.
+        """
+
+        buffer = self.buffer
+        (tail,) = ring_field.unpack_from(buffer, RING_TAIL)  # only this side stores tail
+
+        while True:
+            head = shm_load_acquire(buffer, RING_HEAD)  # records before head are fully written
+            if head == tail: return None
+
+            position = tail % self.capacity
+            (length,) = ring_word.unpack_from(buffer, RING_DATA + position)
+
+            if length != SHM_WRAP: break
+
+            tail += self.capacity - position
+            shm_store_release(buffer, RING_TAIL, tail)
+
+        _, packed_ip, port = shm_record_header.unpack_from(buffer, RING_DATA + position)
+        start = RING_DATA + position + shm_record_header.size
+
+        self._pending = _align(shm_record_header.size + length)
+        return buffer[start:start + length], (socket.inet_ntoa(packed_ip), port)
+
+    def advance(self) -> None:
+        """
+        Consumes the record returned by the last `peek`, freeing its space for the producer.
+        """
+
+        (tail,) = ring_field.unpack_from(self.buffer, RING_TAIL)
+        shm_store_release(self.buffer, RING_TAIL, tail + self._pending)  # after the record was read
+        self._pending = 0
+
+    def empty(self) -> bool:
+        """
+        Returns:
+            bool: True if there is nothing to read.
+        """
+
+        return shm_load_acquire(self.buffer, RING_HEAD) == shm_load_acquire(self.buffer, RING_TAIL)
+
+    def _futex(self, operation: int, value: int, timeout: float | None=None) -> None:
+        """
+        Args:
+            operation (int): FUTEX_WAIT or FUTEX_WAKE.
+            value (int): Expected word value (wait) or number of waiters to wake (wake).
+            timeout (float | None, optional): Most seconds to wait. Forever if None.
+        """
+
+        if timeout is None: timespec = None
+        else:
+            timespec = _Timespec(int(timeout), int((timeout % 1) * 1e9))
+            timespec = ctypes.byref(timespec)
+
+        _libc.syscall(SYS_futex, ctypes.c_void_p(self._wake_address), operation, value, timespec, None, 0)
+
+    def wait(self, timeout: float | None=None) -> bool:
+        """
+        Sleeps until the ring has a record, the timeout passes, or the ring is closed.
+
+        Args:
+            timeout (float | None, optional): Most seconds to wait. Forever if None.
+
+        Returns:
+            bool: True if there is a record to read.
+        """
+
+        deadline = None if timeout is None else monotonic() + timeout
+        buffer = self.buffer
+
+        while self.empty():
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0: return False
+            if self.closed: return False
+
+            if SYS_futex is None:
+                sleep(0.0005 if remaining is None else min(0.0005, remaining))
+                continue
+
+            (wake,) = ring_word.unpack_from(buffer, RING_WAKE)
+            ring_word.pack_into(buffer, RING_WAITING, 1)
+            shm_fence()  # pairs with the fence in write
+
+            # Recheck after announcing the wait: a record published before the producer saw the flag is found here,
+            # and one published after it changes the wake word, so the futex wait returns at once
+            if self.empty():
+                # Without the extension there is no fence, so a lost wakeup is possible; cap it at 100 ms
+                if not HAS_SHM_ATOMICS: remaining = 0.1 if remaining is None else min(0.1, remaining)
+                self._futex(FUTEX_WAIT, wake, remaining)
+
+            ring_word.pack_into(buffer, RING_WAITING, 0)
+
+        return True
+
+    def close(self) -> None:
+        """
+        Unmaps the segment. The owner marks the ring closed (so producers let go of it) and unlinks it.
+        """
+
+        if self.buffer is None: return
+
+        if self.owner:
+            ring_field.pack_into(self.buffer, RING_CLOSED, 1)
+            if SYS_futex is not None: self._futex(FUTEX_WAKE, 1 << 30)  # wakes a consumer blocked in wait
+
+        self.buffer.release()
+        self.buffer = None
+        self.memory.close()
+
+        if self.owner:
+            try: _unlink_memory(self.memory)
+            except FileNotFoundError: pass
+
+
+def _check_atomics() -> None:
+    """
+    Raises:
+        Exception: If the pshm_tools extension isn't built and this machine needs it for correct memory ordering.
+    """
+
+    if not HAS_SHM_ATOMICS and platform.machine() not in ("x86_64", "AMD64"):
+        raise Exception(f"Shared memory rings need the pshm_tools extension on {platform.machine()}. Build it with make")
+
+
+def _open_memory(name: str, create: bool=False, size: int=0) -> shared_memory.SharedMemory:
+    """
+    Maps a segment without leaving it to the resource tracker. The tracker unlinks whatever a process registered
+    when that process exits, which would pull a consumer's ring out from under it as soon as a producer stopped.
+    Rings are unlinked by their owner's `close` instead, and a ring left behind by a crash is replaced by the next
+    `SHM_Ring.create`.
+
+    Args:
+        name (str): Segment name.
+        create (bool, optional): Create a new segment. Defaults to False.
+        size (int, optional): Size of a new segment. Defaults to 0.
+
+    Returns:
+        shared_memory.SharedMemory: The mapped segment.
+    """
+
+    if sys.version_info >= (3, 13): return shared_memory.SharedMemory(name, create=create, size=size, track=False)
+
+    memory = shared_memory.SharedMemory(name, create=create, size=size)  # always registers before 3.13
+    resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
+
+
+def _unlink_memory(memory: shared_memory.SharedMemory) -> None:
+    """
+    Unlinks a segment mapped with `_open_memory`.
+
+    Args:
+        memory (shared_memory.SharedMemory): The segment. May already be closed.
+    """
+
+    if sys.version_info < (3, 13): resource_tracker.register(memory._name, "shared_memory")  # unlink unregisters it
+    memory.unlink()
+
+
+class SHM_Communicator(Network_Communicator):
+    """
+    A same-host transport with the interface of UDP_Communicator, backed by shared memory rings instead of sockets.
+
+    Every communicator owns one SHM_Ring, named after its (IP, port), that other communicators write into. A packet
+    is copied once into the ring by the sender and, with the `recieve_*_into` methods, handed to the handler
+    straight from the ring, instead of being copied into and out of the kernel twice as over loopback UDP. Switching
+    a local link over is a matter of replacing UDP_Communicator with SHM_Communicator on both ends.
+
+    Like UDP, sending never blocks: a packet sent to an endpoint that isn't open yet, or whose ring is full, is
+    dropped (and counted in `send_drops`). Unlike UDP, each ring has a single producer, so only one process may
+    send to a given endpoint (several threads of that process are fine).
+
+    Attributes:
+        ring_size (int): Size of this communicator's recieve ring in bytes.
+        ring (SHM_Ring): This communicator's recieve ring. Also available as `socket`, for the base class.
+        peers (dict[tuple, SHM_Ring]): Rings of the endpoints this communicator has sent to, by (IP, port).
+        send_drops (int): Packets dropped because the destination was not open or its ring was full.
+        timeout (float | None): Seconds a recieve waits for a packet before raising TimeoutError. None waits forever.
+        buffer_pool (Buffer_Pool | None): Slot pool used by threaded `recieve_*_into` calls, created on first use.
+
+    Key Methods:
+        sendto(data, to_IP, to_port) -> None: Sends a packet to an endpoint.
+        send(data) -> None: Sends a packet to the connected endpoint.
+        send_queue(data, IP="", port=-1) -> None: Sends several packets.
+        recieve_all(count="continual", buffer_size=1472, threaded=False) -> None: Handles packets from any sender.
+        recieve_from(IP=None, port=None, count="continual", buffer_size=1472, threaded=False) -> None: Handles packets from one sender.
+        recieve_all_into(count="continual", buffer_size=1472, pool_size=32, threaded=False) -> None /
+        recieve_from_into(IP=None, port=None, count="continual", buffer_size=1472, pool_size=32, threaded=False) -> None:
+            Zero-copy variants; the handler gets a memoryview into the ring (or, threaded, into a Buffer_Pool slot)
+            that is only valid until it returns.
+        settimeout(timeout) -> None: Sets `timeout`.
+    """
+
+    def __init__(self, IP: str, port: int, packet_handler: Callable | str="test", max_threads: int=10,
+                 queue_size: int | None=None, overflow_policy: str="block", stats: bool=False, ring_size: int=1 << 20,
+                 handler_pool: Handler_Pool | None=None, priority: str="telemetry"):
+        """
+        Creates this communicator's recieve ring.
+
+        Args:
+            IP (str): Endpoint IP address. Only used to name the ring and as the source address of sent packets.
+            port (int): Endpoint port. Must not be 0.
+            packet_handler (Callable): Function to handle received packets.
+            max_threads (int, optional): Maximum number of threads for handling packets. Defaults to 10.
+            queue_size (int | None, optional): Most packets that may wait for a handler thread. Defaults to None (unbounded).
+            overflow_policy (str, optional): Handler queue overflow policy, see Handler_Queue. Defaults to "block".
+            stats (bool, optional): Collect performance counters from the start. Defaults to False.
+            ring_size (int, optional): Recieve ring size in bytes. Defaults to 1 MiB.
+            handler_pool (Handler_Pool | None, optional): Shared handler pool, see Network_Communicator. Defaults to None.
+            priority (str, optional): Priority class in the shared handler pool. Defaults to "telemetry".
+
+        Raises:
+            Exception: If port is 0 or another live process already has this endpoint open.
+        """
+
+        if port == 0: raise Exception("Shared memory endpoints need an explicit port")
+
+        # set_socket (called by the base initializer) needs these
+        self.ring_size = ring_size
+        self.ring = None
+
+        self.peers = {}
+        self.send_drops = 0
+        self.timeout = None
+        self.buffer_pool = None
+        self._send_lock = threading.Lock()
+
+        super().__init__(IP=IP, port=port, packet_handler=packet_handler, protocol="shm", max_threads=max_threads,
+                         queue_size=queue_size, overflow_policy=overflow_policy, stats=stats, handler_pool=handler_pool,
+                         priority=priority)
+
+    def _resolve_comm_type(self) -> None:
+        """
+        Returns:
+            None: Shared memory endpoints have no socket type.
+        """
+
+        return None
+
+    def set_socket(self) -> SHM_Ring:
+        """
+        Creates this communicator's recieve ring.
+
+        Returns:
+            SHM_Ring: The ring. The base class keeps it as `socket`, so `close` and `open` work as for sockets.
+        """
+
+        self.ring = SHM_Ring.create(shm_endpoint_name(self.IP, self.port), self.ring_size)
+        self.socket = self.ring
+
+        self.bound = True
+        return self.ring
+
+    def _apply_traffic_class(self) -> None:
+        """
+        Does nothing: shared memory packets never reach a network queue to be prioritised in.
+        """
+
+    def settimeout(self, timeout: float | None) -> None:
+        """
+        Args:
+            timeout (float | None): Seconds a recieve waits for a packet before raising TimeoutError. None waits forever.
+        """
+
+        self.timeout = timeout
+
+    def connect_to(self, to_IP: str, to_port: int) -> None:
+        """
+        Sets the default destination for `send` and the only accepted source for `recieve_from`.
+
+        Args:
+            to_IP (str): Destination IP address.
+            to_port (int): Destination port number.
+        """
+
+        self.to_IP = to_IP
+        self.to_port = to_port
+        self.connected = True
+
+    def disconnect(self) -> None:
+        """
+        Clears the connection flag (the destination is remembered for `reconnect`).
+        """
+
+        self.connected = False
+
+    def reconnect(self) -> None:
+        """
+        Reconnects to the most recent destination after disconnect.
+        """
+
+        self.connected = True
+
+    def _peer(self, to_IP: str, to_port: int) -> SHM_Ring | None:
+        """
+        Args:
+            to_IP (str): Destination IP address.
+            to_port (int): Destination port number.
+
+        Returns:
+            SHM_Ring | None: The destination's ring, (re)attached if needed, or None if the endpoint isn't open.
+        """
+
+        key = (to_IP, to_port)
+        ring = self.peers.get(key)
+
+        if ring is not None and ring.closed:  # the receiver closed or restarted
+            ring.close()
+            del self.peers[key]
+            ring = None
+
+        if ring is None:
+            try: ring = self.peers[key] = SHM_Ring.attach(shm_endpoint_name(to_IP, to_port))
+            except FileNotFoundError: return None
+
+        return ring
+
+    def sendto(self, data: bytes | bytearray | memoryview, to_IP: str, to_port: int) -> None:
+        """
+        Sends a packet to an endpoint. Dropped (and counted in `send_drops`) if the endpoint isn't open or its ring is full.
+
+        Args:
+            data (bytes | bytearray | memoryview): The packet data to send.
+            to_IP (str): The target IP address.
+            to_port (int): The target port number.
+        """
+
+        with self._send_lock:
+            ring = self._peer(to_IP, to_port)
+
+            if ring is None or not ring.write(data, (self.IP, self.port)):
+                self.send_drops += 1
+                return
+
+        if self.stats is not None: self.stats.count_sent(1, len(data))
+
+    def send(self, data: bytes | bytearray | memoryview) -> None:
+        """
+        Sends a packet to the connected endpoint.
+
+        Args:
+            data (bytes | bytearray | memoryview): The packet data to send.
+
+        Raises:
+            Exception: If not connected with `connect_to`.
+        """
+
+        if not self.connected: raise Exception("Please connect with connect_to before using send")
+        self.sendto(data, self.to_IP, self.to_port)
+
+    def send_queue(self, data: list[bytes | bytearray], IP: str="", port: int=-1) -> None:
+        """
+        Sends several packets to the connected endpoint, or to IP and port if given.
+
+        Args:
+            data (list[bytes | bytearray]): The packets to send.
+            IP (str, optional): Destination IP address. Defaults to the connected endpoint.
+            port (int, optional): Destination port. Defaults to the connected endpoint.
+
+        Raises:
+            Exception: If no destination is given and not connected.
+        """
+
+        if IP == "" or port == -1:
+            if not self.connected: raise Exception("Please provide IP and port or connect with connect_to")
+            IP, port = self.to_IP, self.to_port
+
+        for packet in data: self.sendto(packet, IP, port)
+
+    def _next(self) -> tuple[memoryview, tuple]:
+        """
+        Waits for the next packet.
+
+        Returns:
+            tuple[memoryview, tuple]: (payload view into the ring, source address). Release the view, then call ring.advance().
+
+        Raises:
+            TimeoutError: If `timeout` passes first.
+            Exception: If the ring is closed.
+        """
+
+        while True:
+            record = self.ring.peek()
+            if record is not None: return record
+
+            if not self.ring.wait(self.timeout):
+                if self.ring.closed: raise Exception("Shared memory ring closed")
+                raise TimeoutError("timed out")
+
+    # Same pooled-slot handling as UDP_Communicator's recieve_*_into
+    _get_buffer_pool = UDP_Communicator._get_buffer_pool
+    _handle_pooled = UDP_Communicator._handle_pooled
+
+    def _recieve_loop(self, count: int | str, source: tuple | None, threaded: bool, pool: Buffer_Pool | None) -> None:
+        """
+        Shared body of the recieve methods.
+
+        Args:
+            count (int | str): Number of packets to handle, or "continual".
+            source (tuple | None): Only handle packets from this (IP, port), passing just the data. None handles
+                every packet, passing (data, address).
+            threaded (bool): Handle packets on handler threads.
+            pool (Buffer_Pool | None): Zero-copy mode. The handler gets a memoryview truncated to pool.slot_size,
+                into the ring when inline, or into a slot of the pool when threaded (the ring space is reused as
+                soon as the loop moves on). None hands the handler bytes.
+        """
+
+        handled = 0
+
+        while count == "continual" or handled < count:
+            view, address = self._next()
+            data = None
+
+            try:
+                if source is not None and address != source: continue
+
+                self.recieved_count += 1
+                handled += 1
+
+                if pool is None: data = bytes(view)
+                elif threaded:
+                    nbytes = min(len(view), pool.slot_size)
+                    slot = pool.acquire()
+                    pool.views[slot][:nbytes] = view[:nbytes]
+
+                    arguments = (pool.views[slot][:nbytes], address) if source is None else (pool.views[slot][:nbytes],)
+
+                    stats = self.stats
+                    if stats is not None:
+                        stats.count_recieved(1, nbytes)
+                        recieved_at = perf_counter()
+                    else: recieved_at = None
+
+                    observer = self.recieve_observer
+                    if observer is not None: observer(*arguments)
+
+                    # Bypasses the handler queue: a dropped packet would leak its slot, and pool_size bounds the backlog
+                    self.executor.submit(self._handle_pooled, pool, slot, recieved_at, *arguments)
+                    continue
+                else: data = view[:pool.slot_size]  # truncated like recv_into
+
+                if source is None: self._dispatch(threaded, 1, len(data), data, address, key=address)
+                else: self._dispatch(threaded, 1, len(data), data, key=address)
+            finally:
+                if isinstance(data, memoryview): data.release()
+                view.release()
+                self.ring.advance()
+
+    def recieve_all(self, count: int | str="continual", buffer_size: int=1472, threaded: bool=False) -> None:
+        """
+        Recieves packets from any sender\n
+        NOTE: Packet handler must be configured to accept a bytes 'data' AND a tuple 'address' argument
+
+        Args:
+            count (int | str, optional): How many packets should be handled before exiting. Default is "continual" for continuous recieving
+            buffer_size (int, optional): Accepted for compatibility with UDP_Communicator; packets are limited by ring_size instead
+            threaded (bool, optional): Threads will be spawned if true. Default is False
+
+        Raises:
+            Exception: If an error occurs while receiving data. The ring will be closed.
+        """
+
+        if count == "continual":
+            try: self._recieve_loop(count, None, threaded, None)
+            finally:
+                self.close()
+                raise Exception("Error thrown. Ring closed")
+
+        else: self._recieve_loop(count, None, threaded, None)
+
+    def recieve_from(self, IP: str=None, port: int=None, count: int | str="continual", buffer_size: int=1472, threaded: bool=False) -> None:
+        """
+        Recieves packets from a specified or connected endpoint, discarding packets from anyone else\n
+        NOTE: Packet handler must be configured to accept ONLY a bytes 'data' argument
+
+        Args:
+            IP (str, optional): Endpoint IP to accept packets from. Defaults to the connected endpoint if None
+            port (int, optional): Endpoint port to accept packets from. Defaults to the connected endpoint if None
+            count (int | str, optional): Number of packets to receive. Use "continual" to receive indefinitely. Is "continual" by default
+            buffer_size (int, optional): Accepted for compatibility with UDP_Communicator; packets are limited by ring_size instead
+            threaded (bool, optional): If True, each packet is handled in a separate thread. Defaults to False.
+
+        Raises:
+            Exception: If no endpoint is provided and was not connected using the 'connect_to' or 'reconnect' methods
+            Exception: If an error occurs during packet reception. The ring will be closed.
+        """
+
+        if IP is not None: self.connect_to(to_IP=IP, to_port=port)
+        elif not self.connected: raise Exception("Please provide IP and port")
+
+        source = (self.to_IP, self.to_port)
+
+        if count == "continual":
+            try: self._recieve_loop(count, source, threaded, None)
+            finally:
+                self.close()
+                raise Exception("Error thrown. Ring closed")
+
+        else: self._recieve_loop(count, source, threaded, None)
+
+    def recieve_all_into(self, count: int | str="continual", buffer_size: int=1472, pool_size: int=32, threaded: bool=False) -> None:
+        """
+        Recieves packets from any sender without copying them out of the ring\n
+        NOTE: Packet handler must be configured to accept a memoryview 'data' AND a tuple 'address' argument\n
+        NOTE: data is only valid until the handler returns. Copy it (bytes(data)) to keep it
+
+        Args:
+            count (int | str, optional): How many packets should be handled before exiting. Default is "continual" for continuous recieving
+            buffer_size (int, optional): The largest packet (in bytes) handed to the handler; longer ones are truncated. Default is 1472
+            pool_size (int, optional): Number of preallocated slots for threaded handling. Default is 32
+            threaded (bool, optional): Each packet is copied into a pool slot and handled on a handler thread if true.
+                Recieving blocks while all slots are in use. Default is False
+
+        Raises:
+            Exception: If an error occurs while receiving data. The ring will be closed.
+        """
+
+        pool = self._get_buffer_pool(buffer_size, pool_size)
+
+        if count == "continual":
+            try: self._recieve_loop(count, None, threaded, pool)
+            finally:
+                self.close()
+                raise Exception("Error thrown. Ring closed")
+
+        else: self._recieve_loop(count, None, threaded, pool)
+
+    def recieve_from_into(self, IP: str=None, port: int=None, count: int | str="continual", buffer_size: int=1472, pool_size: int=32, threaded: bool=False) -> None:
+        """
+        Recieves packets from a specified or connected endpoint without copying them out of the ring\n
+        NOTE: Packet handler must be configured to accept ONLY a memoryview 'data' argument\n
+        NOTE: data is only valid until the handler returns. Copy it (bytes(data)) to keep it
+
+        Args:
+            IP (str, optional): Endpoint IP to accept packets from. Defaults to the connected endpoint if None
+            port (int, optional): Endpoint port to accept packets from. Defaults to the connected endpoint if None
+            count (int | str, optional): Number of packets to receive. Use "continual" to receive indefinitely. Is "continual" by default
+            buffer_size (int, optional): Maximum size of each packet in bytes; longer ones are truncated. Defaults to 1472.
+            pool_size (int, optional): Number of preallocated slots for threaded handling. Defaults to 32.
+            threaded (bool, optional): If True, each packet is copied into a pool slot and handled in a separate thread. Defaults to False.
+
+        Raises:
+            Exception: If no endpoint is provided and was not connected
+            Exception: If an error occurs during packet reception. The ring will be closed.
+        """
+
+        if IP is not None: self.connect_to(to_IP=IP, to_port=port)
+        elif not self.connected: raise Exception("Please provide IP and port")
+
+        source = (self.to_IP, self.to_port)
+        pool = self._get_buffer_pool(buffer_size, pool_size)
+
+        if count == "continual":
+            try: self._recieve_loop(count, source, threaded, pool)
+            finally:
+                self.close()
+                raise Exception("Error thrown. Ring closed")
+
+        else: self._recieve_loop(count, source, threaded, pool)
+
+    def close(self) -> None:
+        """
+        Lets go of the peers' rings, and closes and unlinks this communicator's own ring.
+        """
+
+        with self._send_lock:
+            for ring in self.peers.values(): ring.close()
+            self.peers.clear()
+
+        super().close()
@@ -0,0 +1,91 @@
+# SLVROV Oct 2026
+
+from slvrov_tools.network_tools import UDP_Communicator
+from slvrov_tools.fec_tools import FEC_Layer
+
+
+class Scripted_Drops:
+    """Stands in for FEC_Layer._random so the drop injection discards exactly the chosen packets, in send order."""
+
+    def __init__(self, dropped: set[int]):
+        self.dropped = dropped
+        self.sent = 0
+
+    def random(self) -> float:
+        drop = self.sent in self.dropped
+        self.sent += 1
+        return 0.0 if drop else 1.0
+
+
+def make_pair(port: int, dropped: set[int], k: int=4, max_groups: int=16):
+    delivered = []
+
+    receiver = FEC_Layer(UDP_Communicator("127.0.0.1", port), lambda data, address: delivered.append(data), k=k,
+                         max_groups=max_groups)
+    receiver.communicator.socket.settimeout(2)
+
+    sender = FEC_Layer(UDP_Communicator("127.0.0.1", port + 1), lambda data, address: None, k=k, drop_probability=0.5)
+    sender._random = Scripted_Drops(dropped)
+
+    return sender, receiver, delivered
+
+
+def close_pair(sender: FEC_Layer, receiver: FEC_Layer) -> None:
+    sender.communicator.close()
+    receiver.communicator.close()
+
+
+def test_single_loss_is_recovered_and_double_loss_is_not():
+    # Each group of 4 goes out as d0 d1 d2 d3 parity: drop d1 of the first group and d0, d2 of the second
+    sender, receiver, delivered = make_pair(46500, {1, 5, 7}, max_groups=1)
+    payloads = [bytes([number]) * 10 for number in range(12)]
+
+    for payload in payloads: sender.sendto(payload, "127.0.0.1", 46500)
+    receiver.communicator.recieve_all(count=15 - 3)
+    close_pair(sender, receiver)
+
+    assert sorted(delivered) == sorted(payloads[:4] + payloads[5:6] + payloads[7:])
+    assert sender.snapshot()["injected_drops"] == 3
+    assert sender.snapshot()["parity_sent"] == 3
+
+    # The third group pushed the second out of max_groups, which is when its losses are counted
+    stats = receiver.snapshot()
+    assert stats["recovered"] == 1
+    assert stats["unrecoverable"] == 2
+    assert stats["delivered"] == 10
+
+
+def test_odd_length_payloads_are_rebuilt_exactly():
+    # Leading and trailing zero bytes must survive the trip through a Python integer
+    payloads = [b"\x00a", b"bcd\x00\x00", b"\x00", b"efghijk"]
+
+    for lost in range(4):
+        sender, receiver, delivered = make_pair(46502 + 2 * lost, {lost})
+
+        for payload in payloads: sender.sendto(payload, "127.0.0.1", 46502 + 2 * lost)
+        receiver.communicator.recieve_all(count=4)
+        close_pair(sender, receiver)
+
+        assert delivered[-1] == payloads[lost]
+        assert sorted(delivered) == sorted(payloads)
+        assert receiver.snapshot()["recovered"] == 1
+
+
+def test_flush_protects_a_partial_group():
+    sender, receiver, delivered = make_pair(46510, {2})
+    payloads = [b"first", b"second", b"third"]
+
+    for payload in payloads: sender.sendto(payload, "127.0.0.1", 46510)
+    sender.flush("127.0.0.1", 46510)
+    sender.flush("127.0.0.1", 46510)  # empty group, sends nothing
+    receiver.communicator.recieve_all(count=3)
+    close_pair(sender, receiver)
+
+    assert delivered == payloads
+    assert sender.snapshot()["parity_sent"] == 1
+    assert receiver.snapshot()["recovered"] == 1
+
+    # Everything was delivered, so the group no longer holds on to the payloads
+    (groups,) = receiver.groups.values()
+    (group,) = groups.values()
+    assert group.payloads == {}
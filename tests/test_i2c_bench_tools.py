@@ -0,0 +1,27 @@
+# SLVROV Oct 2026
+
+from slvrov_tools.i2c_bench_tools import run_pca9685_bench
+
+
+def test_batched_and_shadowed_refreshes_use_less_bus():
+    results = {result["key"]: result for result in run_pca9685_bench(refreshes=100)}
+
+    per_pin = results["write_duty_cycle"]
+    batched = results["write_duty_cycles"]
+    shadowed = results["write_duty_cycles_shadowed"]
+
+    # One block write per refresh instead of two register writes per pin
+    assert per_pin["transactions_per_refresh"] == 32
+    assert batched["transactions_per_refresh"] == 1
+    assert batched["bus_us_per_refresh"] < per_pin["bus_us_per_refresh"]
+
+    # The shadow only writes the span of channels that changed
+    assert shadowed["transactions_per_refresh"] <= batched["transactions_per_refresh"]
+    assert shadowed["bytes_per_refresh"] < batched["bytes_per_refresh"]
+
+
+def test_steady_channels_cost_nothing_with_the_shadow():
+    results = {result["key"]: result for result in run_pca9685_bench(refreshes=10, changed=0)}
+
+    assert results["write_duty_cycles_shadowed"]["transactions_per_refresh"] == 0
+    assert results["write_duty_cycles"]["transactions_per_refresh"] == 1
@@ -0,0 +1,68 @@
+# SLVROV Oct 2026
+
+import threading
+
+from slvrov_tools.i2c_tools import I2C_Bus
+from slvrov_tools.pca9685 import MODE1_REG, PRESCALE_REG
+from slvrov_tools.i2c_sim_tools import Simulated_I2C_Backend, Simulated_PCA9685
+
+
+class Gated_PCA9685(Simulated_PCA9685):
+    """Simulated PCA9685 whose first read waits for `gate`, holding the bus so later transactions queue up."""
+
+    def __init__(self):
+        super().__init__()
+        self.reading = threading.Event()
+        self.gate = threading.Event()
+
+    def read(self, length: int) -> bytes:
+        self.reading.set()
+        self.gate.wait(5)
+        return super().read(length)
+
+
+def make_worker():
+    device = Gated_PCA9685()
+    backend = Simulated_I2C_Backend({0x40: device}, realtime=False)
+    bus = I2C_Bus(1, target_address=0x40, backend=backend)
+    worker = bus.start_worker()
+
+    # Occupy the bus with a read, so everything queued next waits in the queue together until the gate opens
+    blocker = worker.read_byte_from(MODE1_REG, priority="control")
+    assert device.reading.wait(5)
+
+    return device, backend, bus, worker, blocker
+
+
+def test_merge_does_not_jump_ahead_of_later_writes():
+    device, backend, bus, worker, blocker = make_worker()
+
+    futures = [
+        blocker,
+        worker.write_byte_to(MODE1_REG, 0x31),  # sleep
+        worker.write_byte_to(PRESCALE_REG, 0x65),
+        worker.write_byte_to(MODE1_REG, 0x21),  # wake
+    ]
+    device.gate.set()
+
+    for future in futures: future.result(timeout=5)
+    bus.close()
+
+    assert [transaction.messages[0][2].hex() for transaction in backend.log] == ["00", "0031", "fe65", "0021"]
+    assert device.registers[PRESCALE_REG] == 0x65
+    assert worker.merged_writes == 0
+
+
+def test_back_to_back_writes_still_merge():
+    device, backend, bus, worker, blocker = make_worker()
+
+    futures = [blocker]
+    futures += [worker.write_block_to(0x06, bytes((value, 0, 0, 0))) for value in range(5)]
+    futures.append(worker.write_byte_to(MODE1_REG, 0x21))
+    device.gate.set()
+
+    for future in futures: future.result(timeout=5)
+    bus.close()
+
+    assert [transaction.messages[0][2].hex() for transaction in backend.log] == ["00", "0604000000", "0021"]
+    assert worker.merged_writes == 4
@@ -0,0 +1,91 @@
+# SLVROV Oct 2026
+
+import socket
+
+from slvrov_tools.link_tools import LINK_DATA, Link_Layer, link_header
+from slvrov_tools.network_tools import UDP_Communicator
+
+
+def make_receiver(port: int, **options):
+    delivered = []
+    link = Link_Layer(UDP_Communicator("127.0.0.1", port), lambda data, address: delivered.append(bytes(data)), **options)
+    link.communicator.socket.settimeout(5)
+
+    return link, delivered
+
+
+def send_raw(port: int, sequences: list[int]):
+    """Sends data packets with hand-picked sequence numbers, to reorder and duplicate them on purpose."""
+
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    for sequence in sequences: sender.sendto(link_header.pack(LINK_DATA, 0, sequence, 0) + sequence.to_bytes(4, "big"), ("127.0.0.1", port))
+    sender.close()
+
+
+def only_stream(link: Link_Layer) -> dict:
+    (stream,) = link.snapshot()["streams"].values()
+    return stream
+
+
+def test_injected_drops_are_counted_as_loss():
+    receiver, delivered = make_receiver(46300)
+    sender = Link_Layer(UDP_Communicator("127.0.0.1", 46301), lambda *arguments: None, drop_probability=0.3, seed=1)
+
+    for number in range(200): sender.sendto(number.to_bytes(4, "big"), "127.0.0.1", 46300)
+    receiver.communicator.recieve_all(count=200 - sender.injected_drops)
+
+    numbers = [int.from_bytes(data, "big") for data in delivered]
+    stream = only_stream(receiver)
+
+    assert sender.injected_drops > 0
+    assert numbers == sorted(numbers)
+    assert stream["recieved"] == len(numbers) == 200 - sender.injected_drops
+    # Only gaps between the first and last delivered packets can be seen as lost
+    assert stream["lost"] == numbers[-1] - numbers[0] + 1 - len(numbers) > 0
+
+    sender.communicator.close()
+    receiver.communicator.close()
+
+
+def test_late_and_duplicate_packets_are_dropped_as_stale():
+    receiver, delivered = make_receiver(46302)
+
+    send_raw(46302, [0, 1, 3, 2, 2, 4])
+    receiver.communicator.recieve_all(count=6)
+
+    stream = only_stream(receiver)
+
+    assert [int.from_bytes(data, "big") for data in delivered] == [0, 1, 3, 4]
+    assert (stream["reordered"], stream["duplicates"], stream["lost"]) == (1, 1, 0)
+    assert receiver.stale_count == 2
+
+    receiver.communicator.close()
+
+
+def test_late_packets_are_delivered_without_drop_stale():
+    receiver, delivered = make_receiver(46303, drop_stale=False)
+
+    send_raw(46303, [0, 2, 1, 1])
+    receiver.communicator.recieve_all(count=4)
+
+    assert [int.from_bytes(data, "big") for data in delivered] == [0, 2, 1]
+    assert receiver.stale_count == 1  # the duplicate
+
+    receiver.communicator.close()
+
+
+def test_sender_restart_resyncs_the_tracker():
+    receiver, delivered = make_receiver(46304)
+
+    # A sender at 1000 restarts from 0: the first resync_after - 1 packets are too old, then the tracker starts over
+    send_raw(46304, list(range(1000, 1010)) + list(range(10)))
+    receiver.communicator.recieve_all(count=20)
+
+    stream = only_stream(receiver)
+
+    assert stream["resyncs"] == 1
+    assert stream["too_old"] == 7
+    assert [int.from_bytes(data, "big") for data in delivered] == list(range(1000, 1010)) + [7, 8, 9]
+    assert stream["highest"] == 9
+
+    receiver.communicator.close()